@@ -0,0 +1,115 @@
+"""
+Benchmark for reconciling the cache with the data of a new connection after a reconnect
+
+Generates the HOUSE_JOIN data of large houses and a second version of it like it would be sent after a
+reconnect: A few members changed their name, left or joined and a room was renamed, one deleted and one
+created. Compares:
+
+- rebuild (old): A new House object is created and replaces the cached one. Every member, room and category
+                 object is new => References held by the user are stale and nothing reports the changes
+- reconcile: The cached house is patched in-place with `House._reconcile()`. Unchanged objects are not
+             touched, changed ones keep their identity and the differences are returned for the events
+
+Usage: python benchmarks/cache_reconcile.py [houses] [members-per-house] [changed-percent] [rounds]
+"""
+import copy
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+from openhivenpy import types  # noqa: E402
+
+
+def user(i: int) -> dict:
+    return {'id': str(100000000000000000 + i), 'username': f'user{i}', 'name': f'User {i}', 'user_flags': '0',
+            'icon': f'icons/{i}.png', 'header': None, 'presence': 'online', 'bot': False}
+
+
+def house(h: int, members: int) -> dict:
+    house_id = str(200000000000000000 + h)
+    return {
+        'id': house_id, 'name': f'House {h}', 'owner_id': user(0)['id'], 'icon': None, 'banner': None,
+        'default_permissions': 0, 'roles': [],
+        'entities': [{'id': str(300000000000000000 + h * 10 + e), 'name': f'Category {e}', 'type': 1,
+                      'position': e, 'resource_pointers': []} for e in range(5)],
+        'rooms': [{'id': str(400000000000000000 + h * 100 + r), 'name': f'room-{r}', 'house_id': house_id,
+                   'type': 0, 'position': r, 'last_message_id': None, 'emoji': None, 'description': None}
+                  for r in range(20)],
+        'members': [{'user_id': user(m)['id'], 'user': user(m), 'house_id': house_id, 'roles': [],
+                     'joined_at': '2020-10-01T12:00:00.000Z'} for m in range(members)]
+    }
+
+
+def changed_house(data: dict, percent: float) -> dict:
+    """ The data of the house after the client missed some events """
+    data = copy.deepcopy(data)
+    members = data['members']
+    step = max(int(100 / percent), 1) if percent > 0 else len(members) + 1
+    for member in members[1::step]:
+        member['user']['name'] += ' (renamed)'
+    # Members that left and joined
+    left = members[2::step]
+    data['members'] = [m for m in members if m not in left]
+    data['members'] += [{'user_id': user(m)['id'], 'user': user(m), 'house_id': data['id'], 'roles': [],
+                         'joined_at': '2020-10-02T12:00:00.000Z'} for m in range(10 ** 6, 10 ** 6 + len(left))]
+    data['rooms'][0]['name'] = 'renamed-room'
+    data['rooms'].pop()
+    data['rooms'].append(dict(data['rooms'][1], id=str(int(data['rooms'][1]['id']) + 50), name='new-room'))
+    return data
+
+
+def measure(houses: list, new_data: list, rebuild: bool) -> tuple:
+    start = time.perf_counter()
+    results = []
+    for cached, data in zip(houses, new_data):
+        if rebuild:
+            results.append(types.House(data, None, 0))
+        else:
+            results.append(cached._reconcile(data))
+    return time.perf_counter() - start, results
+
+
+def main():
+    houses = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    members = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    percent = float(sys.argv[3]) if len(sys.argv) > 3 else 1
+    rounds = int(sys.argv[4]) if len(sys.argv) > 4 else 5
+
+    old_data = [house(h, members) for h in range(houses)]
+    new_data = [changed_house(data, percent) for data in old_data]
+
+    print(f"Python {sys.version.split()[0]} - {houses} houses with {members} members - "
+          f"{percent}% of the members changed, left and joined - {rounds} rounds\n")
+    print(f"{'':<12}{'ms':>10}{'kept objects':>16}{'changes reported':>20}")
+
+    timings = []
+    for _ in range(rounds):
+        cached = [types.House(data, None, 0) for data in old_data]
+        elapsed, rebuilt = measure(cached, new_data, rebuild=True)
+        timings.append(elapsed)
+    kept = sum(1 for old, new in zip(cached, rebuilt) for m in old.members if new.members.get(m.id) is m)
+    print(f"{'rebuild':<12}{min(timings) * 1000:>10.1f}{kept:>16}{0:>20}")
+
+    timings = []
+    for _ in range(rounds):
+        cached = [types.House(data, None, 0) for data in old_data]
+        references = [list(h.members) for h in cached]
+        elapsed, changes = measure(cached, new_data, rebuild=False)
+        timings.append(elapsed)
+    kept = sum(1 for h, refs in zip(cached, references) for m in refs if h.members.get(m.id) is m)
+    reported = sum(len(part) for c in changes for name in ('members', 'rooms', 'categories') for part in c[name])
+    print(f"{'reconcile':<12}{min(timings) * 1000:>10.1f}{kept:>16}{reported:>20}")
+
+    members_changes = changes[0]['members']
+    rooms_changes = changes[0]['rooms']
+    print(f"\nfirst house: members +{len(members_changes[0])} ~{len(members_changes[1])} "
+          f"-{len(members_changes[2])}, rooms +{len(rooms_changes[0])} ~{len(rooms_changes[1])} "
+          f"-{len(rooms_changes[2])}")
+    old, new = members_changes[1][0]
+    print(f"changed member: {old.name!r} -> {new.name!r}, same object as before: "
+          f"{references[0][1] is new}")
+
+
+if __name__ == '__main__':
+    main()
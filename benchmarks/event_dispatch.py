@@ -0,0 +1,102 @@
+"""
+Benchmark for the routing of Swarm events
+
+Compares the per-frame overhead of the dispatch table in `Websocket._event_resp_handler` with the
+previous if/elif chain, which compared the event name against every event until it found a match
+and defined a new closure for the handler on every frame. The chain is rebuilt from the registered
+events in their original order, so the later events like RELATIONSHIP_UPDATE have to pass all the
+comparisons before them.
+
+The handlers are replaced with a no-op coroutine to only measure the routing.
+
+Usage: python benchmarks/event_dispatch.py [frames]
+"""
+import asyncio
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+from openhivenpy.events import EventHandler  # noqa: E402
+from openhivenpy.gateway import Connection  # noqa: E402
+from openhivenpy.gateway.ws import _swarm_event_handlers, logger  # noqa: E402
+
+
+async def noop(client, data):
+    pass
+
+
+def build_chain(events: list):
+    """ Builds a handler in the style of the previous if/elif chain for the passed events """
+    lines = ["async def chain(self, resp_data):",
+             "    response_data = resp_data.get('d', {})",
+             "    swarm_event = resp_data.get('e', '')",
+             "    logger.debug(f'Received Event {swarm_event}')"]
+    for i, event in enumerate(events):
+        lines += [f"    {'if' if i == 0 else 'elif'} swarm_event == {event!r}:",
+                  "        if self._ready:",
+                  "            async def handler():",
+                  "                await noop(self, response_data)",
+                  "            asyncio.create_task(handler())"]
+    lines += ["    else:",
+              "        logger.error(f'[WEBSOCKET] << Unknown Event {swarm_event} without Handler!')"]
+    namespace = {'asyncio': asyncio, 'noop': noop, 'logger': logger}
+    exec('\n'.join(lines), namespace)
+    return namespace['chain']
+
+
+async def run(handler, client, frame: dict, frames: int) -> float:
+    """ Returns the average nanoseconds per frame including the execution of the created tasks """
+    start = time.perf_counter_ns()
+    for _ in range(frames):
+        await handler(client, frame)
+    # Letting the created tasks finish
+    await asyncio.sleep(0)
+    return (time.perf_counter_ns() - start) / frames
+
+
+async def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    events = list(_swarm_event_handlers.keys())
+
+    client = Connection(token='x' * 128, event_handler=EventHandler(None))
+    client._initialized = client._ready = True
+    for event in events:
+        client.add_swarm_handler(event, noop)
+
+    chain = build_chain(events)
+    table = type(client)._event_resp_handler
+
+    print(f"Python {sys.version.split()[0]} - {frames} frames per event - ns per frame\n")
+    print(f"{'event':<28}{'position':>9}{'if/elif':>12}{'dispatch':>12}")
+    for event in (events[1], events[len(events) // 2], events[-1], 'UNKNOWN_EVENT'):
+        frame = {'op': 0, 'e': event, 'd': {}}
+        # Warm-up
+        await run(chain, client, frame, 1000)
+        await run(table, client, frame, 1000)
+
+        old = await run(chain, client, frame, frames)
+        new = await run(table, client, frame, frames)
+        position = events.index(event) + 1 if event in events else len(events) + 1
+        print(f"{event:<28}{position:>9}{old:>12.0f}{new:>12.0f}")
+
+    # Routing only => Without creating the tasks
+    print("\nLookup only (without creating the task):")
+    for event in (events[1], events[-1]):
+        start = time.perf_counter_ns()
+        for _ in range(frames):
+            for e in events:
+                if e == event:
+                    break
+        old = (time.perf_counter_ns() - start) / frames
+
+        handlers = client._swarm_handlers
+        start = time.perf_counter_ns()
+        for _ in range(frames):
+            handlers.get(event)
+        new = (time.perf_counter_ns() - start) / frames
+        print(f"{event:<28}{'':>9}{old:>12.0f}{new:>12.0f}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,180 @@
+"""
+Benchmark for the zlib-stream compression of the Swarm frames
+
+Generates the INIT_STATE and HOUSE_JOIN frames of a large account (repetitive JSON with members, roles and
+rooms) and a series of small MESSAGE_CREATE frames and compares the uncompressed text frames with:
+
+- zlib per frame: Every frame compressed on its own
+- zlib-stream: All frames compressed with one zlib stream for the whole connection, like with
+               `compression='zlib_stream'`. Repeating keys and ids of earlier frames are not sent again.
+
+Prints the bytes on the wire, the decode time of the client (inflating + JSON decoding) and the estimated
+time until the frames were received and decoded at a few bandwidths. Finally the frames are sent over a local
+websocket split into messages of 16 KiB and received with `ZlibStreamDecoder`.
+
+Usage: python benchmarks/gateway_compression.py [houses] [members-per-house] [messages]
+"""
+import asyncio
+import sys
+import time
+import zlib
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy.gateway import codec  # noqa: E402
+from openhivenpy.gateway.compression import ZlibStreamDecoder  # noqa: E402
+
+BANDWIDTHS = (('10 Mbit/s', 10e6 / 8), ('100 Mbit/s', 100e6 / 8), ('1 Gbit/s', 1e9 / 8))
+MESSAGE_SIZE = 16 * 1024
+
+
+def user(i: int) -> dict:
+    return {'id': str(100000000000000000 + i), 'username': f'user{i}', 'name': f'User {i}', 'user_flags': '0',
+            'icon': f'icons/{i}.png', 'header': None, 'presence': 'online', 'bot': False, 'bio': None}
+
+
+def house(h: int, members: int) -> dict:
+    house_id = str(200000000000000000 + h)
+    return {
+        'id': house_id, 'name': f'House {h}', 'owner_id': user(0)['id'], 'icon': None, 'banner': None,
+        'default_permissions': 0,
+        'entities': [{'id': str(300000000000000000 + h * 10 + e), 'name': f'Category {e}', 'type': 1,
+                      'position': e, 'resource_pointers': []} for e in range(5)],
+        'rooms': [{'id': str(400000000000000000 + h * 100 + r), 'name': f'room-{r}', 'house_id': house_id,
+                   'type': 0, 'position': r, 'last_message_id': None, 'emoji': None, 'description': None,
+                   'permission_overrides': None} for r in range(20)],
+        'roles': [{'id': str(500000000000000000 + h * 10 + r), 'name': f'Role {r}', 'level': r, 'color': '#ffffff',
+                   'allow': 0, 'deny': 0} for r in range(5)],
+        'members': [{'user_id': user(m)['id'], 'user': user(m), 'house_id': house_id, 'roles': [],
+                     'last_permission_update': None, 'joined_at': '2020-10-01T12:00:00.000Z'}
+                    for m in range(members)]
+    }
+
+
+def create_frames(houses: int, members: int) -> list:
+    init_state = {'op': 0, 'e': 'INIT_STATE', 'd': {
+        'user': user(0), 'settings': {'user_id': user(0)['id']}, 'relationships': {}, 'read_state': {},
+        'private_rooms': [], 'presences': {}, 'house_memberships': {},
+        'house_ids': [str(200000000000000000 + h) for h in range(houses)]}}
+    frames = [init_state] + [{'op': 0, 'e': 'HOUSE_JOIN', 'd': house(h, members)} for h in range(houses)]
+    return [codec.dumps(frame) for frame in frames]
+
+
+def create_message_frames(amount: int) -> list:
+    frames = []
+    for i in range(amount):
+        author = user(i % 50)
+        frames.append({'op': 0, 'e': 'MESSAGE_CREATE', 'd': {
+            'id': str(600000000000000000 + i), 'author_id': author['id'], 'author': author,
+            'room_id': str(400000000000000000 + i % 20), 'house_id': str(200000000000000000), 'content': f'hi {i}',
+            'timestamp': 1600000000000 + i, 'mentions': [], 'type': 0, 'exploding': False, 'device_id': None}})
+    return [codec.dumps(frame) for frame in frames]
+
+
+def compress_per_frame(frames: list) -> list:
+    return [zlib.compress(frame.encode('utf-8')) for frame in frames]
+
+
+def compress_stream(frames: list) -> list:
+    compressor = zlib.compressobj()
+    return [compressor.compress(frame.encode('utf-8')) + compressor.flush(zlib.Z_SYNC_FLUSH) for frame in frames]
+
+
+def decode_text(frames: list) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        codec.loads(frame)
+    return time.perf_counter() - start
+
+
+def decode_per_frame(frames: list) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        codec.loads(zlib.decompress(frame))
+    return time.perf_counter() - start
+
+
+def decode_stream(frames: list) -> float:
+    decoder = ZlibStreamDecoder()
+    start = time.perf_counter()
+    for frame in frames:
+        codec.loads(decoder.feed(frame))
+    return time.perf_counter() - start
+
+
+async def websocket_roundtrip(frames: list) -> tuple:
+    """ Sends the zlib-stream frames split into messages over a local websocket and decodes them """
+    async def handler(request):
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        for frame in frames:
+            for i in range(0, len(frame), MESSAGE_SIZE):
+                await ws.send_bytes(frame[i:i + MESSAGE_SIZE])
+        await ws.close()
+        return ws
+
+    app = web.Application()
+    app.router.add_get('/socket', handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    decoded = []
+    decoder = ZlibStreamDecoder()
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(f"http://127.0.0.1:{port}/socket", max_msg_size=0) as ws:
+                async for msg in ws:
+                    if msg.type == aiohttp.WSMsgType.BINARY:
+                        data = decoder.feed(msg.data)
+                        if data is not None:
+                            decoded.append(codec.loads(data))
+    finally:
+        await runner.cleanup()
+    return decoded, decoder.stats
+
+
+def compare(title: str, text: list) -> list:
+    """ Prints the comparison of the transports and returns the zlib-stream frames """
+    per_frame = compress_per_frame(text)
+    stream = compress_stream(text)
+    transports = [
+        ('text_json', [frame.encode('utf-8') for frame in text], lambda: decode_text(text)),
+        ('zlib per frame', per_frame, lambda: decode_per_frame(per_frame)),
+        ('zlib-stream', stream, lambda: decode_stream(stream))
+    ]
+
+    print(f"{title:<16}{'KiB':>10}{'decode ms':>11}" + ''.join(f"{name + ' ms':>16}" for name, _ in BANDWIDTHS))
+    for name, frames, decode in transports:
+        size = sum(len(frame) for frame in frames)
+        decode_time = min(decode() for _ in range(5))
+        line = f"{name:<16}{size / 1024:>10.0f}{decode_time * 1000:>11.1f}"
+        line += ''.join(f"{(size / bandwidth + decode_time) * 1000:>16.0f}" for _, bandwidth in BANDWIDTHS)
+        print(line)
+    return stream
+
+
+def main():
+    houses = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    members = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    messages = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+
+    print(f"Python {sys.version.split()[0]} - JSON backend {codec.backend()} - INIT_STATE and {houses} "
+          f"HOUSE_JOIN frames with {members} members - {messages} MESSAGE_CREATE frames\n")
+    text = create_frames(houses, members)
+    stream = compare('startup', text)
+    print()
+    compare('messages', create_message_frames(messages))
+
+    decoded, stats = asyncio.run(websocket_roundtrip(stream))
+    print(f"\nwebsocket: {stats['messages']} messages -> {stats['frames']} frames, "
+          f"ratio {stats['ratio']:.1f}, identical: {decoded == [codec.loads(frame) for frame in text]}")
+
+
+if __name__ == '__main__':
+    main()
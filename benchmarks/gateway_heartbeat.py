@@ -0,0 +1,171 @@
+"""
+Benchmark for the latency tracking of the life signals and the detection of dead connections
+
+Starts a local aiohttp stub of the API and the Swarm that delays every pong by a random latency. The client
+sends its life signals in a short interval and the stub then stops responding without closing the
+connection, like a connection that died on the way without TCP noticing it. Measures:
+
+- The latency percentiles the client measured compared to the delays of the stub
+- The time until the dead connection was detected and a new one was ready with `heartbeat_timeout`
+- The same without acknowledgements (old): The client only notices the dead connection if TCP times out,
+  which on loopback never happens => The time is capped at the timeout of the benchmark
+
+Usage: python benchmarks/gateway_heartbeat.py [heartbeat-ms] [heartbeat-timeout-s] [beats]
+"""
+import asyncio
+import random
+import sys
+import time
+
+from aiohttp import web, WSMsgType
+
+sys.path.insert(0, '.')
+
+from openhivenpy.events import EventHandler  # noqa: E402
+from openhivenpy.gateway import Connection, codec  # noqa: E402
+from openhivenpy.gateway import http as http_module  # noqa: E402
+
+USER = {'id': '100000000000000000', 'username': 'stub', 'name': 'Stub', 'user_flags': '0', 'icon': None,
+        'header': None, 'presence': 'online', 'bot': False}
+HOUSE_ID = '200000000000000000'
+INIT_STATE = {'user': USER, 'settings': {}, 'presences': {},
+              'relationships': {USER['id']: {'user_id': USER['id'], 'user': USER, 'type': 3}},
+              'private_rooms': [{'id': '900', 'type': 1, 'last_message_id': None, 'recipients': [USER]}],
+              'house_memberships': {HOUSE_ID: {'user_id': USER['id'], 'user': USER, 'house_id': HOUSE_ID,
+                                               'roles': []}},
+              'house_ids': [HOUSE_ID]}
+HOUSE = {'id': HOUSE_ID, 'name': 'House', 'owner_id': USER['id'], 'icon': None, 'banner': None, 'roles': [],
+         'default_permissions': 0, 'entities': [], 'rooms': [],
+         'members': [{'user_id': USER['id'], 'user': USER, 'house_id': HOUSE_ID, 'roles': []}]}
+
+
+class Swarm:
+    """ Stub of the API and the Swarm that answers the pings after a random delay """
+    def __init__(self):
+        self.delays = []
+        self.sockets = []
+        self.frozen = set()
+
+    async def me(self, request):
+        return web.json_response({'success': True, 'data': USER})
+
+    async def socket(self, request):
+        ws = web.WebSocketResponse(autoping=False)
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        await ws.send_str(codec.dumps({'op': 1, 'd': {'hbt_int': 30000}}))
+        async for msg in ws:
+            if ws in self.frozen:
+                # Dead connection => Nothing is answered anymore
+                continue
+            if msg.type == WSMsgType.PING:
+                delay = random.uniform(0.005, 0.030) if random.random() > 0.05 else random.uniform(0.1, 0.2)
+                self.delays.append(delay)
+                asyncio.get_event_loop().call_later(delay, asyncio.ensure_future, ws.pong(msg.data))
+            elif msg.type == WSMsgType.TEXT and codec.loads(msg.data).get('op') == 2:
+                await ws.send_str(codec.dumps({'op': 0, 'e': 'INIT_STATE', 'd': INIT_STATE}))
+                await ws.send_str(codec.dumps({'op': 0, 'e': 'HOUSE_JOIN', 'd': HOUSE}))
+
+        while ws in self.frozen:
+            await asyncio.sleep(0.05)
+        return ws
+
+    def freeze(self) -> None:
+        self.frozen.update(self.sockets)
+        self.sockets = []
+
+
+class Handler(EventHandler):
+    def __init__(self):
+        super().__init__(self)
+        self.reconnected = asyncio.Event()
+
+    async def on_reconnect(self, time):
+        self.reconnected.set()
+
+
+async def start_client(heartbeat: int, heartbeat_timeout: float) -> tuple:
+    handler = Handler()
+    connection = Connection(token='x' * 128, event_handler=handler, heartbeat=heartbeat,
+                            heartbeat_timeout=heartbeat_timeout)
+    connection._WEBSOCKET_URL = http_module.request_url_format.format(None, 'socket')
+    task = asyncio.create_task(connection.connect(asyncio.get_event_loop()))
+    assert await connection.wait_until_ready(10)
+    return connection, handler, task
+
+
+async def stop_client(connection: Connection, task: asyncio.Task) -> None:
+    await connection.close()
+    task.cancel()
+    try:
+        await task
+    except BaseException:
+        pass
+
+
+def percentile(values: list, percentile: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * percentile / 100), len(values) - 1)]
+
+
+async def measure_detection(swarm: Swarm, heartbeat: int, heartbeat_timeout: float, limit: float) -> str:
+    connection, handler, task = await start_client(heartbeat, heartbeat_timeout)
+    try:
+        swarm.freeze()
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(handler.reconnected.wait(), limit)
+        except asyncio.TimeoutError:
+            return f"not detected after {limit:.0f} s (connection status {connection.connection_status})"
+        return (f"detected and reconnected after {(time.perf_counter() - start) * 1000:.0f} ms - "
+                f"missed {connection.latency_stats['missed']}")
+    finally:
+        swarm.frozen.clear()
+        await stop_client(connection, task)
+
+
+async def main():
+    heartbeat = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    heartbeat_timeout = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    beats = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+
+    swarm = Swarm()
+    app = web.Application()
+    app.router.add_get('/v1/users/@me', swarm.me)
+    app.router.add_get('/socket', swarm.socket)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    # The host of the API is not passed to the HTTP client => Pointing the url format to the stub
+    http_module.request_url_format = f"http://127.0.0.1:{port}/{{1}}"
+
+    print(f"Python {sys.version.split()[0]} - life signal every {heartbeat} ms - "
+          f"heartbeat_timeout {heartbeat_timeout} s - {beats} life signals\n")
+    try:
+        connection, handler, task = await start_client(heartbeat, heartbeat_timeout)
+        try:
+            while connection.latency_stats['acked'] < beats:
+                await asyncio.sleep(heartbeat / 1000)
+            stats = connection.latency_stats
+        finally:
+            await stop_client(connection, task)
+
+        delays = swarm.delays[:stats['acked']]
+        print(f"{'':<12}{'p50 ms':>10}{'p99 ms':>10}")
+        print(f"{'stub delay':<12}{percentile(delays, 50) * 1000:>10.1f}{percentile(delays, 99) * 1000:>10.1f}")
+        print(f"{'measured':<12}{stats['p50'] * 1000:>10.1f}{stats['p99'] * 1000:>10.1f}")
+        print(f"sent {stats['sent']} acked {stats['acked']} missed {stats['missed']}\n")
+
+        limit = max(heartbeat / 1000 + heartbeat_timeout, 1) * 5
+        print(f"dead connection with acknowledgements: "
+              f"{await measure_detection(swarm, heartbeat, heartbeat_timeout, limit)}")
+        print(f"dead connection without (old):         "
+              f"{await measure_detection(swarm, heartbeat, 3600, limit)}")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,267 @@
+"""
+Benchmark for reconnecting the websocket after the connection to the Swarm was lost
+
+Starts a local aiohttp stub of the API and the Swarm that adds a simulated round-trip time to every HTTP
+request and websocket handshake. The client is connected and the stub then drops the websocket. Measures the
+time until the client is usable again with:
+
+- restart (old): `reconnect=False` and `restart=True`. The connection is closed and the restart handler of the
+                 execution loop starts a new one => New HTTP session, new gateway session and the whole startup
+- reconnect: The default now. A new websocket is opened over the same session and the cache is kept
+
+Afterwards the Swarm stops responding without closing the connection and the client is forced to reconnect
+with `force_reconnect()` and the Swarm rejects the next handshakes to show the backoff of the attempts.
+
+Usage: python benchmarks/gateway_reconnect.py [houses] [members-per-house] [rtt-ms] [rounds]
+"""
+import asyncio
+import sys
+import time
+
+from aiohttp import web, WSMsgType
+
+sys.path.insert(0, '.')
+
+from openhivenpy.events import EventHandler  # noqa: E402
+from openhivenpy.gateway import Connection, codec  # noqa: E402
+from openhivenpy.gateway import http as http_module  # noqa: E402
+
+
+def user(i: int) -> dict:
+    return {'id': str(100000000000000000 + i), 'username': f'user{i}', 'name': f'User {i}', 'user_flags': '0',
+            'icon': f'icons/{i}.png', 'header': None, 'presence': 'online', 'bot': False}
+
+
+def member(i: int, house_id: str) -> dict:
+    return {'user_id': user(i)['id'], 'user': user(i), 'house_id': house_id, 'roles': [],
+            'last_permission_update': None, 'joined_at': '2020-10-01T12:00:00.000Z'}
+
+
+def house(h: int, members: int) -> dict:
+    house_id = str(200000000000000000 + h)
+    return {
+        'id': house_id, 'name': f'House {h}', 'owner_id': user(0)['id'], 'icon': None, 'banner': None,
+        'default_permissions': 0, 'roles': [],
+        'entities': [{'id': str(300000000000000000 + h), 'name': 'Rooms', 'type': 1, 'position': 0,
+                      'resource_pointers': []}],
+        'rooms': [{'id': str(400000000000000000 + h * 100 + r), 'name': f'room-{r}', 'house_id': house_id,
+                   'type': 0, 'position': r, 'last_message_id': None, 'emoji': None, 'description': None}
+                  for r in range(10)],
+        'members': [member(m, house_id) for m in range(members)]
+    }
+
+
+def init_state(houses: int) -> dict:
+    house_ids = [str(200000000000000000 + h) for h in range(houses)]
+    return {'user': user(0), 'settings': {}, 'presences': {},
+            'relationships': {user(1)['id']: {'user_id': user(1)['id'], 'user': user(1), 'type': 3}},
+            'private_rooms': [{'id': '900', 'type': 1, 'last_message_id': None, 'recipients': [user(1)]}],
+            'house_memberships': {house_id: member(0, house_id) for house_id in house_ids},
+            'house_ids': house_ids}
+
+
+class Swarm:
+    """ Stub of the API and the Swarm """
+    def __init__(self, houses: int, members: int, rtt: float):
+        self.rtt = rtt
+        self.frames = [codec.dumps({'op': 0, 'e': 'INIT_STATE', 'd': init_state(houses)})]
+        self.frames += [codec.dumps({'op': 0, 'e': 'HOUSE_JOIN', 'd': house(h, members)}) for h in range(houses)]
+        self.sockets = []
+        # Websockets that stopped answering without closing the connection
+        self.frozen = set()
+        self.rejected = 0
+        self.handshakes = []
+        self.http_requests = 0
+
+    async def me(self, request):
+        self.http_requests += 1
+        await asyncio.sleep(self.rtt)
+        return web.json_response({'success': True, 'data': user(0)})
+
+    async def socket(self, request):
+        self.handshakes.append(time.perf_counter())
+        # TCP and TLS handshake + websocket upgrade
+        await asyncio.sleep(self.rtt * 2)
+        if self.rejected > 0:
+            self.rejected -= 1
+            return web.Response(status=503)
+
+        ws = web.WebSocketResponse(max_msg_size=0, autoclose=False)
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        await ws.send_str(codec.dumps({'op': 1, 'd': {'hbt_int': 30000}}))
+        async for msg in ws:
+            if ws in self.frozen:
+                continue
+            if msg.type == WSMsgType.TEXT and codec.loads(msg.data).get('op') == 2:
+                await asyncio.sleep(self.rtt)
+                for frame in self.frames:
+                    await ws.send_str(frame)
+
+        # Not even answering the close frame while frozen
+        while ws in self.frozen:
+            await asyncio.sleep(0.05)
+        if not ws.closed:
+            await ws.close()
+        return ws
+
+    def freeze(self) -> None:
+        """ The Swarm stops responding but keeps the connections open """
+        self.frozen.update(self.sockets)
+        self.sockets = []
+
+    async def drop(self) -> None:
+        """ Closes all websockets like a restart of the Swarm """
+        sockets, self.sockets = self.sockets, []
+        for ws in sockets:
+            await ws.close(code=1012)
+
+
+class Handler(EventHandler):
+    def __init__(self):
+        super().__init__(self)
+        self.reconnected = asyncio.Event()
+        self.events = []
+
+    async def on_disconnect(self):
+        self.events.append('disconnect')
+
+    async def on_reconnect(self, time):
+        self.events.append('reconnect')
+        self.reconnected.set()
+
+
+async def start_client(swarm: Swarm, port: int, **kwargs) -> tuple:
+    handler = Handler()
+    connection = Connection(token='x' * 128, event_handler=handler, **kwargs)
+    connection._WEBSOCKET_URL = f"http://127.0.0.1:{port}/socket"
+    if not kwargs.get('reconnect', True):
+        connection._restart = True
+        connection.execution_loop.add_to_loop(connection.handler_restart_websocket)
+    task = asyncio.create_task(connection.connect(asyncio.get_event_loop()))
+    assert await connection.wait_until_ready(30)
+    return connection, handler, task
+
+
+async def stop_client(connection: Connection, task: asyncio.Task) -> None:
+    connection._restart = False
+    await connection.close()
+    task.cancel()
+    try:
+        await task
+    except BaseException:
+        pass
+
+
+async def wait_until(check, timeout: float = 30) -> None:
+    end = time.perf_counter() + timeout
+    while not check():
+        if time.perf_counter() > end:
+            raise TimeoutError()
+        await asyncio.sleep(0.001)
+
+
+async def measure_restart(swarm: Swarm, port: int, rounds: int) -> list:
+    connection, handler, task = await start_client(swarm, port, reconnect=False)
+    results = []
+    try:
+        for _ in range(rounds):
+            requests = swarm.http_requests
+            start = time.perf_counter()
+            await swarm.drop()
+            # The restart resets the readiness => Waiting until the new connection is ready again
+            await wait_until(lambda: not connection.ready)
+            await wait_until(lambda: connection.ready)
+            # Usable only after all houses were received again
+            elapsed = time.perf_counter() - start
+            results.append((elapsed, elapsed, swarm.http_requests - requests))
+    finally:
+        await stop_client(connection, task)
+    return results
+
+
+async def measure_reconnect(swarm: Swarm, port: int, rounds: int) -> list:
+    connection, handler, task = await start_client(swarm, port)
+    results = []
+    try:
+        session = connection.http.session
+        for _ in range(rounds):
+            requests = swarm.http_requests
+            handler.reconnected.clear()
+            start = time.perf_counter()
+            await swarm.drop()
+            await asyncio.wait_for(handler.reconnected.wait(), 30)
+            # Usable after the INIT_STATE => The cached houses are refreshed in the background
+            usable = time.perf_counter() - start
+            await wait_until(lambda: not connection._refreshing_houses)
+            results.append((usable, time.perf_counter() - start, swarm.http_requests - requests))
+        assert connection.http.session is session and connection.reconnects == rounds
+    finally:
+        await stop_client(connection, task)
+    return results
+
+
+async def measure_zombie_and_backoff(swarm: Swarm, port: int) -> None:
+    connection, handler, task = await start_client(swarm, port)
+    try:
+        # Zombie => The Swarm keeps the connection open but does not answer anymore
+        swarm.freeze()
+        handler.reconnected.clear()
+        start = time.perf_counter()
+        await connection.force_reconnect("Swarm stopped responding")
+        await asyncio.wait_for(handler.reconnected.wait(), 30)
+        print(f"forced reconnect of a zombie connection: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        # Rejected handshakes => Exponential backoff with jitter between the attempts
+        swarm.rejected = 4
+        swarm.handshakes = []
+        handler.reconnected.clear()
+        start = time.perf_counter()
+        await swarm.drop()
+        await asyncio.wait_for(handler.reconnected.wait(), 60)
+        gaps = [f"{(b - a) * 1000:.0f}" for a, b in zip([start] + swarm.handshakes, swarm.handshakes)]
+        print(f"4 rejected handshakes: attempts after {', '.join(gaps)} ms - reconnected after "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms - events {handler.events}")
+    finally:
+        swarm.frozen.clear()
+        await stop_client(connection, task)
+
+
+def summary(results: list) -> str:
+    usable = sorted(r[0] for r in results)
+    refreshed = sorted(r[1] for r in results)
+    return (f"{usable[len(usable) // 2] * 1000:>12.1f}{refreshed[len(refreshed) // 2] * 1000:>16.1f}"
+            f"{sum(r[2] for r in results) / len(results):>16.1f}")
+
+
+async def main():
+    houses = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    members = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    rtt = (float(sys.argv[3]) if len(sys.argv) > 3 else 50) / 1000
+    rounds = int(sys.argv[4]) if len(sys.argv) > 4 else 5
+
+    swarm = Swarm(houses, members, rtt)
+    app = web.Application()
+    app.router.add_get('/v1/users/@me', swarm.me)
+    app.router.add_get('/socket', swarm.socket)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    # The host of the API is not passed to the HTTP client => Pointing the url format to the stub
+    http_module.request_url_format = f"http://127.0.0.1:{port}/{{1}}"
+
+    print(f"Python {sys.version.split()[0]} - {houses} houses with {members} members - "
+          f"simulated rtt {rtt * 1000:.0f} ms - {rounds} rounds\n")
+    print(f"{'after a dropped connection':<28}{'usable ms':>12}{'all houses ms':>16}{'HTTP requests':>16}")
+    try:
+        print(f"{'restart (old)':<28}{summary(await measure_restart(swarm, port, rounds))}")
+        print(f"{'reconnect':<28}{summary(await measure_reconnect(swarm, port, rounds))}\n")
+        await measure_zombie_and_backoff(swarm, port)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,203 @@
+"""
+Benchmark of the offline replay of recorded Swarm frames
+
+Starts a local aiohttp stub of the API and the Swarm that sends the INIT_STATE, the HOUSE_JOIN frames of
+large houses and afterwards a stream of MESSAGE_CREATE frames at a fixed rate. The client records the
+received frames with `record_frames` and the recording is then replayed without a connection by new clients:
+
+- as fast as possible: Throughput of the whole pipeline (inflating, decoding, cache and dispatching)
+- recorded pace: The frames are replayed at the rate they were received. The lag is the delay of the frames
+                 behind the recorded time, which grows if the client can not keep up
+
+Every replay has to produce the same cache and the same events as the live connection.
+
+Usage: python benchmarks/gateway_replay.py [houses] [members-per-house] [messages] [messages-per-second]
+                                           [text_json|zlib_stream]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import zlib
+
+from aiohttp import web, WSMsgType
+
+sys.path.insert(0, '.')
+
+from openhivenpy.events import EventHandler  # noqa: E402
+from openhivenpy.gateway import Connection, codec  # noqa: E402
+from openhivenpy.gateway import http as http_module  # noqa: E402
+
+
+def user(i: int) -> dict:
+    return {'id': str(100000000000000000 + i), 'username': f'user{i}', 'name': f'User {i}', 'user_flags': '0',
+            'icon': f'icons/{i}.png', 'header': None, 'presence': 'online', 'bot': False}
+
+
+def member(i: int, house_id: str) -> dict:
+    return {'user_id': user(i)['id'], 'user': user(i), 'house_id': house_id, 'roles': [],
+            'last_permission_update': None, 'joined_at': '2020-10-01T12:00:00.000Z'}
+
+
+def house(h: int, members: int) -> dict:
+    house_id = str(200000000000000000 + h)
+    return {
+        'id': house_id, 'name': f'House {h}', 'owner_id': user(0)['id'], 'icon': None, 'banner': None,
+        'default_permissions': 0, 'roles': [],
+        'entities': [{'id': str(300000000000000000 + h), 'name': 'Rooms', 'type': 1, 'position': 0,
+                      'resource_pointers': []}],
+        'rooms': [{'id': str(400000000000000000 + h * 100 + r), 'name': f'room-{r}', 'house_id': house_id,
+                   'type': 0, 'position': r, 'last_message_id': None, 'emoji': None, 'description': None}
+                  for r in range(10)],
+        'members': [member(m, house_id) for m in range(members)]
+    }
+
+
+def message(i: int, houses: int, members: int) -> dict:
+    h = i % houses
+    author = user(i % members)
+    return {'id': str(600000000000000000 + i), 'author_id': author['id'], 'author': author,
+            'room_id': str(400000000000000000 + h * 100 + i % 10), 'house_id': str(200000000000000000 + h),
+            'content': f'hi {i}', 'timestamp': 1600000000000 + i, 'mentions': [], 'type': 0, 'exploding': False,
+            'device_id': None}
+
+
+class Swarm:
+    """ Stub of the API and the Swarm that streams the messages after the startup """
+    def __init__(self, houses: int, members: int, messages: int, rate: float, compression: str):
+        self.compression = compression
+        self.rate = rate
+        house_ids = [str(200000000000000000 + h) for h in range(houses)]
+        init_state = {'user': user(0), 'settings': {}, 'presences': {},
+                      'relationships': {user(1)['id']: {'user_id': user(1)['id'], 'user': user(1), 'type': 3}},
+                      'private_rooms': [{'id': '900', 'type': 1, 'last_message_id': None, 'recipients': [user(1)]}],
+                      'house_memberships': {house_id: member(0, house_id) for house_id in house_ids},
+                      'house_ids': house_ids}
+        self.startup = [{'op': 0, 'e': 'INIT_STATE', 'd': init_state}]
+        self.startup += [{'op': 0, 'e': 'HOUSE_JOIN', 'd': house(h, members)} for h in range(houses)]
+        self.messages = [{'op': 0, 'e': 'MESSAGE_CREATE', 'd': message(i, houses, members)} for i in range(messages)]
+
+    async def me(self, request):
+        return web.json_response({'success': True, 'data': user(0)})
+
+    async def socket(self, request):
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        compressor = zlib.compressobj() if self.compression == 'zlib_stream' else None
+
+        async def send(frame: dict) -> None:
+            data = codec.dumps(frame)
+            if compressor is None:
+                await ws.send_str(data)
+            else:
+                await ws.send_bytes(compressor.compress(data.encode('utf-8')) + compressor.flush(zlib.Z_SYNC_FLUSH))
+
+        await send({'op': 1, 'd': {'hbt_int': 30000}})
+        async for msg in ws:
+            if msg.type == WSMsgType.TEXT and codec.loads(msg.data).get('op') == 2:
+                for frame in self.startup:
+                    await send(frame)
+                start = time.perf_counter()
+                for i, frame in enumerate(self.messages):
+                    await asyncio.sleep(max(start + i / self.rate - time.perf_counter(), 0))
+                    await send(frame)
+        return ws
+
+
+class Handler(EventHandler):
+    def __init__(self):
+        super().__init__(self)
+        self.messages = 0
+
+    async def on_message_create(self, message):
+        self.messages += 1
+
+
+def new_connection(handler: Handler, **kwargs) -> Connection:
+    return Connection(token='x' * 128, event_handler=handler, **kwargs)
+
+
+def snapshot(connection: Connection) -> tuple:
+    """ Contents of the cache that have to be the same after every replay """
+    return (len(connection.houses), sum(len(h.members) for h in connection.houses), len(connection.users),
+            len(connection.rooms), sorted(str(room._last_message_id) for room in connection.rooms))
+
+
+async def record(path: str, port: int, messages: int, compression: str) -> tuple:
+    handler = Handler()
+    connection = new_connection(handler, record_frames=path, compression=compression)
+    connection._WEBSOCKET_URL = f"http://127.0.0.1:{port}/socket"
+    task = asyncio.create_task(connection.connect(asyncio.get_event_loop()))
+    start = time.perf_counter()
+    try:
+        assert await connection.wait_until_ready(60)
+        end = time.perf_counter() + 60
+        while handler.messages < messages and time.perf_counter() < end:
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        result = snapshot(connection), handler.messages, elapsed, connection.recorder.stats
+    finally:
+        await connection.close()
+        task.cancel()
+        try:
+            await task
+        except BaseException:
+            pass
+    return result
+
+
+async def replay(path: str, speed) -> tuple:
+    handler = Handler()
+    connection = new_connection(handler)
+    stats = await connection.replay(path, speed=speed)
+    # The event handlers are dispatched in their own tasks
+    await asyncio.sleep(0.05)
+    return snapshot(connection), handler.messages, stats
+
+
+def ms(value) -> str:
+    return f"{value * 1000:.1f}" if value is not None else '-'
+
+
+async def main():
+    houses = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    members = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    messages = int(sys.argv[3]) if len(sys.argv) > 3 else 5000
+    rate = float(sys.argv[4]) if len(sys.argv) > 4 else 2000
+    compression = sys.argv[5] if len(sys.argv) > 5 else 'zlib_stream'
+
+    swarm = Swarm(houses, members, messages, rate, compression)
+    app = web.Application()
+    app.router.add_get('/v1/users/@me', swarm.me)
+    app.router.add_get('/socket', swarm.socket)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    # The host of the API is not passed to the HTTP client => Pointing the url format to the stub
+    http_module.request_url_format = f"http://127.0.0.1:{port}/{{1}}"
+
+    path = os.path.join(tempfile.mkdtemp(), 'frames.jsonl.gz')
+    print(f"Python {sys.version.split()[0]} - JSON backend {codec.backend()} - {compression} - {houses} houses "
+          f"with {members} members - {messages} messages at {rate:.0f}/s\n")
+    try:
+        cache, received, elapsed, stats = await record(path, port, messages, compression)
+    finally:
+        await runner.cleanup()
+    print(f"recorded {stats['frames']} frames ({stats['bytes'] / 1024:.0f} KiB received, "
+          f"{os.path.getsize(path) / 1024:.0f} KiB on disk) in {elapsed:.2f} s\n")
+
+    print(f"{'replay':<20}{'s':>8}{'frames/s':>12}{'lag p50 ms':>12}{'lag p99 ms':>12}{'same cache':>12}"
+          f"{'messages':>10}")
+    for name, speed in (('as fast as possible', None), ('recorded pace', 1.0)):
+        replayed_cache, replayed, result = await replay(path, speed)
+        print(f"{name:<20}{result['elapsed']:>8.2f}{result['frames_per_second']:>12.0f}"
+              f"{ms(result['lag_p50']):>12}{ms(result['lag_p99']):>12}{str(replayed_cache == cache):>12}"
+              f"{replayed:>10}")
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""
+Benchmark for the GET response cache of the HTTP client
+
+Starts a local aiohttp stub server that answers user and invite lookups with an ETag and supports
+If-None-Match. Measures repeated `HTTP.request()` calls for the same user and invite without the cache,
+with a fresh cached response and with an expired response that has to be revalidated (304).
+
+Usage: python benchmarks/http_cache.py [requests]
+"""
+import asyncio
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy.gateway import HTTP  # noqa: E402
+
+ETAG = '"v1"'
+
+
+async def handler(request):
+    if request.headers.get('If-None-Match') == ETAG:
+        return web.Response(status=304, headers={'ETag': ETAG})
+    data = {'id': request.match_info['id'], 'name': 'stub', 'username': 'stub', 'icon': None, 'header': None}
+    return web.json_response({'success': True, 'data': data}, headers={'ETag': ETAG})
+
+
+async def start_server() -> tuple:
+    app = web.Application()
+    app.router.add_get('/v1/users/{id}', handler)
+    app.router.add_get('/v1/invites/{id}', handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, port
+
+
+async def bench(http: HTTP, endpoint: str, amount: int) -> float:
+    """ Returns the average microseconds per request """
+    start = time.perf_counter()
+    for _ in range(amount):
+        await http.request(endpoint)
+    return (time.perf_counter() - start) / amount * 1e6
+
+
+async def main():
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    runner, port = await start_server()
+
+    print(f"Python {sys.version.split()[0]} - {amount} requests - microseconds per request\n")
+    print(f"{'endpoint':<22}{'no cache':>12}{'fresh':>12}{'revalidate':>12}")
+    try:
+        plain = HTTP(loop=None, token='x')
+        cached = HTTP(loop=None, token='x', response_cache=True)
+        expired = HTTP(loop=None, token='x', response_cache=True, response_cache_ttls={'*': 0})
+        for http in (plain, cached, expired):
+            http.api_url = f"http://127.0.0.1:{port}/v1"
+            await http.connect()
+
+        for endpoint in ('/users/1234', '/invites/abcdef'):
+            results = []
+            for http in (plain, cached, expired):
+                # Warm-up and filling the cache
+                await bench(http, endpoint, 10)
+                results.append(await bench(http, endpoint, amount))
+            print(f"{endpoint:<22}" + ''.join(f"{r:>12.1f}" for r in results))
+
+        print(f"\nCache stats: {cached.response_cache.stats}")
+        print(f"Revalidating cache stats: {expired.response_cache.stats}")
+        for http in (plain, cached, expired):
+            await http.close()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
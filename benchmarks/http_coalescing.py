@@ -0,0 +1,71 @@
+"""
+Benchmark for the coalescing of identical in-flight GET requests
+
+Starts a local aiohttp stub server with a fixed response delay and sends bursts of concurrent
+`HTTP.request()` calls for the same user, like the lookups that are triggered by many messages
+of a new user. For comparison every call sends its own request like the previous client.
+
+Usage: python benchmarks/http_coalescing.py [concurrency] [delay-ms]
+"""
+import asyncio
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy.gateway import HTTP  # noqa: E402
+
+
+class UncoalescedHTTP(HTTP):
+    """ Previous behaviour => Every call sends its own request """
+    async def request(self, endpoint: str, *, json: dict = None, timeout: float = 15, **kwargs):
+        return await self._get(endpoint, None, timeout, **kwargs)
+
+
+class StubServer:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.requests = 0
+
+    async def handler(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        return web.json_response({'success': True, 'data': {'id': request.match_info['id'], 'name': 'stub'}})
+
+
+async def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    delay = (int(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+
+    server = StubServer(delay)
+    app = web.Application()
+    app.router.add_get('/v1/users/{id}', server.handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    print(f"Python {sys.version.split()[0]} - {concurrency} concurrent lookups - {delay * 1000:.0f} ms server delay\n")
+    print(f"{'client':>12}{'requests':>10}{'ms':>10}{'results':>9}")
+    try:
+        for name, cls in (('uncoalesced', UncoalescedHTTP), ('coalesced', HTTP)):
+            http = cls(loop=None, token='x')
+            http.api_url = f"http://127.0.0.1:{port}/v1"
+            await http.connect()
+
+            server.requests = 0
+            start = time.perf_counter()
+            results = await asyncio.gather(*(http.request("/users/1234") for _ in range(concurrency)))
+            duration = (time.perf_counter() - start) * 1000
+            received = sum(1 for r in results if r is not None)
+            print(f"{name:>12}{server.requests:>10}{duration:>10.1f}{received:>9}")
+            await http.close()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
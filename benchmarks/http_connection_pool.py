@@ -0,0 +1,104 @@
+"""
+Benchmark for the connection pool settings of the HTTP client
+
+Starts a local aiohttp stub server that counts the opened TCP connections and sends bursts of concurrent
+requests with pauses in between:
+
+- keepalive: A keep-alive timeout shorter than the pause closes the idle connections, so every burst has
+             to open new (cold) connections. With a longer keep-alive timeout the bursts reuse them.
+- sharing: Several clients in the same process that send their bursts at different times each open their
+           own connections if they have their own connector. With one shared connector
+           (`openhivenpy.gateway.create_connector()`) they reuse the connections of each other.
+
+Usage: python benchmarks/http_connection_pool.py [bursts] [burst-size] [pause-ms]
+"""
+import asyncio
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy.gateway import HTTP, create_connector  # noqa: E402
+
+
+class StubServer:
+    def __init__(self):
+        self.connections = set()
+
+    async def handler(self, request):
+        self.connections.add(id(request.transport))
+        return web.json_response({'success': True, 'data': {'id': '1', 'name': 'stub'}})
+
+
+async def burst(http: HTTP, size: int) -> float:
+    """ Returns the milliseconds until all requests of the burst finished """
+    start = time.perf_counter()
+    # Different users => The requests are not coalesced
+    await asyncio.gather(*(http.request(f"/users/{i}") for i in range(size)))
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(server: StubServer, port: int, clients_args: list, bursts: int, size: int, pause: float) -> tuple:
+    clients = []
+    for args in clients_args:
+        http = HTTP(loop=None, token='x', **args)
+        http.api_url = f"http://127.0.0.1:{port}/v1"
+        await http.connect()
+        clients.append(http)
+
+    # Waiting for the connection of connect() to expire if the keep-alive is short
+    await asyncio.sleep(pause)
+    server.connections.clear()
+    durations = []
+    for i in range(bursts):
+        # The clients take turns => Like several bots in the same process that are active at different times
+        durations.append(await burst(clients[i % len(clients)], size))
+        await asyncio.sleep(pause)
+
+    for http in clients:
+        await http.close()
+    return sum(durations) / len(durations), len(server.connections)
+
+
+async def main():
+    bursts = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    pause = (int(sys.argv[3]) if len(sys.argv) > 3 else 300) / 1000
+
+    server = StubServer()
+    app = web.Application()
+    app.router.add_get('/v1/users/{id}', server.handler)
+    runner = web.AppRunner(app, access_log=None, keepalive_timeout=75)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    print(f"Python {sys.version.split()[0]} - {bursts} bursts of {size} requests - {pause * 1000:.0f} ms pause\n")
+    print(f"{'scenario':<34}{'ms/burst':>10}{'connections':>13}")
+    try:
+        scenarios = [
+            ('keep-alive 0.1s (expires)', [{'keepalive_timeout': 0.1}]),
+            ('keep-alive 30s', [{'keepalive_timeout': 30}])
+        ]
+        for name, clients_args in scenarios:
+            duration, connections = await run(server, port, clients_args, bursts, size, pause)
+            print(f"{name:<34}{duration:>10.1f}{connections:>13}")
+
+        print()
+        duration, connections = await run(server, port, [{} for _ in range(4)], bursts, size, pause)
+        print(f"{'4 clients, own connectors':<34}{duration:>10.1f}{connections:>13}")
+
+        connector = create_connector(limit=50)
+        duration, connections = await run(server, port, [{'connector': connector} for _ in range(4)],
+                                          bursts, size, pause)
+        await connector.close()
+        print(f"{'4 clients, shared connector':<34}{duration:>10.1f}{connections:>13}")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+Benchmark for the overhead of the request tracing of the HTTP client
+
+Starts a local aiohttp stub server and sends batches of concurrent requests with three sessions:
+
+- debug trace (old): The debug TraceConfig that was installed for every session before. Its callbacks build
+                     the log messages for every request and chunk even if debug logging is disabled.
+- no tracing: The default now. The debug TraceConfig is only installed if debug logging is enabled.
+- instrumentation: The opt-in instrumentation that collects the metrics per route.
+
+Prints the time per request of every session and the metrics the instrumentation collected for the route.
+
+Usage: python benchmarks/http_instrumentation.py [requests] [concurrency] [rounds]
+"""
+import asyncio
+import json
+import sys
+import time
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy.gateway import HTTP, codec, create_connector  # noqa: E402
+from openhivenpy.gateway import http as http_module  # noqa: E402
+
+USER = {'id': '1', 'username': 'stub', 'name': 'Stub', 'icon': None, 'header': None, 'bot': False,
+        'bio': 'x' * 200}
+
+
+async def handler(request):
+    return web.json_response({'success': True, 'data': USER})
+
+
+async def create_client(port: int, debug_trace: bool = False, **kwargs) -> HTTP:
+    http = HTTP(loop=None, token='x', **kwargs)
+    http.api_url = f"http://127.0.0.1:{port}/v1"
+    await http.connect()
+    if debug_trace:
+        # Session like before => The debug TraceConfig is always installed
+        await http.session.close()
+        http._session = aiohttp.ClientSession(trace_configs=[http_module._create_debug_trace_config()],
+                                              connector=create_connector(),
+                                              response_class=codec.HivenResponse,
+                                              json_serialize=codec.dumps)
+    return http
+
+
+async def run(http: HTTP, amount: int, concurrency: int) -> float:
+    """ Returns the microseconds per request """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _request(i):
+        async with semaphore:
+            # raw_request => Not coalesced or cached
+            resp = await http.raw_request(f"/users/{i}")
+            assert resp is not None and resp.status == 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_request(i) for i in range(amount)))
+    return (time.perf_counter() - start) / amount * 1e6
+
+
+async def main():
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    app = web.Application()
+    app.router.add_get('/v1/users/{id}', handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    clients = [
+        ('debug trace (old)', await create_client(port, debug_trace=True)),
+        ('no tracing', await create_client(port)),
+        ('instrumentation', await create_client(port, instrumentation=True))
+    ]
+    print(f"Python {sys.version.split()[0]} - aiohttp {aiohttp.__version__} - {amount} requests - "
+          f"{concurrency} concurrent - best of {rounds}\n")
+    print(f"{'session':<20}{'us/request':>12}")
+    try:
+        results = {name: [] for name, _ in clients}
+        for _ in range(rounds):
+            # Alternating => Every session is equally affected by the noise of the machine
+            for name, http in clients:
+                results[name].append(await run(http, amount, concurrency))
+        for name, _ in clients:
+            print(f"{name:<20}{min(results[name]):>12.1f}")
+
+        instrumentation = clients[2][1].instrumentation
+        stats = instrumentation.get('/users/{id}')
+        print(f"\n{stats}")
+        print(json.dumps(stats.to_dict(), indent=2))
+    finally:
+        for _, http in clients:
+            await http.close()
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
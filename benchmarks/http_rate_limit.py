@@ -0,0 +1,121 @@
+"""
+Benchmark for the per-route rate-limit scheduler of the HTTP client
+
+Starts a local aiohttp stub server that allows a fixed amount of requests per window for every route
+and answers with 429 and Retry-After if the limit was exceeded. Sends a burst of messages to different
+rooms (=> same route '/rooms/{id}/messages') with the scheduler and with the scheduler disabled, which
+sends every request immediately like the previous client.
+
+Usage: python benchmarks/http_rate_limit.py [messages] [limit] [window]
+"""
+import asyncio
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy.gateway import HTTP  # noqa: E402
+from openhivenpy.gateway.ratelimit import RateLimitBucket, RateLimiter, route_template  # noqa: E402
+
+
+class BlindBucket(RateLimitBucket):
+    """ Bucket that never limits and ignores the headers => Previous behaviour """
+    async def acquire(self) -> None:
+        pass
+
+    def release(self) -> None:
+        pass
+
+    def update(self, headers) -> None:
+        pass
+
+    def limited(self, headers) -> float:
+        return 0.0
+
+
+class BlindRateLimiter(RateLimiter):
+    def get_bucket(self, endpoint: str) -> RateLimitBucket:
+        return BlindBucket(route_template(endpoint))
+
+
+class StubServer:
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.windows = {}
+        self.accepted = 0
+        self.rejected = 0
+
+    async def handler(self, request):
+        route = route_template(request.path)
+        now = time.monotonic()
+        start, count = self.windows.get(route, (now, 0))
+        if now - start >= self.window:
+            start, count = now, 0
+        reset_after = self.window - (now - start)
+
+        if count >= self.limit:
+            self.rejected += 1
+            self.windows[route] = (start, count)
+            return web.json_response({'success': False, 'error': {'code': 429, 'message': 'Too many requests'}},
+                                     status=429, headers={'Retry-After': f"{reset_after:.3f}"})
+
+        self.accepted += 1
+        self.windows[route] = (start, count + 1)
+        return web.json_response({'success': True, 'data': {}}, headers={
+            'X-RateLimit-Limit': str(self.limit),
+            'X-RateLimit-Remaining': str(self.limit - count - 1),
+            'X-RateLimit-Reset-After': f"{reset_after:.3f}"
+        })
+
+
+async def bench(http: HTTP, server: StubServer, messages: int) -> tuple:
+    server.accepted = server.rejected = 0
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(http.post(f"/rooms/{i}/messages", json={'content': 'bench'})
+                                       for i in range(messages)))
+    duration = time.perf_counter() - start
+    delivered = sum(1 for resp in responses if resp is not None and resp.status == 200)
+    return delivered, server.rejected, duration
+
+
+async def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    window = float(sys.argv[3]) if len(sys.argv) > 3 else 1.0
+
+    server = StubServer(limit, window)
+    app = web.Application()
+    app.router.add_route('*', '/v1/{tail:.*}', server.handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    print(f"Python {sys.version.split()[0]} - {messages} messages - limit {limit} per {window}s\n")
+    print(f"{'scheduler':>10}{'delivered':>11}{'429s':>8}{'seconds':>10}")
+    try:
+        for name, limiter in (('blind', BlindRateLimiter), ('route', RateLimiter)):
+            http = HTTP(loop=None, token='x')
+            http.api_url = f"http://127.0.0.1:{port}/v1"
+            http._rate_limiter = limiter()
+            if limiter is BlindRateLimiter:
+                # The previous client did not send rejected requests again
+                http._rate_limit_retries = 0
+            await http.connect()
+            # Waiting for a new window to not use up the limit of the previous run
+            await asyncio.sleep(window)
+
+            delivered, rejected, duration = await bench(http, server, messages)
+            print(f"{name:>10}{delivered:>11}{rejected:>8}{duration:>10.2f}")
+            await http.close()
+            await asyncio.sleep(window)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,142 @@
+"""
+Benchmark for the retry policy and the circuit breaker of the HTTP client
+
+Starts a local aiohttp stub server and measures two failure modes:
+
+- flaky: A part of the requests fails with a 502 error page of a proxy. Without retries every failed
+         request is lost, with the retry policy they are sent again after a short backoff.
+- outage: The server accepts the connections but never responds while a few workers process a queue of
+          jobs that each send a request. Without the circuit breaker every job waits for its own timeout,
+          with the circuit breaker the remaining jobs fail immediately after the first timeouts. After the
+          outage the breaker lets a test request through and closes again.
+
+Usage: python benchmarks/http_retry.py [requests] [failure-rate] [outage-jobs] [workers] [timeout-s]
+"""
+import asyncio
+import random
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy.gateway import HTTP, CircuitBreaker, RetryPolicy  # noqa: E402
+
+
+class StubServer:
+    def __init__(self, failure_rate: float):
+        self.failure_rate = failure_rate
+        self.mode = 'ok'
+        self.requests = 0
+        self.random = random.Random(0)
+
+    async def handler(self, request):
+        if self.mode == 'ok':
+            return web.json_response({'success': True, 'data': {'id': '1', 'name': 'stub'}})
+
+        self.requests += 1
+        while self.mode == 'down':
+            # No response until the outage is over
+            await asyncio.sleep(0.1)
+        if self.random.random() < self.failure_rate:
+            return web.Response(status=502, text='<html><body>502 Bad Gateway</body></html>',
+                                content_type='text/html')
+        return web.json_response({'success': True, 'data': {'id': request.match_info['id'], 'name': 'stub'}})
+
+
+async def create_client(server: StubServer, port: int, **kwargs) -> HTTP:
+    server.mode = 'ok'
+    http = HTTP(loop=None, token='x', **kwargs)
+    http.api_url = f"http://127.0.0.1:{port}/v1"
+    await http.connect()
+    # The API was reachable before => The rate-limit of the route is already known
+    await http.request("/users/0")
+    return http
+
+
+async def flaky(server: StubServer, port: int, amount: int, **kwargs) -> tuple:
+    http = await create_client(server, port, **kwargs)
+    server.mode, server.requests = 'flaky', 0
+    start = time.perf_counter()
+    # Different users => The requests are not coalesced
+    results = await asyncio.gather(*(http.request(f"/users/{i}") for i in range(amount)))
+    duration = time.perf_counter() - start
+    await http.close()
+    delivered = sum(1 for r in results if r and r.get('success'))
+    return delivered, server.requests, duration
+
+
+async def outage(server: StubServer, port: int, amount: int, workers: int, timeout: float, **kwargs) -> tuple:
+    http = await create_client(server, port, **kwargs)
+    server.mode, server.requests = 'down', 0
+    queue = asyncio.Queue()
+    for i in range(amount):
+        queue.put_nowait(i)
+    results = []
+
+    async def worker():
+        while not queue.empty():
+            i = queue.get_nowait()
+            results.append(await http.request(f"/users/{i}", timeout=timeout))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    duration = time.perf_counter() - start
+    failed = sum(1 for r in results if r is None)
+    sent = server.requests
+
+    # Hiven is reachable again => The test request after the breaker timeout closes the breaker
+    server.mode = 'ok'
+    await asyncio.sleep(http.circuit_breaker.retry_after)
+    recovered = await http.request("/users/1") is not None
+    state = http.circuit_breaker.state
+    await http.close()
+    return failed, sent, duration, recovered, state
+
+
+async def main():
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    failure_rate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    outage_amount = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else 10
+    timeout = float(sys.argv[5]) if len(sys.argv) > 5 else 1.0
+
+    server = StubServer(failure_rate)
+    app = web.Application()
+    app.router.add_get('/v1/users/{id}', server.handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    print(f"Python {sys.version.split()[0]} - {amount} requests with {failure_rate:.0%} 502 errors - "
+          f"outage with {outage_amount} jobs, {workers} workers and {timeout:.1f}s timeout\n")
+    try:
+        print(f"{'flaky':<26}{'delivered':>10}{'sent':>8}{'seconds':>9}")
+        scenarios = [
+            ('no retries', {'http_retries': 0}),
+            ('retries', {'retry_policy': RetryPolicy(base_delay=0.05)})
+        ]
+        for name, kwargs in scenarios:
+            delivered, sent, duration = await flaky(server, port, amount, **kwargs)
+            print(f"{name:<26}{f'{delivered}/{amount}':>10}{sent:>8}{duration:>9.2f}")
+
+        print(f"\n{'outage':<26}{'failed':>10}{'sent':>8}{'seconds':>9}{'recovered':>11}{'breaker':>9}")
+        scenarios = [
+            ('no circuit breaker', {'http_retries': 0, 'circuit_breaker': CircuitBreaker(threshold=10 ** 9)}),
+            ('circuit breaker', {'retry_policy': RetryPolicy(base_delay=0.05),
+                                 'circuit_breaker': CircuitBreaker(timeout=2)})
+        ]
+        for name, kwargs in scenarios:
+            failed, sent, duration, recovered, state = await outage(server, port, outage_amount, workers, timeout,
+                                                                    **kwargs)
+            print(f"{name:<26}{f'{failed}/{outage_amount}':>10}{sent:>8}{duration:>9.2f}{str(recovered):>11}"
+                  f"{state:>9}")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""
+Benchmark for the request throughput of the HTTP client
+
+Starts a local aiohttp stub server and sends requests with `HTTP.request()` using different amounts of
+concurrent in-flight requests. For comparison the previous request engine is also measured, which stored
+the in-flight request in a slot shared by the whole client and polled it every 250 ms in an additional
+timeout task.
+
+Usage: python benchmarks/http_throughput.py [requests]
+"""
+import asyncio
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy.gateway import HTTP  # noqa: E402
+from openhivenpy.gateway import codec  # noqa: E402
+
+
+class PollingHTTP(HTTP):
+    """ Previous request engine with the shared _request slot and the polling timeout handler """
+    async def raw_request(self, endpoint: str, *, method: str = "GET", timeout: float = 15, **kwargs):
+        async def _time_out_handler(_timeout: float) -> None:
+            timeout_limit = time.time() + _timeout
+            while True:
+                if self._request.done():
+                    break
+                elif time.time() > timeout_limit:
+                    if not self._request.cancelled():
+                        self._request.cancel()
+                    break
+                await asyncio.sleep(0.25)
+
+        async def _request():
+            async with self.session.request(method=method, url=f"{self.api_url}{endpoint}",
+                                            headers=self.headers, **kwargs) as resp:
+                resp._decoded_json = codec.loads(await resp.read())
+                return resp
+
+        self._request = asyncio.create_task(_request())
+        try:
+            resp = await asyncio.gather(self._request, asyncio.create_task(_time_out_handler(timeout)))
+        except asyncio.CancelledError:
+            return None
+        return resp[0]
+
+
+async def handler(request):
+    return web.json_response({'success': True, 'data': {'id': '1', 'name': 'stub'}})
+
+
+async def start_server() -> tuple:
+    app = web.Application()
+    app.router.add_get('/v1/users/@me', handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, port
+
+
+async def bench(http: HTTP, amount: int, concurrency: int) -> tuple:
+    semaphore = asyncio.Semaphore(concurrency)
+    failed = 0
+
+    async def one():
+        nonlocal failed
+        async with semaphore:
+            data = await http.request("/users/@me")
+            if data is None:
+                failed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(amount)))
+    duration = time.perf_counter() - start
+    return amount / duration, failed
+
+
+async def main():
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    runner, port = await start_server()
+
+    print(f"Python {sys.version.split()[0]} - {amount} requests - requests per second\n")
+    print(f"{'concurrency':>12}{'engine':>12}{'req/s':>12}{'failed':>8}")
+    try:
+        for cls, name in ((HTTP, 'timeout'), (PollingHTTP, 'polling')):
+            http = cls(loop=None, token='x')
+            http.api_url = f"http://127.0.0.1:{port}/v1"
+            await http.connect()
+            for concurrency in (1, 10, 100, 500):
+                # The polling engine needs up to 250 ms per request => Fewer requests to keep the runtime short
+                n = amount if cls is HTTP else min(amount, concurrency * 8)
+                rate, failed = await bench(http, n, concurrency)
+                print(f"{concurrency:>12}{name:>12}{rate:>12.0f}{failed:>8}")
+            await http.close()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
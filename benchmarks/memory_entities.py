@@ -0,0 +1,121 @@
+"""
+Memory benchmark for the cached Hiven objects
+
+Reports the bytes per cached entity of the slotted `openhivenpy.types` classes and of an
+equivalent `__dict__`-based representation (the representation the classes used before
+`__slots__` was added) that holds the exact same attribute values.
+
+Usage: python benchmarks/memory_entities.py [amount]
+"""
+import copy
+import sys
+import tracemalloc
+
+sys.path.insert(0, '.')
+
+from openhivenpy.gateway.http import HTTP  # noqa: E402
+import openhivenpy.types as types  # noqa: E402
+
+
+def user_data(i: int) -> dict:
+    return {
+        "username": f"user{i}",
+        "name": f"User {i}",
+        "id": str(100000 + i),
+        "user_flags": "0",
+        "icon": f"icon{i}.png",
+        "header": f"header{i}.png",
+        "bot": False,
+        "location": "",
+        "website": "",
+        "presence": "online"
+    }
+
+
+def member_data(i: int, house_id: int) -> dict:
+    return {
+        "user_id": str(100000 + i),
+        "user": user_data(i),
+        "roles": [],
+        "last_permission_update": None,
+        "joined_at": "2020-11-01T00:00:00.000Z",
+        "house_id": str(house_id)
+    }
+
+
+def room_data(i: int, house_id: int) -> dict:
+    return {
+        "id": str(200000 + i),
+        "name": f"room-{i}",
+        "house_id": str(house_id),
+        "position": i,
+        "type": 0,
+        "emoji": None,
+        "description": "",
+        "last_message_id": str(300000 + i)
+    }
+
+
+def slot_names(cls: type) -> list:
+    """ Returns the slots of the class and all its base classes in initialisation order """
+    names = []
+    for base in reversed(cls.__mro__):
+        names.extend(base.__dict__.get('__slots__', ()))
+    return names
+
+
+# One plain class per type so the instance dicts share their keys like they did in the original classes
+_dict_classes = {}
+
+
+def to_dict_entity(entity) -> object:
+    """ Creates a __dict__-based copy of the entity that references the same attribute values """
+    cls = _dict_classes.get(type(entity))
+    if cls is None:
+        cls = _dict_classes[type(entity)] = type(type(entity).__name__, (), {})
+    obj = cls()
+    for name in slot_names(type(entity)):
+        setattr(obj, name, getattr(entity, name))
+    return obj
+
+
+def measure(func, *args) -> tuple:
+    """ Returns the result of the function and the bytes that it allocated and kept alive """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func(*args)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def bench(name: str, factory, amount: int):
+    entities, total = measure(lambda: [factory(i) for i in range(amount)])
+    _, slotted = measure(lambda: [copy.copy(e) for e in entities])
+    _, dict_based = measure(lambda: [to_dict_entity(e) for e in entities])
+
+    # The allocated values are the same for both representations
+    values = total - slotted
+    before = (dict_based + values) / amount
+    after = (slotted + values) / amount
+
+    print(f"{name:<10} container: {dict_based / amount:7.1f} -> {slotted / amount:7.1f} B "
+          f"({100 * (1 - slotted / dict_based):5.1f}% less) | "
+          f"incl. values: {before:7.1f} -> {after:7.1f} B ({100 * (1 - after / before):5.1f}% less)")
+
+
+def main():
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    http = HTTP(loop=None, token='')
+    house = None
+    house_id = 400000
+
+    print(f"Python {sys.version.split()[0]} - {amount} entities per type - bytes per entity\n")
+    bench('User', lambda i: types.User(user_data(i), http), amount)
+    bench('Member', lambda i: types.Member(member_data(i, house_id), house, http), amount)
+    bench('Room', lambda i: types.Room(room_data(i, house_id), http, house), amount)
+    bench('Relation', lambda i: types.Relationship({'user': user_data(i), 'type': 3}, http), amount)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark for the author resolution of `Room.get_recent_messages()`
+
+Starts a local aiohttp stub server with a fixed response delay that returns a page of messages without
+embedded author data. Measures the page fetch with the previous implementation, which requested the
+author of every message one after another, and the current one, which requests every unknown author once
+and concurrently. Additionally measured with half of the authors already in the client cache.
+
+Usage: python benchmarks/room_history.py [messages] [authors] [delay-ms]
+"""
+import asyncio
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy import types  # noqa: E402
+from openhivenpy.events import EventHandler  # noqa: E402
+from openhivenpy.gateway import HTTP, Connection  # noqa: E402
+from openhivenpy.types._get_type import getType  # noqa: E402
+
+
+def user_data(user_id) -> dict:
+    return {'id': str(user_id), 'username': f'user{user_id}', 'name': f'User {user_id}', 'icon': None,
+            'header': None, 'bot': False}
+
+
+class SequentialRoom(types.Room):
+    """ Previous implementation => One request per message one after another """
+    async def get_recent_messages(self):
+        raw_data = await self._http.request(f"/rooms/{self.id}/messages")
+        messages = []
+        for message in raw_data.get('data'):
+            _raw_data = await self._http.request(f"/users/{message.get('author_id')}")
+            author = await getType.a_user(_raw_data.get('data'), self._http)
+            messages.append(await getType.a_message(data=message, http=self._http, house=self.house,
+                                                    room=self, author=author))
+        return messages
+
+
+class StubServer:
+    def __init__(self, messages: int, authors: int, delay: float):
+        self.messages = messages
+        self.authors = authors
+        self.delay = delay
+        self.requests = 0
+
+    async def history(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        data = [{'id': str(5000 + i), 'author_id': str(100 + i % self.authors), 'room_id': request.match_info['id'],
+                 'house_id': None, 'content': f'message {i}', 'timestamp': 1600000000000, 'mentions': [],
+                 'type': 0, 'exploding': False} for i in range(self.messages)]
+        return web.json_response({'success': True, 'data': data})
+
+    async def user(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        return web.json_response({'success': True, 'data': user_data(request.match_info['id'])})
+
+
+async def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    authors = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    delay = (int(sys.argv[3]) if len(sys.argv) > 3 else 20) / 1000
+
+    server = StubServer(messages, authors, delay)
+    app = web.Application()
+    app.router.add_get('/v1/rooms/{id}/messages', server.history)
+    app.router.add_get('/v1/users/{id}', server.user)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    client = Connection(token='x' * 128, event_handler=EventHandler(None))
+    http = HTTP(loop=None, token='x', client=client)
+    http.api_url = f"http://127.0.0.1:{port}/v1"
+    await http.connect()
+    room_data = {'id': '3000', 'name': 'bench', 'house_id': None, 'type': 0}
+
+    print(f"Python {sys.version.split()[0]} - {messages} messages from {authors} authors - "
+          f"{delay * 1000:.0f} ms server delay\n")
+    print(f"{'implementation':>16}{'requests':>10}{'ms':>10}{'messages':>10}")
+    try:
+        runs = (('sequential', SequentialRoom, 0), ('concurrent', types.Room, 0), ('half cached', types.Room, 2))
+        for name, cls, cached_every in runs:
+            client._users.clear()
+            if cached_every:
+                client._users.upsert_many(types.User(user_data(100 + i), http)
+                                          for i in range(0, authors, cached_every))
+            room = cls(room_data, http, None)
+            server.requests = 0
+            start = time.perf_counter()
+            result = await room.get_recent_messages()
+            duration = (time.perf_counter() - start) * 1000
+            print(f"{name:>16}{server.requests:>10}{duration:>10.1f}{len(result or ()):>10}")
+    finally:
+        await http.close()
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""
+Benchmark for walking the message history with `Room.history()`
+
+Starts a local aiohttp stub server with a fixed response delay that serves a room history in pages
+(newest first, cursor with before/after) and archives the whole room with a consumer that needs some time
+per message. Compares the prefetching iterator with walking the pages one after another and reports the
+peak memory of both, which stays the same for any amount of messages.
+
+Usage: python benchmarks/room_history_iter.py [messages] [page-size] [delay-ms] [consumer-us]
+"""
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy import types  # noqa: E402
+from openhivenpy.events import EventHandler  # noqa: E402
+from openhivenpy.gateway import HTTP, Connection  # noqa: E402
+from openhivenpy.types import _history  # noqa: E402
+
+AUTHOR = {'id': '100', 'username': 'author', 'name': 'Author', 'icon': None, 'header': None, 'bot': False}
+
+
+class StubServer:
+    def __init__(self, messages: int, page_size: int, delay: float):
+        self.ids = list(range(10000, 10000 + messages))
+        self.page_size = page_size
+        self.delay = delay
+        self.requests = 0
+
+    async def history(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        before = request.query.get('before')
+        after = request.query.get('after')
+        if after is not None:
+            ids = [i for i in self.ids if i > int(after)][:self.page_size]
+        else:
+            ids = [i for i in self.ids if before is None or i < int(before)][-self.page_size:]
+        data = [{'id': str(i), 'author_id': AUTHOR['id'], 'author': AUTHOR, 'room_id': request.match_info['id'],
+                 'house_id': None, 'content': f'message {i}', 'timestamp': 1600000000000, 'mentions': [],
+                 'type': 0, 'exploding': False} for i in reversed(ids)]
+        return web.json_response({'success': True, 'data': data})
+
+
+async def sequential_history(room):
+    """ Walks the pages one after another without requesting the next page in advance """
+    cursor = None
+    while True:
+        page = await _history._fetch_page(room._http, room.id, cursor, False)
+        if not page:
+            return
+        page = sorted(page, key=lambda m: int(m['id']), reverse=True)
+        authors = await _history.resolve_authors(room._http, page)
+        for message in page:
+            yield types.Message(message, room._http, None, room, authors.get(message['author_id']))
+        cursor = int(page[-1]['id'])
+
+
+async def archive(iterator, consumer: float) -> tuple:
+    amount = 0
+    last = None
+    ordered = True
+    async for message in iterator:
+        if last is not None and int(message.id) >= last:
+            ordered = False
+        last = int(message.id)
+        amount += 1
+        if consumer:
+            # Simulating the processing of the message by the consumer
+            end = time.perf_counter() + consumer
+            while time.perf_counter() < end:
+                pass
+            await asyncio.sleep(0)
+    return amount, ordered
+
+
+async def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    delay = (int(sys.argv[3]) if len(sys.argv) > 3 else 20) / 1000
+    consumer = (int(sys.argv[4]) if len(sys.argv) > 4 else 300) / 1e6
+
+    server = StubServer(messages, page_size, delay)
+    app = web.Application()
+    app.router.add_get('/v1/rooms/{id}/messages', server.history)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    client = Connection(token='x' * 128, event_handler=EventHandler(None))
+    http = HTTP(loop=None, token='x', client=client)
+    http.api_url = f"http://127.0.0.1:{port}/v1"
+    await http.connect()
+    room = types.Room({'id': '3000', 'name': 'bench', 'house_id': None, 'type': 0}, http, None)
+
+    print(f"Python {sys.version.split()[0]} - {messages} messages - pages of {page_size} - "
+          f"{delay * 1000:.0f} ms server delay - {consumer * 1e6:.0f} us per message\n")
+    print(f"{'iterator':>12}{'requests':>10}{'seconds':>10}{'messages':>10}{'ordered':>9}{'peak KiB':>10}")
+    try:
+        for name, iterator in (('sequential', lambda: sequential_history(room)), ('prefetch', room.history)):
+            server.requests = 0
+            tracemalloc.start()
+            start = time.perf_counter()
+            amount, ordered = await archive(iterator(), consumer)
+            duration = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+            print(f"{name:>12}{server.requests:>10}{duration:>10.2f}{amount:>10}{str(ordered):>9}{peak:>10.0f}")
+
+        # Sanity checks of the parameters
+        newest = [int(m.id) async for m in room.history(limit=3)]
+        window = [int(m.id) async for m in room.history(before=10010, after=10005)]
+        forward = [int(m.id) async for m in room.history(after=10000 + messages - 4)]
+        print(f"\nlimit=3: {newest}\nbefore/after: {window}\nafter: {forward}")
+    finally:
+        await http.close()
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+Benchmark for the round trips of `Room.send()`
+
+Starts a local aiohttp stub server with a fixed response delay and sends messages with a Room of a client
+that already received its user with INIT_STATE. For comparison the client user is removed, which makes
+`Room.send()` request '/users/@me' after every message like the previous implementation.
+
+Usage: python benchmarks/room_send.py [messages] [delay-ms]
+"""
+import asyncio
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, '.')
+
+from openhivenpy import types  # noqa: E402
+from openhivenpy.events import EventHandler  # noqa: E402
+from openhivenpy.gateway import HTTP, Connection  # noqa: E402
+
+USER = {'id': '1000', 'username': 'bench', 'name': 'Bench', 'icon': None, 'header': None, 'bot': True}
+
+
+class StubServer:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.requests = 0
+
+    async def me(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        return web.json_response({'success': True, 'data': USER})
+
+    async def send(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        content = (await request.json()).get('content')
+        return web.json_response({'success': True, 'data': {
+            'id': '2000', 'author_id': USER['id'], 'room_id': request.match_info['id'], 'house_id': None,
+            'content': content, 'timestamp': 1600000000000, 'mentions': [], 'type': 0, 'exploding': False}})
+
+
+async def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    delay = (int(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+
+    server = StubServer(delay)
+    app = web.Application()
+    app.router.add_get('/v1/users/@me', server.me)
+    app.router.add_post('/v1/rooms/{id}/messages', server.send)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    client = Connection(token='x' * 128, event_handler=EventHandler(None))
+    http = HTTP(loop=None, token='x', client=client)
+    http.api_url = f"http://127.0.0.1:{port}/v1"
+    await http.connect()
+    room = types.Room({'id': '3000', 'name': 'bench', 'house_id': None, 'type': 0}, http, None)
+
+    print(f"Python {sys.version.split()[0]} - {messages} messages - {delay * 1000:.0f} ms server delay\n")
+    print(f"{'client user':>14}{'requests':>10}{'ms/send':>10}{'sent':>6}")
+    try:
+        for name, user in (('requested', None), ('cached', types.User(USER, http))):
+            client._USER = user
+            server.requests = 0
+            start = time.perf_counter()
+            sent = 0
+            for i in range(messages):
+                if await room.send(f"message {i}") is not None:
+                    sent += 1
+            duration = (time.perf_counter() - start) / messages * 1000
+            print(f"{name:>14}{server.requests:>10}{duration:>10.1f}{sent:>6}")
+    finally:
+        await http.close()
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
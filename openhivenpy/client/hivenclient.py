@@ -2,7 +2,6 @@ import asyncio
 import sys
 import os
 import logging
-from time import time
 from typing import Optional, Union
 
 from openhivenpy.settings import load_env
@@ -53,11 +52,78 @@ class HivenClient(EventHandler):
                                                         Creates a new one on Default
     
     heartbeat: `int` - Intervals in which the bot will send life signals to the Websocket. Defaults to `30000`
+
+    heartbeat_timeout: `float` - Seconds Hiven has to acknowledge a life signal. If it is not acknowledged the
+                                 connection is considered dead and reconnected. Defaults to `10`
    
     log_ws_output: `bool` - Will additionally to normal debug information also log the ws responses
     
     close_timeout: `int` -  Seconds after the websocket will timeout after the handshake
                             didn't complete successfully. Defaults to `40`
+
+    event_queue_size: `int` - Maximum amount of received events waiting for processing. If the queue is full
+                              the websocket stops reading until events were processed. Defaults to `1000`
+
+    event_workers: `int` - Amount of workers that process the received events. Events of the same room or house
+                           are processed in the order they were received. Defaults to `4`
+
+    compression: `str` - Compression of the Swarm frames. 'text_json' for uncompressed text frames or
+                         'zlib_stream' for binary frames that are compressed with one zlib stream for the whole
+                         connection. Defaults to `'text_json'`
+
+    reconnect: `bool` - If set to True the websocket reconnects with exponential backoff over the same session if
+                        the connection was lost after the client was initialized. The cache is kept and refreshed
+                        with the data of the new connection. Defaults to `True`
+
+    reconnect_attempts: `int` - Amount of failed reconnect attempts in a row after which the connection is closed.
+                                Defaults to `10`
+
+    record_frames: `str` - Path of a file the received Swarm frames are recorded to as gzip compressed JSONL. The
+                           recording can be replayed offline with `replay()`. Defaults to `None`
+
+    rate_limit_retries: `int` - Amount of times a request is sent again after it was rejected because of the
+                                rate-limit. Defaults to `3`
+
+    http_retries: `int` - Amount of times an idempotent HTTP request is sent again after a server error, timeout
+                          or connection error. Defaults to `3`
+
+    retry_policy: `openhivenpy.gateway.RetryPolicy` - Retry policy that should be used instead of the default one
+                                                      with `http_retries`
+
+    circuit_breaker_threshold: `int` - Amount of failed HTTP requests in a row after which all requests fail
+                                       immediately while Hiven is down. Defaults to `5`
+
+    circuit_breaker_timeout: `float` - Seconds until a request is sent again to test if Hiven is reachable.
+                                       Defaults to `30`
+
+    circuit_breaker: `openhivenpy.gateway.CircuitBreaker` - Circuit breaker that should be used instead of the
+                                                            default one. Can be shared between clients
+
+    instrumentation: `bool` - If set to True latencies, status codes, transferred bytes and queue waiting times
+                              of the HTTP requests are collected per route. See `HTTP.instrumentation`.
+                              Defaults to `False`
+
+    connection_limit: `int` - Maximum amount of simultaneously open HTTP connections. 0 means no limit.
+                              Defaults to `100`
+
+    connection_limit_per_host: `int` - Maximum amount of simultaneously open HTTP connections to the same host.
+                                       0 means no limit. Defaults to `0`
+
+    keepalive_timeout: `float` - Seconds an idle connection is kept open for the next request. Defaults to `15`
+
+    dns_cache_ttl: `int` - Seconds the resolved address of a host is cached. Defaults to `10`
+
+    connector: `aiohttp.TCPConnector` - Connector for the HTTP requests that should be used instead of creating
+                                        one. Can be shared between several clients and is not closed by them.
+                                        See `openhivenpy.gateway.create_connector()`
+
+    gateway_connector: `aiohttp.TCPConnector` - Connector for the websocket that should be used instead of
+                                                creating one. Can be shared like `connector`
+
+    response_cache: `bool` - If set to True the responses of GET requests for users, members, rooms and invites
+                             are cached and revalidated with conditional requests. Defaults to `False`
+
+    response_cache_size: `int` - Maximum amount of cached responses. Defaults to `512`
     
     event_loop: Optional[`asyncio.AbstractEventLoop`] - Event loop that will be used to execute all async functions.
                                                         Defaults to None!
@@ -327,7 +393,7 @@ class HivenClient(EventHandler):
 
         Returns a string with the current connection status.
         
-        Can be either 'OPENING', 'OPEN', 'CLOSING' or 'CLOSED'
+        Can be either 'OPENING', 'OPEN', 'RECONNECTING', 'CLOSING' or 'CLOSED'
 
         """
         return getattr(self.connection, 'connection_status', None)
@@ -371,24 +437,52 @@ class HivenClient(EventHandler):
     def startup_time(self) -> float:
         return getattr(self.connection, 'startup_time', None)
 
+    @property
+    def startup_timings(self) -> dict:
+        """`openhivenpy.HivenClient.startup_timings`
+
+        Durations of the startup phases in seconds ('connect', 'init_state', 'house_ingest' and 'total')
+
+        """
+        return getattr(self.connection, 'startup_timings', {})
+
+    async def wait_until_ready(self, timeout: float = None) -> bool:
+        """`openhivenpy.HivenClient.wait_until_ready()`
+
+        Waits until the client received all data and is ready for usage.
+
+        Returns `True` if the client is ready and `False` if the timeout was reached
+
+        Parameter:
+        ----------
+
+        timeout: `float` - Seconds after the waiting should be stopped. Defaults to None which means no limit
+
+        """
+        return await self.connection.wait_until_ready(timeout=timeout)
+
     @property
     def ping(self) -> Union[float, None]:
         """`openhivenpy.client.HivenClient.ping`
         
-        Returns the current ping of the HTTP.
+        Returns the seconds until the last life signal was acknowledged by Hiven.
+        None if the client is not connected or no life signal was acknowledged yet
+
+        Measured with every life signal of the websocket => Does not send a request and can be
+        used inside the running event loop
         
         """
-        if getattr(self.connection.http, 'ready', False):
-            start_t = time()
-            raw_data = asyncio.run(self.connection.http.request("/users/@me"))
-            data = raw_data.get('data')
-            if data:
-                return time() - start_t
-            else:
-                logger.warning("[CLIENT] Failed to ping Hiven!")
-                return None
-        else:
-            return None
+        return getattr(self.connection, 'latency', None)
+
+    @property
+    def latency_stats(self) -> dict:
+        """`openhivenpy.client.HivenClient.latency_stats`
+
+        Latency of the life signals in seconds. 'latency' is the last one and 'p50' and 'p99' the
+        percentiles of the last 100. 'missed' is the amount of life signals that were not acknowledged in time
+
+        """
+        return getattr(self.connection, 'latency_stats', {})
 
     async def edit(self, **kwargs) -> bool:
         """`openhivenpy.HivenClient.edit()`
@@ -403,6 +497,24 @@ class HivenClient(EventHandler):
         # Connection Object contains inherited Client data => edit() stored there
         return await self.connection.edit(**kwargs)
 
+    async def replay(self, path: str, *, speed: float = None) -> dict:
+        """`openhivenpy.HivenClient.replay()`
+
+        Replays a recording of the Swarm frames offline through the cache and the event handler.
+        Can not be used while the client is connected!
+
+        Alias for HivenClient.connection.replay()
+
+        Parameter:
+        ----------
+
+        path: `str` - Path to the recording of `record_frames`
+
+        speed: `float` - Factor of the recorded pace. Defaults to None which replays as fast as possible
+
+        """
+        return await self.connection.replay(path, speed=speed)
+
     async def fetch_room(self, room_id: int) -> Union[types.Room, None]:
         """`openhivenpy.HivenClient.getRoom()`
         
@@ -485,14 +597,14 @@ class HivenClient(EventHandler):
         try:
             cached_user = utils.get(self.users, id=user_id)
             if cached_user:
-                raw_data = await self.connection.http.request(endpoint=f"/users/{id}")
+                raw_data = await self.connection.http.request(endpoint=f"/users/{user_id}")
                 if raw_data:
                     data = raw_data.get('data')
                     if data:
-                        user = types.User(data, self.connection.http)
-                        self.connection._users.remove(cached_user)
-                        self.connection._users.append(user)
-                        return user
+                        # Patching the cached user in-place => References to it stay up-to-date
+                        if cached_user._update(data):
+                            self.connection._users.reindex(cached_user)
+                        return cached_user
                     else:
                         logger.warning("[CLIENT] Failed to request user data from the Hiven-API!")
                         return cached_user
@@ -524,11 +636,12 @@ class HivenClient(EventHandler):
                 if raw_data:
                     data = raw_data.get('data')
                     if data:
-                        room = types.Room(data, self.connection.http, house)
-                        # Appending the data to the client cache
-                        self.connection._rooms.remove(cached_room)
-                        self.connection._rooms.append(room)
-                        return room
+                        # Patching the cached room in-place => The room of the house is the same object
+                        if cached_room._update(data):
+                            self.connection._rooms.reindex(cached_room)
+                            if house is not None:
+                                house._rooms.reindex(cached_room)
+                        return cached_room
                     else:
                         logger.warning("[CLIENT] Failed to request room data from the Hiven-API!")
                         return cached_room
@@ -558,11 +671,10 @@ class HivenClient(EventHandler):
                 if raw_data:
                     data = raw_data.get('data')
                     if data:
-                        room = types.PrivateRoom(data, self.connection.http)
-                        # Appending the data to the client cache
-                        self.connection._private_rooms.remove(cached_private_room)
-                        self.connection._private_rooms.append(room)
-                        return room
+                        # Patching the cached room in-place => References to it stay up-to-date
+                        if cached_private_room._update(data):
+                            self.connection._private_rooms.reindex(cached_private_room)
+                        return cached_private_room
                     else:
                         logger.warning("[CLIENT] Failed to request private_room data from the Hiven-API!")
                         return cached_private_room
@@ -805,8 +917,13 @@ class HivenClient(EventHandler):
                 raw_data = await resp.json()
                 data = raw_data.get('data')
                 if data:
-                    private_room = types.PrivateRoom(data, self.connection.http)
-                    self.connection._private_rooms.append(private_room)
+                    # The private room with the user might already be cached => Patching it in-place
+                    private_room = self.connection._private_rooms.get(int(data.get('id', 0)))
+                    if private_room is None:
+                        private_room = types.PrivateRoom(data, self.connection.http)
+                        self.connection._private_rooms.upsert(private_room)
+                    elif private_room._update(data):
+                        self.connection._private_rooms.reindex(private_room)
                     return private_room
                 else:
                     raise errs.HTTPReceivedNoData()
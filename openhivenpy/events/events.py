@@ -57,6 +57,20 @@ class EventHandler:
             func_name='on_connection_start'
         )
 
+    async def ev_disconnect(self) -> None:
+        await dispatch_func_if_exists(
+            obj=self._call_obj,
+            func_name='on_disconnect'
+        )
+
+    async def ev_reconnect(self, time) -> None:
+        param = [time]
+        await dispatch_func_if_exists(
+            obj=self._call_obj,
+            func_name='on_reconnect',
+            func_args=param
+        )
+
     async def ev_init_state(self, time) -> None:
         param = [time]
         await dispatch_func_if_exists(
@@ -121,6 +135,30 @@ class EventHandler:
             func_args=param
         )
 
+    async def ev_private_room_add(self, room) -> None:
+        param = [room]
+        await dispatch_func_if_exists(
+            obj=self._call_obj,
+            func_name='on_private_room_add',
+            func_args=param
+        )
+
+    async def ev_private_room_update(self, room) -> None:
+        param = [room]
+        await dispatch_func_if_exists(
+            obj=self._call_obj,
+            func_name='on_private_room_update',
+            func_args=param
+        )
+
+    async def ev_private_room_remove(self, room) -> None:
+        param = [room]
+        await dispatch_func_if_exists(
+            obj=self._call_obj,
+            func_name='on_private_room_remove',
+            func_args=param
+        )
+
     async def ev_presence_update(self, presence, user) -> None:
         param = [presence, user]
         await dispatch_func_if_exists(
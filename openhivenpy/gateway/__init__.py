@@ -32,4 +32,8 @@ SOFTWARE.
 
 from .ws import Websocket
 from .http import HTTP
-from .connection import Connection
\ No newline at end of file
+from .connection import Connection
+from .connector import create_connector
+from .retry import RetryPolicy, CircuitBreaker
+from .heartbeat import HeartbeatMonitor
+from .recorder import FrameRecorder, FrameReplay
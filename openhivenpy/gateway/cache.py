@@ -0,0 +1,208 @@
+import collections
+import fnmatch
+import logging
+import time
+from typing import Optional
+
+from .ratelimit import route_template
+
+__all__ = ['DEFAULT_TTLS', 'CacheEntry', 'ResponseCache']
+
+logger = logging.getLogger(__name__)
+
+# Seconds the responses of an endpoint family stay valid. The keys are patterns for the route
+# template of the endpoint (see `openhivenpy.gateway.ratelimit.route_template()`)
+# => Endpoints that do not match any pattern are not cached
+DEFAULT_TTLS = {
+    '/users/@me': 60.0,
+    '/users/{id}': 300.0,
+    '/houses/{id}/users/{id}': 60.0,
+    '/rooms/{id}': 60.0,
+    '/invites/*': 300.0
+}
+
+
+class CacheEntry:
+    """`openhivenpy.gateway.cache.CacheEntry`
+
+    Cached response data of a single endpoint
+    """
+    __slots__ = ('data', 'etag', 'last_modified', 'expires_at')
+
+    def __init__(self, data: dict, etag: Optional[str], last_modified: Optional[str], expires_at: float):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    def __repr__(self) -> str:
+        info = [
+            ('fresh', self.fresh),
+            ('etag', self.etag),
+            ('last_modified', self.last_modified)
+        ]
+        return '<CacheEntry {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    @property
+    def validators(self) -> dict:
+        """ Headers for the conditional revalidation of the entry """
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """`openhivenpy.gateway.cache.ResponseCache`
+
+    LRU cache for the responses of GET requests
+
+    Entries are valid for the TTL of their endpoint family. Expired entries are kept if the server
+    sent an ETag or Last-Modified header so the HTTP client can revalidate them with a conditional
+    request and only needs to download the data again if it changed.
+
+    Note! The cached data is shared between all callers and must not be modified!
+
+    Parameter:
+    ----------
+
+    max_size: `int` - Maximum amount of stored responses. The least recently used response is removed
+                      if the cache is full. Defaults to `512`
+
+    ttls: `dict` - TTLs in seconds for the route patterns that should be cached. Defaults to `DEFAULT_TTLS`
+
+    """
+    def __init__(self, max_size: int = 512, ttls: Optional[dict] = None):
+        self.max_size = max_size
+        self._ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._route_ttls = {}  # Resolved TTL of every route template
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    def __repr__(self) -> str:
+        return '<ResponseCache size={} max_size={}>'.format(len(self), self.max_size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, endpoint: str) -> bool:
+        return endpoint in self._entries
+
+    @property
+    def ttls(self) -> dict:
+        return dict(self._ttls)
+
+    @property
+    def stats(self) -> dict:
+        """ Amount of hits, misses and revalidated responses """
+        return {
+            'size': len(self),
+            'hits': self._hits,
+            'misses': self._misses,
+            'revalidations': self._revalidations
+        }
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        """`openhivenpy.gateway.cache.ResponseCache.ttl()`
+
+        Returns the TTL of the endpoint or None if the endpoint is not cached
+
+        :param endpoint: Endpoint in url format '/../../..'
+        """
+        route = route_template(endpoint)
+        try:
+            return self._route_ttls[route]
+        except KeyError:
+            ttl = None
+            for pattern, _ttl in self._ttls.items():
+                if fnmatch.fnmatchcase(route, pattern):
+                    ttl = _ttl
+                    break
+            self._route_ttls[route] = ttl
+            return ttl
+
+    def get(self, endpoint: str) -> Optional[CacheEntry]:
+        """`openhivenpy.gateway.cache.ResponseCache.get()`
+
+        Returns the entry of the endpoint. The entry can be expired and needs to be
+        revalidated if `CacheEntry.fresh` is False
+
+        :param endpoint: Endpoint in url format '/../../..'
+        """
+        entry = self._entries.get(endpoint)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(endpoint)
+        if entry.fresh:
+            self._hits += 1
+        else:
+            self._misses += 1
+        return entry
+
+    def put(self, endpoint: str, data: dict, headers) -> bool:
+        """`openhivenpy.gateway.cache.ResponseCache.put()`
+
+        Stores the response data of the endpoint if the endpoint is cached
+
+        Returns True if the data was stored
+
+        :param endpoint: Endpoint in url format '/../../..'
+        :param data: Decoded JSON data of the response
+        :param headers: Headers of the response
+        """
+        ttl = self.ttl(endpoint)
+        if ttl is None or 'no-store' in headers.get('Cache-Control', ''):
+            return False
+
+        self._entries[endpoint] = CacheEntry(data=data,
+                                             etag=headers.get('ETag'),
+                                             last_modified=headers.get('Last-Modified'),
+                                             expires_at=time.monotonic() + ttl)
+        self._entries.move_to_end(endpoint)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return True
+
+    def refresh(self, endpoint: str, headers) -> Optional[CacheEntry]:
+        """`openhivenpy.gateway.cache.ResponseCache.refresh()`
+
+        Marks the entry of the endpoint as valid again after the server responded with 304
+
+        :param endpoint: Endpoint in url format '/../../..'
+        :param headers: Headers of the 304 response
+        """
+        entry = self._entries.get(endpoint)
+        if entry is not None:
+            entry.expires_at = time.monotonic() + (self.ttl(endpoint) or 0.0)
+            entry.etag = headers.get('ETag', entry.etag)
+            entry.last_modified = headers.get('Last-Modified', entry.last_modified)
+            self._revalidations += 1
+        return entry
+
+    def invalidate(self, endpoint: str) -> bool:
+        """`openhivenpy.gateway.cache.ResponseCache.invalidate()`
+
+        Removes the entry of the endpoint
+
+        Returns True if an entry was removed
+
+        :param endpoint: Endpoint in url format '/../../..'
+        """
+        return self._entries.pop(endpoint, None) is not None
+
+    def clear(self) -> None:
+        """`openhivenpy.gateway.cache.ResponseCache.clear()`
+
+        Removes all entries
+        """
+        self._entries.clear()
@@ -0,0 +1,126 @@
+import json
+import logging
+from typing import Any, Optional, Union
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+__all__ = ['loads', 'dumps', 'use', 'backend', 'available_backends', 'HivenResponse']
+
+logger = logging.getLogger(__name__)
+
+# Preferred order => The first available backend will be used by default
+_BACKENDS = ('orjson', 'ujson', 'json')
+
+_backend = None
+
+
+def _orjson_dumps(obj: Any) -> str:
+    # orjson returns bytes but the websocket and aiohttp expect a string
+    return orjson.dumps(obj).decode('utf-8')
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def available_backends() -> tuple:
+    """`openhivenpy.gateway.codec.available_backends()`
+
+    Returns the names of all JSON backends that are installed in the preferred order
+    """
+    installed = {'orjson': orjson is not None, 'ujson': ujson is not None, 'json': True}
+    return tuple(name for name in _BACKENDS if installed[name])
+
+
+def use(name: Optional[str] = None) -> str:
+    """`openhivenpy.gateway.codec.use()`
+
+    Sets the JSON backend that is used for decoding and encoding the Swarm frames and HTTP bodies.
+
+    :param name: Name of the backend ('orjson', 'ujson' or 'json'). If None the fastest installed
+                 backend will be used
+    :return: The name of the backend that is now used
+    """
+    global loads, dumps, _backend
+
+    if name is None:
+        name = available_backends()[0]
+    elif name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}'! Expected one of {_BACKENDS}")
+    elif name not in available_backends():
+        raise ValueError(f"JSON backend '{name}' is not installed!")
+
+    if name == 'orjson':
+        loads, dumps = orjson.loads, _orjson_dumps
+    elif name == 'ujson':
+        loads, dumps = ujson.loads, ujson.dumps
+    else:
+        loads, dumps = json.loads, _json_dumps
+
+    _backend = name
+    logger.debug(f"[CODEC] Using '{name}' for decoding and encoding JSON data")
+    return name
+
+
+def backend() -> str:
+    """`openhivenpy.gateway.codec.backend()`
+
+    Returns the name of the JSON backend that is currently used
+    """
+    return _backend
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """`openhivenpy.gateway.codec.loads()`
+
+    Decodes the passed JSON data with the currently used backend
+    """
+    # Replaced by use() with the function of the backend
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """`openhivenpy.gateway.codec.dumps()`
+
+    Encodes the passed object to a JSON string with the currently used backend
+    """
+    # Replaced by use() with the function of the backend
+    return _json_dumps(obj)
+
+
+def _decode(data: Union[str, bytes]) -> Any:
+    # Wrapper to always use the current backend even if it was changed after the import
+    return loads(data)
+
+
+class HivenResponse(aiohttp.ClientResponse):
+    """`openhivenpy.gateway.codec.HivenResponse`
+
+    ClientResponse that stores the decoded JSON body
+
+    The body is decoded once by the HTTP client when it checks the response and `json()`
+    returns the stored data afterwards instead of decoding the body a second time.
+    """
+    _decoded_json = None
+
+    async def json(self, *, loads=None, **kwargs) -> Any:
+        if loads is not None:
+            # Custom decoder => Not using the stored data
+            return await super().json(loads=loads, **kwargs)
+
+        if self._decoded_json is None:
+            self._decoded_json = await super().json(loads=_decode, **kwargs)
+        return self._decoded_json
+
+
+use()
@@ -0,0 +1,85 @@
+import logging
+import zlib
+from typing import Optional
+
+__all__ = ['COMPRESSIONS', 'ZLIB_SUFFIX', 'ZlibStreamDecoder']
+
+logger = logging.getLogger(__name__)
+
+# Compression of the Swarm frames => Value of the compression parameter of the websocket url
+COMPRESSIONS = ('text_json', 'zlib_stream')
+
+# Every complete frame of a zlib stream ends with the marker of a sync flush
+ZLIB_SUFFIX = b'\x00\x00\xff\xff'
+
+
+class ZlibStreamDecoder:
+    """`openhivenpy.gateway.compression.ZlibStreamDecoder`
+
+    Decoder for the zlib-stream compressed frames of a websocket connection
+
+    All frames of a connection share one zlib stream, so the inflater is kept for the whole connection
+    and already sent data like repeating keys and ids is not sent again. A frame can be split across
+    several websocket messages and is only inflated after its last message, which ends with the sync
+    flush marker `ZLIB_SUFFIX`.
+
+    A new decoder has to be used for every new connection!
+    """
+    def __init__(self):
+        self._inflater = zlib.decompressobj()
+        self._buffer = bytearray()
+        self._messages = 0
+        self._frames = 0
+        self._compressed = 0
+        self._inflated = 0
+
+    def __repr__(self) -> str:
+        info = [
+            ('frames', self._frames),
+            ('buffered', len(self._buffer)),
+            ('ratio', round(self.ratio, 2))
+        ]
+        return '<ZlibStreamDecoder {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def ratio(self) -> float:
+        """ Ratio of the inflated to the received bytes """
+        return self._inflated / self._compressed if self._compressed else 0.0
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'messages': self._messages,
+            'frames': self._frames,
+            'compressed_bytes': self._compressed,
+            'inflated_bytes': self._inflated,
+            'buffered_bytes': len(self._buffer),
+            'ratio': self.ratio
+        }
+
+    def feed(self, data: bytes) -> Optional[bytes]:
+        """`openhivenpy.gateway.compression.ZlibStreamDecoder.feed()`
+
+        Adds a received message to the stream
+
+        Returns the inflated frame if the message completed it, else None
+
+        :param data: Binary data of the websocket message
+        """
+        self._messages += 1
+        self._compressed += len(data)
+
+        if not self._buffer and data[-4:] == ZLIB_SUFFIX:
+            # Frame in a single message => No need to copy it into the buffer
+            inflated = self._inflater.decompress(data)
+        else:
+            self._buffer.extend(data)
+            if self._buffer[-4:] != ZLIB_SUFFIX:
+                # The frame continues in the next message
+                return None
+            inflated = self._inflater.decompress(self._buffer)
+            self._buffer.clear()
+
+        self._frames += 1
+        self._inflated += len(inflated)
+        return inflated
@@ -1,3 +1,4 @@
+import aiohttp
 import asyncio
 import logging
 import sys
@@ -8,6 +9,8 @@ import os
 import openhivenpy.exceptions as errs
 from openhivenpy.events import EventHandler
 from . import Websocket, HTTP
+from . import codec
+from .connector import create_connector
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +22,33 @@ def _get_connection_args(**kwargs):
         "host": kwargs.get('host', os.environ.get("HIVEN_HOST")),
         "api_version": kwargs.get('api_version', os.environ.get("HIVEN_API_VERSION")),
         "heartbeat": kwargs.get('heartbeat', int(os.environ.get("CONNECTION_HEARTBEAT"))),
+        "heartbeat_timeout": kwargs.get('heartbeat_timeout', float(os.environ.get("HEARTBEAT_TIMEOUT", 10))),
         "close_timeout": kwargs.get('close_timeout', int(os.environ.get("CLOSE_TIMEOUT"))),
+        "event_queue_size": kwargs.get('event_queue_size', int(os.environ.get("EVENT_QUEUE_SIZE", 1000))),
+        "event_workers": kwargs.get('event_workers', int(os.environ.get("EVENT_WORKERS", 4))),
+        "compression": kwargs.get('compression', os.environ.get("GATEWAY_COMPRESSION", "text_json")),
+        "reconnect": kwargs.get('reconnect', True),
+        "reconnect_attempts": kwargs.get('reconnect_attempts', int(os.environ.get("RECONNECT_ATTEMPTS", 10))),
+        "record_frames": kwargs.get('record_frames'),
+        "rate_limit_retries": kwargs.get('rate_limit_retries', int(os.environ.get("RATE_LIMIT_RETRIES", 3))),
+        "http_retries": kwargs.get('http_retries', int(os.environ.get("HTTP_RETRIES", 3))),
+        "retry_policy": kwargs.get('retry_policy'),
+        "circuit_breaker_threshold": kwargs.get('circuit_breaker_threshold',
+                                                int(os.environ.get("CIRCUIT_BREAKER_THRESHOLD", 5))),
+        "circuit_breaker_timeout": kwargs.get('circuit_breaker_timeout',
+                                              float(os.environ.get("CIRCUIT_BREAKER_TIMEOUT", 30))),
+        "circuit_breaker": kwargs.get('circuit_breaker'),
+        "response_cache": kwargs.get('response_cache', False),
+        "response_cache_size": kwargs.get('response_cache_size', int(os.environ.get("RESPONSE_CACHE_SIZE", 512))),
+        "response_cache_ttls": kwargs.get('response_cache_ttls'),
+        "instrumentation": kwargs.get('instrumentation', False),
+        "connection_limit": kwargs.get('connection_limit', int(os.environ.get("CONNECTION_LIMIT", 100))),
+        "connection_limit_per_host": kwargs.get('connection_limit_per_host',
+                                                int(os.environ.get("CONNECTION_LIMIT_PER_HOST", 0))),
+        "keepalive_timeout": kwargs.get('keepalive_timeout', float(os.environ.get("KEEPALIVE_TIMEOUT", 15))),
+        "dns_cache_ttl": kwargs.get('dns_cache_ttl', int(os.environ.get("DNS_CACHE_TTL", 10))),
+        "connector": kwargs.get('connector'),
+        "gateway_connector": kwargs.get('gateway_connector'),
         "event_loop": kwargs.get('event_loop'),
         "log_ws_output": kwargs.get('log_ws_output', False)
     }
@@ -243,7 +272,6 @@ class ExecutionLoop:
         def decorator(__func):
             @wraps(__func)
             async def wrapper(*args, **kwargs):
-                await asyncio.sleep(0.05)
                 return await __func(*args, **kwargs)
 
             setattr(self._startup_tasks_handler, __func.__name__, wrapper)
@@ -282,11 +310,78 @@ class Connection(Websocket):
                     Will throw `HivenException.InvalidToken` if length not 128, is None or is empty
     
     heartbeat: `int` - Intervals in which the bot will send life signals to the Websocket. Defaults to `30000`
+
+    heartbeat_timeout: `float` - Seconds Hiven has to acknowledge a life signal. If it is not acknowledged the
+                                 connection is considered dead and reconnected. Defaults to `10`
     
     log_ws_output: `bool` - Will additionally to normal debug information also log the ws responses
     
     close_timeout: `int` -  Seconds after the websocket will timeout after the end handshake
                             didn't complete successfully. Defaults to `40`
+
+    event_queue_size: `int` - Maximum amount of received events waiting for processing. If the queue is full
+                              the websocket stops reading until events were processed. Defaults to `1000`
+
+    event_workers: `int` - Amount of workers that process the received events. Events of the same room or house
+                           are processed in the order they were received. Defaults to `4`
+
+    compression: `str` - Compression of the Swarm frames. 'text_json' for uncompressed text frames or
+                         'zlib_stream' for binary frames that are compressed with one zlib stream for the whole
+                         connection. Defaults to `'text_json'`
+
+    reconnect: `bool` - If set to True the websocket reconnects with exponential backoff over the same session if
+                        the connection was lost after the client was initialized. The cache is kept and refreshed
+                        with the data of the new connection. Defaults to `True`
+
+    reconnect_attempts: `int` - Amount of failed reconnect attempts in a row after which the connection is closed.
+                                Defaults to `10`
+
+    record_frames: `str` - Path of a file the received Swarm frames are recorded to as gzip compressed JSONL. The
+                           recording can be replayed offline with `replay()`. Defaults to `None`
+
+    rate_limit_retries: `int` - Amount of times a request is sent again after it was rejected because of the
+                                rate-limit. Defaults to `3`
+
+    http_retries: `int` - Amount of times an idempotent HTTP request is sent again after a server error, timeout
+                          or connection error. Defaults to `3`
+
+    retry_policy: `openhivenpy.gateway.RetryPolicy` - Retry policy that should be used instead of the default one
+                                                      with `http_retries`
+
+    circuit_breaker_threshold: `int` - Amount of failed HTTP requests in a row after which all requests fail
+                                       immediately while Hiven is down. Defaults to `5`
+
+    circuit_breaker_timeout: `float` - Seconds until a request is sent again to test if Hiven is reachable.
+                                       Defaults to `30`
+
+    circuit_breaker: `openhivenpy.gateway.CircuitBreaker` - Circuit breaker that should be used instead of the
+                                                            default one. Can be shared between clients
+
+    instrumentation: `bool` - If set to True latencies, status codes, transferred bytes and queue waiting times
+                              of the HTTP requests are collected per route. See `HTTP.instrumentation`.
+                              Defaults to `False`
+
+    connection_limit: `int` - Maximum amount of simultaneously open HTTP connections. 0 means no limit.
+                              Defaults to `100`
+
+    connection_limit_per_host: `int` - Maximum amount of simultaneously open HTTP connections to the same host.
+                                       0 means no limit. Defaults to `0`
+
+    keepalive_timeout: `float` - Seconds an idle connection is kept open for the next request. Defaults to `15`
+
+    dns_cache_ttl: `int` - Seconds the resolved address of a host is cached. Defaults to `10`
+
+    connector: `aiohttp.TCPConnector` - Connector for the HTTP requests that should be used instead of creating
+                                        one. Can be shared between several clients and is not closed by them.
+                                        See `openhivenpy.gateway.create_connector()`
+
+    gateway_connector: `aiohttp.TCPConnector` - Connector for the websocket that should be used instead of
+                                                creating one. Can be shared like `connector`
+
+    response_cache: `bool` - If set to True the responses of GET requests for users, members, rooms and invites
+                             are cached and revalidated with conditional requests. Defaults to `False`
+
+    response_cache_size: `int` - Maximum amount of cached responses. Defaults to `512`
     
     event_loop: `asyncio.AbstractEventLoop` - Event loop that will be used to execute all async functions.
     
@@ -397,16 +492,20 @@ class Connection(Websocket):
             # Connection Start variable for later calculation the time how long it took to start
             self._connection_start = time.time()
             self._connection_status = "OPENING"
+            self._reset_readiness()
 
             self._event_loop = event_loop
             # Creating a new HTTP session!
-            self._http = HTTP(loop=event_loop, token=self._token, **self._init_args)
+            self._http = HTTP(loop=event_loop, token=self._token, client=self, **self._init_args)
 
             # Starting the HTTP Connection to Hiven
             session = await self._http.connect()
             if session:
+                # The websocket uses its own session and connector => Not affected by the HTTP connection limit
+                gateway_session = self._create_gateway_session()
+
                 # Running ws_connect and the execution_loop in the background
-                await asyncio.gather(self.ws_connect(session), self._execution_loop.start())
+                await asyncio.gather(self.ws_connect(gateway_session), self._execution_loop.start())
             else:
                 msg = "[CONNECTION] Failed to get connected Client data!"
                 logger.critical(msg)
@@ -444,11 +543,7 @@ class Connection(Websocket):
                         " Destroying current processes and gateway connection!")
             self._connection_status = "CLOSING"
 
-            if not self._lifesignal.cancelled():
-                self._lifesignal.cancel()
-
-            if not self._connection.cancelled():
-                self._connection.cancel()
+            self._cancel_connection_tasks()
 
             if exec_loop:
                 await self._execution_loop.stop()
@@ -487,16 +582,14 @@ class Connection(Websocket):
             if kwargs.get('restart', False) is False:
                 self._restart = False
 
-            if not self._lifesignal.cancelled():
-                self._lifesignal.cancel()
-
-            if not self._connection.cancelled():
-                self._connection.cancel()
+            self._cancel_connection_tasks()
 
             if exec_loop:
                 await self._execution_loop.stop()
 
             await self.http.close()
+            if self.ws_session is not None and not self.ws_session.closed:
+                await self.ws_session.close()
 
             self._connection_status = "CLOSED"
             self._initialized = False
@@ -508,6 +601,34 @@ class Connection(Websocket):
                 f"[CONNECTION] Closing the connection to Hiven failed! > {sys.exc_info()[1].__class__.__name__}, {str(e)}")
             raise errs.UnableToClose(e)
 
+    def _cancel_connection_tasks(self) -> None:
+        """
+        Cancels the lifesignal and the websocket connection if they are running. The connection task is not
+        cancelled if it is the caller since it closes the connection itself after it stopped reconnecting
+        """
+        for task in (self._lifesignal, self._ws_task, self._connection):
+            if task is None or task.done():
+                continue
+            if task is asyncio.current_task():
+                continue
+            task.cancel()
+
+    def _create_gateway_session(self) -> aiohttp.ClientSession:
+        """`openhivenpy.gateway.Connection._create_gateway_session()`
+
+        Creates the session for the websocket. Uses the passed gateway_connector or a connector that
+        only keeps the connection to the Swarm (and a new one while reconnecting) open
+        """
+        connector = self._init_args.get('gateway_connector')
+        if connector is not None:
+            # Shared connector => Owned by the user and not closed with the session
+            return aiohttp.ClientSession(connector=connector, connector_owner=False, json_serialize=codec.dumps)
+
+        connector = create_connector(limit=2,
+                                     keepalive_timeout=self._init_args.get('keepalive_timeout'),
+                                     dns_cache_ttl=self._init_args.get('dns_cache_ttl'))
+        return aiohttp.ClientSession(connector=connector, json_serialize=codec.dumps)
+
     # Restarts the connection if it errored or crashed
     async def handler_restart_websocket(self):
         """`openhivenpy.gateway.Connection.handler_restart_websocket()`
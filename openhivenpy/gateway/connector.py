@@ -0,0 +1,49 @@
+import logging
+import os
+from typing import Optional
+
+import aiohttp
+
+__all__ = ['create_connector']
+
+logger = logging.getLogger(__name__)
+
+_default_connection_limit = int(os.getenv("CONNECTION_LIMIT", 100))
+_default_connection_limit_per_host = int(os.getenv("CONNECTION_LIMIT_PER_HOST", 0))
+_default_keepalive_timeout = float(os.getenv("KEEPALIVE_TIMEOUT", 15))
+_default_dns_cache_ttl = int(os.getenv("DNS_CACHE_TTL", 10))
+
+
+def create_connector(*,
+                     limit: Optional[int] = None,
+                     limit_per_host: Optional[int] = None,
+                     keepalive_timeout: Optional[float] = None,
+                     dns_cache_ttl: Optional[int] = None) -> aiohttp.TCPConnector:
+    """`openhivenpy.gateway.create_connector()`
+
+    Creates a TCPConnector with the connection pool settings of the client
+
+    The connector can be passed as `connector` to several clients in the same process so they share
+    their pool of open connections. A passed connector is not closed by the clients and has to be
+    closed with `await connector.close()` after all clients were closed.
+
+    Has to be called inside the running event loop!
+
+    Parameter:
+    ----------
+
+    limit: `int` - Maximum amount of simultaneously open connections. 0 means no limit. Defaults to `100`
+
+    limit_per_host: `int` - Maximum amount of simultaneously open connections to the same host.
+                            0 means no limit. Defaults to `0`
+
+    keepalive_timeout: `float` - Seconds an idle connection is kept open for the next request. Defaults to `15`
+
+    dns_cache_ttl: `int` - Seconds the resolved address of a host is cached. Defaults to `10`
+
+    """
+    return aiohttp.TCPConnector(
+        limit=_default_connection_limit if limit is None else limit,
+        limit_per_host=_default_connection_limit_per_host if limit_per_host is None else limit_per_host,
+        keepalive_timeout=_default_keepalive_timeout if keepalive_timeout is None else keepalive_timeout,
+        ttl_dns_cache=_default_dns_cache_ttl if dns_cache_ttl is None else dns_cache_ttl)
@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Optional
+
+__all__ = ['HeartbeatMonitor']
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatMonitor:
+    """`openhivenpy.gateway.heartbeat.HeartbeatMonitor`
+
+    Tracks the heartbeats of a websocket connection and the time until they were acknowledged
+
+    Every heartbeat is sent with a numbered websocket ping and the matching pong acknowledges it. The
+    latencies of the last acknowledged heartbeats are kept in a rolling window for the percentiles.
+    A heartbeat that is not acknowledged within the timeout counts as missed and means the connection
+    is likely dead even if TCP did not notice it yet.
+
+    The monitor can be paused while the pongs can not be read, like when the reader waits for a full
+    event lane. The paused time does not count towards the timeout and heartbeats that were pending
+    during a pause are not added to the latencies, since their pong was read late.
+    """
+    def __init__(self, window: int = 100):
+        self._latencies = deque(maxlen=max(int(window), 1))
+        self._seq = 0
+        self._pending = {}
+        self._ack_event = None
+        self._sent = 0
+        self._acked = 0
+        self._missed = 0
+        self._last_ack = None
+        self._paused_since = None
+        self._paused_total = 0.0
+
+    def __repr__(self) -> str:
+        info = [
+            ('latency', round(self.latency * 1000, 1) if self.latency is not None else None),
+            ('sent', self._sent),
+            ('acked', self._acked),
+            ('missed', self._missed)
+        ]
+        return '<HeartbeatMonitor {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def latency(self) -> Optional[float]:
+        """ Seconds until the last heartbeat was acknowledged. None if no heartbeat was acknowledged yet """
+        return self._latencies[-1] if self._latencies else None
+
+    @property
+    def pending(self) -> int:
+        """ Amount of heartbeats that were sent but not acknowledged yet """
+        return len(self._pending)
+
+    @property
+    def paused(self) -> bool:
+        """ True if the acknowledgements can currently not be read """
+        return self._paused_since is not None
+
+    def _paused_time(self) -> float:
+        # Paused seconds since the creation of the monitor including the current pause
+        if self._paused_since is not None:
+            return self._paused_total + time.monotonic() - self._paused_since
+        return self._paused_total
+
+    @property
+    def last_ack(self) -> Optional[float]:
+        """ Monotonic time of the last acknowledged heartbeat """
+        return self._last_ack
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """`openhivenpy.gateway.heartbeat.HeartbeatMonitor.percentile()`
+
+        Returns the latency percentile in seconds over the rolling window. None if no heartbeat was
+        acknowledged yet
+
+        :param percentile: Percentile between 0 and 100
+        """
+        if not self._latencies:
+            return None
+        latencies = sorted(self._latencies)
+        index = min(int(len(latencies) * percentile / 100), len(latencies) - 1)
+        return latencies[index]
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'latency': self.latency,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'samples': len(self._latencies),
+            'sent': self._sent,
+            'acked': self._acked,
+            'missed': self._missed,
+            'pending': len(self._pending)
+        }
+
+    def reset(self) -> None:
+        """`openhivenpy.gateway.heartbeat.HeartbeatMonitor.reset()`
+
+        Discards the pending heartbeats of the last connection. The latencies are kept
+        """
+        self._pending.clear()
+        self.resume()
+
+    def pause(self) -> None:
+        """`openhivenpy.gateway.heartbeat.HeartbeatMonitor.pause()`
+
+        Stops the timeout of the pending heartbeats until `resume()` is called
+        """
+        if self._paused_since is None:
+            self._paused_since = time.monotonic()
+
+    def resume(self) -> Optional[float]:
+        """`openhivenpy.gateway.heartbeat.HeartbeatMonitor.resume()`
+
+        Continues the timeout of the pending heartbeats. Returns the seconds the monitor was paused or
+        None if it was not paused
+        """
+        if self._paused_since is None:
+            return None
+        paused = time.monotonic() - self._paused_since
+        self._paused_total += paused
+        self._paused_since = None
+        if self._ack_event is not None:
+            # Wakes up the waiting lifesignal to recalculate its deadline
+            self._ack_event.set()
+        return paused
+
+    def send(self) -> bytes:
+        """`openhivenpy.gateway.heartbeat.HeartbeatMonitor.send()`
+
+        Registers a new heartbeat and returns the payload for the websocket ping that is acknowledged by it
+        """
+        self._seq += 1
+        now = time.monotonic()
+        self._pending[self._seq] = (now, self._paused_time())
+        self._sent += 1
+        return str(self._seq).encode('ascii')
+
+    def ack(self, payload: bytes) -> Optional[float]:
+        """`openhivenpy.gateway.heartbeat.HeartbeatMonitor.ack()`
+
+        Acknowledges the heartbeat of the received pong. Returns its latency in seconds or None if the pong
+        does not belong to a pending heartbeat
+
+        :param payload: Payload of the received pong
+        """
+        try:
+            sent, paused = self._pending.pop(int(payload))
+        except (ValueError, KeyError):
+            return None
+
+        now = time.monotonic()
+        latency = now - sent
+        # Older heartbeats are acknowledged as well => The pongs are sent in order
+        for seq in [seq for seq in self._pending if seq < int(payload)]:
+            del self._pending[seq]
+
+        if self._paused_time() == paused:
+            self._latencies.append(latency)
+        self._acked += 1
+        self._last_ack = now
+        if self._ack_event is not None:
+            self._ack_event.set()
+        return latency
+
+    async def wait_for_ack(self, timeout: float) -> bool:
+        """`openhivenpy.gateway.heartbeat.HeartbeatMonitor.wait_for_ack()`
+
+        Waits until all pending heartbeats were acknowledged. Returns False and counts the heartbeat as
+        missed if the timeout was reached. The time the monitor is paused is not counted
+
+        :param timeout: Seconds to wait for the acknowledgement
+        """
+        deadline = time.monotonic() + timeout
+        paused = self._paused_time()
+        if self._ack_event is None:
+            self._ack_event = asyncio.Event()
+
+        while self._pending:
+            self._ack_event.clear()
+            if self._paused_since is not None:
+                # Waiting until the pongs can be read again
+                await self._ack_event.wait()
+                continue
+
+            remaining = deadline + self._paused_time() - paused - time.monotonic()
+            if remaining <= 0:
+                self._missed += 1
+                return False
+            try:
+                await asyncio.wait_for(self._ack_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+        return True
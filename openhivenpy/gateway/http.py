@@ -1,20 +1,80 @@
 import aiohttp
 import asyncio
+import functools
 import logging
+import os
 import sys
 import time
-import json as json_decoder
 from typing import Optional, Union
 
 import openhivenpy.exceptions as errs
+from . import codec
+from .cache import CacheEntry, ResponseCache
+from .connector import create_connector
+from .instrumentation import HTTPInstrumentation
+from .ratelimit import RateLimiter
+from .retry import RETRY_STATUSES, CircuitBreaker, RetryPolicy
 
 __all__ = 'HTTP'
 
 logger = logging.getLogger(__name__)
 
+_default_rate_limit_retries = int(os.getenv("RATE_LIMIT_RETRIES", 3))
+_default_response_cache_size = int(os.getenv("RESPONSE_CACHE_SIZE", 512))
+_default_http_retries = int(os.getenv("HTTP_RETRIES", 3))
+_default_circuit_breaker_threshold = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", 5))
+_default_circuit_breaker_timeout = float(os.getenv("CIRCUIT_BREAKER_TIMEOUT", 30))
+
 request_url_format = "https://{0}/{1}"
 
 
+def _create_debug_trace_config() -> aiohttp.TraceConfig:
+    """ Returns a TraceConfig that logs the course of every request """
+    async def on_request_start(session, trace_config_ctx, params):
+        logger.debug(f"[HTTP] >> Request with HTTP {params.method} started at {time.time()}")
+        logger.debug(f"[HTTP] >> URL >> {params.url}")
+
+    async def on_request_end(session, trace_config_ctx, params):
+        logger.debug(f"[HTTP] << Request with HTTP {params.method} finished!")
+        logger.debug(f"[HTTP] << Header << {params.headers}")
+        logger.debug(f"[HTTP] << URL << {params.url}")
+        logger.debug(f"[HTTP] << Response << {params.response}")
+
+    async def on_request_exception(session, trace_config_ctx, params):
+        logger.debug(f"[HTTP] << An exception occurred while executing the request")
+
+    async def on_request_redirect(session, trace_config_ctx, params):
+        logger.debug(f"[HTTP] << REDIRECTING with URL {params.url} and HTTP {params.method}")
+
+    async def on_response_chunk_received(session, trace_config_ctx, params):
+        logger.debug(f"[HTTP] << Chunk Received << {params.chunk}\n")
+
+    async def on_connection_queued_start(session, trace_config_ctx, params):
+        # The params of this signal contain no request data
+        logger.debug("[HTTP] >> Request queued! Connection limit was reached")
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    trace_config.on_request_redirect.append(on_request_redirect)
+    trace_config.on_connection_queued_start.append(on_connection_queued_start)
+    trace_config.on_response_chunk_received.append(on_response_chunk_received)
+    return trace_config
+
+
+def _body_size(kwargs: dict) -> int:
+    """ Returns the size of the body that is sent with the passed request parameters """
+    if kwargs.get('json') is not None:
+        return len(codec.dumps(kwargs['json']).encode('utf-8'))
+    data = kwargs.get('data')
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    elif isinstance(data, (bytes, bytearray)):
+        return len(data)
+    return 0
+
+
 class HTTP:
     """`openhivenpy.gateway`
     
@@ -33,6 +93,53 @@ class HTTP:
     api_version: `str` - Version string for the API Version. Defaults to 'v1' 
     
     token: `str` - Needed for the authorization to Hiven.
+
+    client: `openhivenpy.types.Client` - Client the HTTP belongs to. Used to access the client user without
+                                         requesting it
+
+    rate_limit_retries: `int` - Amount of times a request is sent again after it was rejected because of the
+                                rate-limit. Defaults to `3`
+
+    http_retries: `int` - Amount of times an idempotent request is sent again after a server error, timeout or
+                          connection error. Defaults to `3`
+
+    retry_policy: `openhivenpy.gateway.RetryPolicy` - Policy that should be used instead of the default one
+                                                      with `http_retries`
+
+    circuit_breaker_threshold: `int` - Amount of failed requests in a row after which all requests fail
+                                       immediately while Hiven is down. Defaults to `5`
+
+    circuit_breaker_timeout: `float` - Seconds until a request is sent again to test if Hiven is reachable.
+                                       Defaults to `30`
+
+    circuit_breaker: `openhivenpy.gateway.CircuitBreaker` - Circuit breaker that should be used instead of the
+                                                            default one. Can be shared between clients
+
+    response_cache: `bool` - If set to True the responses of GET requests for users, members, rooms and invites
+                             are cached and revalidated with conditional requests. Defaults to `False`
+
+    response_cache_size: `int` - Maximum amount of cached responses. Defaults to `512`
+
+    response_cache_ttls: `dict` - TTLs in seconds for the cached endpoint families.
+                                  Defaults to `openhivenpy.gateway.cache.DEFAULT_TTLS`
+
+    instrumentation: `bool` - If set to True latencies, status codes, transferred bytes and queue waiting times
+                              of the requests are collected per route. An existing
+                              `openhivenpy.gateway.instrumentation.HTTPInstrumentation` can be passed as well.
+                              Defaults to `False`
+
+    connection_limit: `int` - Maximum amount of simultaneously open connections. 0 means no limit. Defaults to `100`
+
+    connection_limit_per_host: `int` - Maximum amount of simultaneously open connections to the same host.
+                                       0 means no limit. Defaults to `0`
+
+    keepalive_timeout: `float` - Seconds an idle connection is kept open for the next request. Defaults to `15`
+
+    dns_cache_ttl: `int` - Seconds the resolved address of a host is cached. Defaults to `10`
+
+    connector: `aiohttp.TCPConnector` - Connector that should be used instead of creating one with the settings
+                                        above. Can be shared between clients and is not closed by the client.
+                                        See `openhivenpy.gateway.create_connector()`
     
     event_loop: `asyncio.AbstractEventLoop` - Event loop that will be used to execute all async functions.
     
@@ -50,9 +157,50 @@ class HTTP:
         self._ready = False
         self._session = None  # Will be created during start of connection
         self._event_loop = loop
+        self._client = kwargs.get('client')
+
+        # Connection pool settings => The connector is created with the session
+        self._connector = kwargs.get('connector')
+        self._connector_args = {
+            'limit': kwargs.get('connection_limit'),
+            'limit_per_host': kwargs.get('connection_limit_per_host'),
+            'keepalive_timeout': kwargs.get('keepalive_timeout'),
+            'dns_cache_ttl': kwargs.get('dns_cache_ttl')
+        }
+
+        # Requests are queued per route until the rate-limit of the route resets
+        self._rate_limiter = RateLimiter()
+        self._rate_limit_retries = kwargs.get('rate_limit_retries', _default_rate_limit_retries)
+
+        # Failed requests are sent again with backoff and fail immediately while Hiven is down
+        self._retry_policy = kwargs.get('retry_policy')
+        if self._retry_policy is None:
+            self._retry_policy = RetryPolicy(max_retries=kwargs.get('http_retries', _default_http_retries))
+        self._circuit_breaker = kwargs.get('circuit_breaker')
+        if self._circuit_breaker is None:
+            self._circuit_breaker = CircuitBreaker(
+                threshold=kwargs.get('circuit_breaker_threshold', _default_circuit_breaker_threshold),
+                timeout=kwargs.get('circuit_breaker_timeout', _default_circuit_breaker_timeout))
+
+        # Opt-in => The responses are only cached if enabled
+        if kwargs.get('response_cache', False):
+            self._response_cache = ResponseCache(
+                max_size=kwargs.get('response_cache_size', _default_response_cache_size),
+                ttls=kwargs.get('response_cache_ttls'))
+        else:
+            self._response_cache = None
+
+        # Opt-in => The metrics are only collected if enabled. An existing instance can be passed to share it
+        instrumentation = kwargs.get('instrumentation', False)
+        if isinstance(instrumentation, HTTPInstrumentation):
+            self._instrumentation = instrumentation
+        elif instrumentation:
+            self._instrumentation = HTTPInstrumentation()
+        else:
+            self._instrumentation = None
 
-        # Last/Currently executed request
-        self._request = None
+        # In-flight GET requests that identical requests can share
+        self._pending_gets = {}
 
     def __str__(self) -> str:
         return str(repr(self))
@@ -78,44 +226,58 @@ class HTTP:
     def event_loop(self):
         return self._event_loop
 
-    async def connect(self) -> Union[aiohttp.ClientSession, None]:
-        """`openhivenpy.gateway.HTTP.connect()`
+    @property
+    def client(self):
+        return self._client
 
-        Establishes for the HTTP a connection to Hiven
-        
-        """
-        try:
-            async def on_request_start(session, trace_config_ctx, params):
-                logger.debug(f"[HTTP] >> Request with HTTP {params.method} started at {time.time()}")
-                logger.debug(f"[HTTP] >> URL >> {params.url}")
+    @property
+    def client_user(self):
+        """ User of the client if it was already received with INIT_STATE else None """
+        return getattr(self._client, '_USER', None)
 
-            async def on_request_end(session, trace_config_ctx, params):
-                logger.debug(f"[HTTP] << Request with HTTP {params.method} finished!")
-                logger.debug(f"[HTTP] << Header << {params.headers}")
-                logger.debug(f"[HTTP] << URL << {params.url}")
-                logger.debug(f"[HTTP] << Response << {params.response}")
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
 
-            async def on_request_exception(session, trace_config_ctx, params):
-                logger.debug(f"[HTTP] << An exception occurred while executing the request")
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
 
-            async def on_request_redirect(session, trace_config_ctx, params):
-                logger.debug(f"[HTTP] << REDIRECTING with URL {params.url} and HTTP {params.method}")
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._circuit_breaker
 
-            async def on_response_chunk_received(session, trace_config_ctx, params):
-                logger.debug(f"[HTTP] << Chunk Received << {params.chunk}\n")
+    @property
+    def instrumentation(self) -> Optional[HTTPInstrumentation]:
+        return self._instrumentation
 
-            async def on_connection_queued_start(session, trace_config_ctx, params):
-                logger.debug(f"[HTTP] >> HTTP {params.method} with {params.url} queued!")
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        return self._response_cache
+
+    async def connect(self) -> Union[aiohttp.ClientSession, None]:
+        """`openhivenpy.gateway.HTTP.connect()`
 
-            trace_config = aiohttp.TraceConfig()
-            trace_config.on_request_start.append(on_request_start)
-            trace_config.on_request_end.append(on_request_end)
-            trace_config.on_request_exception.append(on_request_exception)
-            trace_config.on_request_redirect.append(on_request_redirect)
-            trace_config.on_connection_queued_start.append(on_connection_queued_start)
-            trace_config.on_response_chunk_received.append(on_response_chunk_received)
+        Establishes for the HTTP a connection to Hiven
+        
+        """
+        try:
+            # Tracing slows down every request => Only installed if the debug output is actually logged
+            trace_configs = []
+            if logger.isEnabledFor(logging.DEBUG):
+                trace_configs.append(_create_debug_trace_config())
+
+            if self._connector is not None:
+                # Shared connector => Owned by the user and not closed with the session
+                connector, connector_owner = self._connector, False
+            else:
+                connector, connector_owner = create_connector(**self._connector_args), True
 
-            self._session = aiohttp.ClientSession(trace_configs=[trace_config])
+            self._session = aiohttp.ClientSession(trace_configs=trace_configs,
+                                                  connector=connector,
+                                                  connector_owner=connector_owner,
+                                                  response_class=codec.HivenResponse,
+                                                  json_serialize=codec.dumps)
             self._ready = True
 
             resp = await self.request("/users/@me", timeout=10)
@@ -158,6 +320,9 @@ class HTTP:
         
         Returns the raw ClientResponse object
         
+        Failed requests are sent again as allowed by the retry policy. While the circuit breaker is open
+        the request is not sent and `None` is returned immediately.
+        
         Parameter:
         ----------
         
@@ -178,94 +343,162 @@ class HTTP:
         
         """
 
-        # Timeout Handler that watches if the request takes too long
-        async def _time_out_handler(_timeout: float) -> None:
-            start_time = time.time()
-            timeout_limit = start_time + _timeout
-            while True:
-                if self._request.done():
-                    break
-                elif time.time() > timeout_limit:
-                    if not self._request.cancelled():
-                        self._request.cancel()
-                    logger.error(f"[HTTP] >> FAILED HTTP '{method.upper()}' with endpoint: "
-                                 f"{endpoint}; Request to Hiven timed out!")
-                    break
-                await asyncio.sleep(0.25)
+        if not self._ready:
+            logger.error(f"[HTTP] << The HTTPClient was not ready when trying to perform request with "
+                         f"HTTP {method}! The session is either not initialized or closed!")
             return None
 
-        async def _request(endpoint, method, **kwargs):
-            # Deactivated because of errors that occurred using it!
-            _timeout = aiohttp.ClientTimeout(total=None)
-            if self._ready:
-                try:
-                    if kwargs.get('headers') is None:
-                        headers = self.headers
-                    else:
-                        headers = kwargs.pop('headers')
-                    url = f"{self.api_url}{endpoint}"
-                    async with self.session.request(
-                            method=method,
-                            url=url,
-                            headers=headers,
-                            timeout=_timeout,
-                            **kwargs) as resp:
-                        http_code = resp.status  # HTTP Code Response
-                        data = await resp.read()  # Raw Text data
-
-                        if data:
-                            _json_data = json_decoder.loads(data)
-                            _success = _json_data.get('success')
-
-                            if _success:
-                                logger.debug(f"[HTTP] {http_code} -> Request was successful and received expected data!")
-                            else:
-                                _error = _json_data.get('error')
-                                if _error:
-                                    err_code = _error.get('code')  # Error-Code
-                                    err_msg = _error.get('message')  # Error-Msg
-                                    logger.error(f"[HTTP] Failed HTTP request '{method.upper()}'! {http_code} -> "
-                                                 f"'{err_code}': '{err_msg}'")
-                                else:
-                                    logger.error(f"[HTTP] Failed HTTP request '{method.upper()}'! {http_code} -> "
-                                                 f"Response: None")
-                        else:
-                            if http_code == 204:
-                                logger.warning("[HTTP] Received empty response!")
-                            else:
-                                logger.error("[HTTP] Received empty response!")
-
-                        return resp
-
-                except Exception as e:
-                    logger.error(f"[HTTP] << FAILED HTTP '{method.upper()}' with endpoint: {endpoint}; "
-                                 f"{sys.exc_info()[1].__class__.__name__}, {str(e)}")
+        # Every request has its own timeout => Concurrent requests do not affect each other
+        _timeout = aiohttp.ClientTimeout(total=timeout)
+        headers = kwargs.pop('headers', None)
+        if headers is None:
+            headers = self.headers
+
+        policy = self._retry_policy
+        breaker = self._circuit_breaker
+        policy.record_request()
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                # Hiven is down => Failing immediately instead of waiting for the timeout
+                logger.debug(f"[HTTP] << Skipped HTTP '{method.upper()}' with endpoint: {endpoint}; "
+                             f"Circuit breaker is open for another {breaker.retry_after:.2f}s")
+                return None
 
+            resp = error = None
+            try:
+                resp = await self._perform(endpoint, method, headers, _timeout, **kwargs)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                error = e
+            except Exception as e:
+                logger.error(f"[HTTP] << FAILED HTTP '{method.upper()}' with endpoint: {endpoint}; "
+                             f"{sys.exc_info()[1].__class__.__name__}, {str(e)}")
+                return None
+            finally:
+                if resp is None and error is None:
+                    # Cancelled or failed before reaching Hiven => Says nothing about the state of the API
+                    breaker.release()
+
+            if error is not None or resp.status in RETRY_STATUSES:
+                breaker.record_failure()
             else:
-                logger.error(f"[HTTP] << The HTTPClient was not ready when trying to perform request with "
-                             f"HTTP {method}! The session is either not initialized or closed!")
+                breaker.record_success()
+
+            if policy.retryable(method, status=None if resp is None else resp.status, exception=error) \
+                    and policy.acquire_retry(attempt):
+                delay = policy.backoff(attempt)
+                attempt += 1
+                reason = resp.status if resp is not None else error.__class__.__name__
+                logger.warning(f"[HTTP] {reason} -> HTTP '{method.upper()}' with endpoint {endpoint} failed! "
+                               f"Retry {attempt}/{policy.max_retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if isinstance(error, asyncio.TimeoutError):
+                logger.error(f"[HTTP] >> FAILED HTTP '{method.upper()}' with endpoint: "
+                             f"{endpoint}; Request to Hiven timed out!")
+                return None
+            elif error is not None:
+                logger.error(f"[HTTP] << FAILED HTTP '{method.upper()}' with endpoint: {endpoint}; "
+                             f"{error.__class__.__name__}, {str(error)}")
                 return None
+            return resp
 
-        # Creating two tasks for the request and the timeout handler
-        self._request = asyncio.create_task(_request(endpoint, method, **kwargs))
-        _task_time_out_handler = asyncio.create_task(_time_out_handler(timeout))
+    async def _perform(
+            self,
+            endpoint: str,
+            method: str,
+            headers: dict,
+            timeout: aiohttp.ClientTimeout,
+            **kwargs) -> aiohttp.ClientResponse:
+        """ Sends a single attempt of `raw_request()` within the rate-limit of the route and checks the response """
+        bucket = self._rate_limiter.get_bucket(endpoint)
+        url = f"{self.api_url}{endpoint}"
+        stats = None
+        if self._instrumentation is not None:
+            stats = self._instrumentation.get(bucket.route)
+            bytes_out = _body_size(kwargs)
+        attempt = 0
+        while True:
+            # Waiting until the rate-limit of the route allows another request
+            queued_at = time.perf_counter()
+            await bucket.acquire()
+            sent_at = time.perf_counter()
+            if stats is not None:
+                stats.record_queue_wait(sent_at - queued_at)
+            try:
+                resp = await self.session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout,
+                    **kwargs)
+                if stats is not None:
+                    stats.record_response(resp.status, time.perf_counter() - sent_at, bytes_out)
+                if resp.status == 429 and attempt < self._rate_limit_retries:
+                    retry_after = bucket.limited(resp.headers)
+                else:
+                    retry_after = None
+                    bucket.update(resp.headers)
+            except Exception:
+                if stats is not None:
+                    stats.record_error(bytes_out)
+                raise
+            finally:
+                bucket.release()
+
+            if retry_after is None:
+                break
+            resp.release()
+            attempt += 1
+            logger.warning(f"[HTTP] 429 -> Rate-limited on route '{bucket.route}'! "
+                           f"Retrying in {retry_after:.2f}s")
+
+        async with resp:
+            http_code = resp.status  # HTTP Code Response
+            data = await resp.read()  # Raw Text data
+            if stats is not None:
+                stats.bytes_in += len(data)
+
+            if data:
+                try:
+                    _json_data = codec.loads(data)
+                except ValueError:
+                    if http_code not in RETRY_STATUSES:
+                        raise
+                    # Error page of a proxy in front of Hiven => No data
+                    _json_data = {}
+
+                # Decoding the body once and storing it in the response so resp.json()
+                # does not need to decode it again
+                resp._decoded_json = _json_data
+                _success = _json_data.get('success')
+
+                if _success:
+                    logger.debug(f"[HTTP] {http_code} -> Request was successful and received expected data!")
+                else:
+                    _error = _json_data.get('error')
+                    if _error:
+                        err_code = _error.get('code')  # Error-Code
+                        err_msg = _error.get('message')  # Error-Msg
+                        logger.error(f"[HTTP] Failed HTTP request '{method.upper()}'! {http_code} -> "
+                                     f"'{err_code}': '{err_msg}'")
+                    else:
+                        logger.error(f"[HTTP] Failed HTTP request '{method.upper()}'! {http_code} -> "
+                                     f"Response: None")
+            else:
+                if http_code == 304:
+                    logger.debug("[HTTP] 304 -> Cached response is still valid!")
+                elif http_code == 204:
+                    logger.warning("[HTTP] Received empty response!")
+                else:
+                    logger.error("[HTTP] Received empty response!")
 
-        try:
-            # Running the tasks parallel to ensure the timeout handler can fetch the timout correctly!
-            resp = await asyncio.gather(self._request, _task_time_out_handler)
-        except asyncio.CancelledError:
-            logger.warning(f"[HTTP] >> Request was cancelled!")
-            return
-        except Exception as e:
-            logger.error(f"[HTTP] >> FAILED HTTP '{method.upper()}' with endpoint: {self.host}{endpoint}; "
-                         f"{sys.exc_info()[1].__class__.__name__}, {str(e)}")
-            raise errs.HTTPError(f"An error occurred while performing HTTP '{method.upper()}' with endpoint: "
-                                 f"{self.host}{endpoint}; {sys.exc_info()[1].__class__.__name__}, {str(e)}")
+            if self._response_cache is not None and method.upper() != "GET" and http_code < 300:
+                # The cached response of the modified endpoint is outdated
+                self._response_cache.invalidate(endpoint)
 
-        # Updating the last request object
-        self._request = resp[0]
-        # Returning the response obj on index 0
-        return resp[0]
+            return resp
 
     async def request(self, endpoint: str, *, json: dict = None, timeout: float = 15, **kwargs) -> Union[dict, None]:
         """`openhivenpy.gateway.HTTP.request()`
@@ -273,6 +506,12 @@ class HTTP:
         Wrapped HTTP request for a specified endpoint. 
         
         Returns a python dictionary containing the response data if successful and else returns `None`
+
+        Concurrent requests of the same endpoint without custom headers or parameters share one in-flight
+        request and all receive its result. If the response cache is enabled the cached data of the endpoint
+        is returned as long as it is valid. Expired data is revalidated with a conditional request.
+
+        Note! The returned data can be shared with other callers and must not be modified!
         
         Parameter:
         ----------
@@ -291,15 +530,55 @@ class HTTP:
                         See https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientSession for more info
         
         """
+        entry = None
+        if self._response_cache is not None and not kwargs:
+            entry = self._response_cache.get(endpoint)
+            if entry is not None and entry.fresh:
+                return entry.data
+
+        if kwargs:
+            # Custom headers or parameters => Not identical to other requests of the endpoint
+            return await self._get(endpoint, None, timeout, **kwargs)
+
+        # Identical GETs share the request that is already in-flight instead of sending their own
+        task = self._pending_gets.get(endpoint)
+        if task is None:
+            task = asyncio.ensure_future(self._get(endpoint, entry, timeout))
+            task.add_done_callback(functools.partial(self._pending_get_done, endpoint))
+            self._pending_gets[endpoint] = task
+        # Shielded => A cancelled caller does not cancel the request of the other callers
+        return await asyncio.shield(task)
+
+    async def _get(self, endpoint: str, entry: Optional[CacheEntry], timeout: float, **kwargs) -> Union[dict, None]:
+        """ Performs the GET request of `request()` and revalidates the passed expired cache entry """
+        cache = self._response_cache
+        # Requests with custom headers or parameters are not cached
+        cacheable = cache is not None and not kwargs
+        if entry is not None and entry.validators:
+            # Revalidating the expired response => The server only sends the data if it changed
+            kwargs['headers'] = {**self.headers, **entry.validators}
+
         resp = await self.raw_request(endpoint, method="GET", timeout=timeout, **kwargs)
-        if resp is not None and resp.status < 300:
-            if resp.status < 300 and resp.status != 204:
-                return await resp.json()
-            else:
-                return None
+        if resp is None:
+            return None
+        elif resp.status == 304 and entry is not None:
+            cache.refresh(endpoint, resp.headers)
+            return entry.data
+        elif resp.status < 300 and resp.status != 204:
+            data = await resp.json()
+            if cacheable and data and data.get('success'):
+                cache.put(endpoint, data, resp.headers)
+            return data
         else:
             return None
 
+    def _pending_get_done(self, endpoint: str, task: asyncio.Future) -> None:
+        if self._pending_gets.get(endpoint) is task:
+            del self._pending_gets[endpoint]
+        if not task.cancelled():
+            # Marking the exception as retrieved in case all callers were cancelled
+            task.exception()
+
     async def post(self, endpoint: str, *, json: dict = None, timeout: float = 15, **kwargs) -> aiohttp.ClientResponse:
         """`openhivenpy.gateway.HTTP.post()`
 
@@ -0,0 +1,189 @@
+import bisect
+import logging
+from typing import Optional
+
+__all__ = ['LatencyHistogram', 'RouteStats', 'HTTPInstrumentation']
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency buckets in milliseconds. Latencies above the last bound are counted separately
+LATENCY_BOUNDS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """`openhivenpy.gateway.instrumentation.LatencyHistogram`
+
+    Histogram of latencies in milliseconds with fixed buckets
+
+    Recording a latency only increments a counter, so the memory usage stays the same for any amount
+    of requests. Percentiles are estimated with the upper bound of the bucket they fall into.
+    """
+    __slots__ = ('bounds', 'counts', 'count', 'total', 'max')
+
+    def __init__(self, bounds: tuple = LATENCY_BOUNDS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __repr__(self) -> str:
+        info = [
+            ('count', self.count),
+            ('mean', round(self.mean, 2)),
+            ('p50', self.percentile(50)),
+            ('p99', self.percentile(99))
+        ]
+        return '<LatencyHistogram {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """`openhivenpy.gateway.instrumentation.LatencyHistogram.percentile()`
+
+        Returns the estimated latency in milliseconds that the passed percent of the requests did not exceed
+
+        :param percent: Percent between 0 and 100
+        """
+        if not self.count:
+            return None
+        rank = percent / 100 * self.count
+        seen = 0
+        for i, amount in enumerate(self.counts):
+            seen += amount
+            if seen >= rank and amount:
+                # The last bucket has no upper bound => The highest latency is the best estimate
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'buckets': dict(zip(self.bounds + ('inf',), self.counts))
+        }
+
+
+class RouteStats:
+    """`openhivenpy.gateway.instrumentation.RouteStats`
+
+    Collected metrics of a single route template
+    """
+    __slots__ = ('route', 'requests', 'errors', 'statuses', 'latency', 'bytes_in', 'bytes_out',
+                 'queue_wait', 'queue_wait_max')
+
+    def __init__(self, route: str):
+        self.route = route
+        self.requests = 0
+        self.errors = 0
+        self.statuses = {}
+        self.latency = LatencyHistogram()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        # Seconds the requests waited in the queue of the rate-limit
+        self.queue_wait = 0.0
+        self.queue_wait_max = 0.0
+
+    def __repr__(self) -> str:
+        info = [
+            ('route', self.route),
+            ('requests', self.requests),
+            ('errors', self.errors),
+            ('statuses', self.statuses),
+            ('latency', self.latency)
+        ]
+        return '<RouteStats {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    def record_queue_wait(self, seconds: float) -> None:
+        self.queue_wait += seconds
+        if seconds > self.queue_wait_max:
+            self.queue_wait_max = seconds
+
+    def record_response(self, status: int, seconds: float, bytes_out: int) -> None:
+        self.requests += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.latency.record(seconds * 1000)
+        self.bytes_out += bytes_out
+
+    def record_error(self, bytes_out: int) -> None:
+        self.requests += 1
+        self.errors += 1
+        self.bytes_out += bytes_out
+
+    def to_dict(self) -> dict:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'statuses': dict(self.statuses),
+            'latency': self.latency.to_dict(),
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'queue_wait': self.queue_wait,
+            'queue_wait_max': self.queue_wait_max
+        }
+
+
+class HTTPInstrumentation:
+    """`openhivenpy.gateway.instrumentation.HTTPInstrumentation`
+
+    Collects per route the latencies, status codes, transferred bytes and queue waiting times of the
+    HTTP requests
+
+    Opt-in with `instrumentation=True` of the client. The metrics are recorded by the HTTP client itself
+    and not with an aiohttp TraceConfig, since already an empty TraceConfig slows down every request.
+    The latency is measured from sending the request until the headers of the response were received and
+    the transferred bytes are the sizes of the bodies.
+
+    Usage:
+
+    .. code-block:: python
+
+        client = openhivenpy.UserClient(token, instrumentation=True)
+        ...
+        print(client.connection.http.instrumentation.snapshot())
+
+    """
+    def __init__(self):
+        self._routes = {}
+
+    def __repr__(self) -> str:
+        return '<HTTPInstrumentation routes={}>'.format(len(self._routes))
+
+    @property
+    def routes(self) -> dict:
+        """ Collected RouteStats mapped by their route template """
+        return dict(self._routes)
+
+    def get(self, route: str) -> RouteStats:
+        """`openhivenpy.gateway.instrumentation.HTTPInstrumentation.get()`
+
+        Returns the RouteStats of the passed route template and creates them if they do not exist yet
+        """
+        stats = self._routes.get(route)
+        if stats is None:
+            stats = self._routes[route] = RouteStats(route)
+        return stats
+
+    def snapshot(self) -> dict:
+        """`openhivenpy.gateway.instrumentation.HTTPInstrumentation.snapshot()`
+
+        Returns the metrics of all routes as dictionary mapped by their route template
+        """
+        return {route: stats.to_dict() for route, stats in self._routes.items()}
+
+    def reset(self) -> None:
+        """ Removes all collected metrics """
+        self._routes.clear()
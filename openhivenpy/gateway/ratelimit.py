@@ -0,0 +1,289 @@
+import asyncio
+import collections
+import email.utils
+import logging
+import re
+import time
+from typing import Optional
+
+__all__ = ['route_template', 'RateLimitBucket', 'RateLimiter']
+
+logger = logging.getLogger(__name__)
+
+# Ids in Hiven are numeric strings => Every numeric path segment is an id
+_ID_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def route_template(endpoint: str) -> str:
+    """`openhivenpy.gateway.ratelimit.route_template()`
+
+    Returns the route template of the passed endpoint with every id replaced by '{id}'
+
+    Example: '/rooms/1234/messages?before=5678' -> '/rooms/{id}/messages'
+
+    :param endpoint: Endpoint in url format '/../../..'
+    """
+    return _ID_SEGMENT.sub("{id}", endpoint.split('?', 1)[0])
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """ Parses the Retry-After header which is either in seconds or a HTTP-date """
+    seconds = _parse_float(value)
+    if seconds is not None or value is None:
+        return seconds
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitBucket:
+    """`openhivenpy.gateway.ratelimit.RateLimitBucket`
+
+    Rate-limit state of a single route template
+
+    Requests acquire a slot of the bucket before they are sent and release it after they finished.
+    If the bucket has no remaining requests left the waiting requests are queued and released in
+    their order as soon as the bucket resets. Until the first response of the route was received
+    only a single request is sent to discover the limit. If the server sends no rate-limit
+    information for the route the bucket does not limit the requests.
+    """
+    def __init__(self, route: str):
+        self.route = route
+        self._limit = None
+        self._remaining = None
+        self._reset_at = None  # Loop time when the bucket resets => None if not known yet
+        self._last_reset = 0.0
+        self._in_flight = 0
+        self._discovered = False
+        self._waiters = collections.deque()
+        self._reset_handle = None
+
+    def __repr__(self) -> str:
+        info = [
+            ('route', self.route),
+            ('limit', self.limit),
+            ('remaining', self.remaining),
+            ('waiting', self.waiting)
+        ]
+        return '<RateLimitBucket {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def limit(self) -> Optional[int]:
+        return self._limit
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return self._remaining
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def reset_after(self) -> float:
+        """ Seconds until the bucket resets """
+        if self._reset_at is None:
+            return 0.0
+        return max(self._reset_at - asyncio.get_event_loop().time(), 0.0)
+
+    async def acquire(self) -> None:
+        """`openhivenpy.gateway.ratelimit.RateLimitBucket.acquire()`
+
+        Waits until the bucket has a remaining request left and takes it
+        """
+        loop = asyncio.get_event_loop()
+        # Requests that are already waiting go first => Queue if someone is waiting
+        if not self._waiters and self._try_take(loop):
+            return
+
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        self._schedule_reset(loop)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif not waiter.cancelled():
+                # Already released => Passing the taken slot to the next waiting request
+                if self._remaining is not None:
+                    self._remaining += 1
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """`openhivenpy.gateway.ratelimit.RateLimitBucket.release()`
+
+        Marks an acquired request as finished. Has to be called after the response
+        was passed to `update()` or if the request failed
+        """
+        loop = asyncio.get_event_loop()
+        self._in_flight = max(self._in_flight - 1, 0)
+        if self._in_flight == 0 and self._remaining is not None and self._remaining <= 0 \
+                and self._reset_at is None:
+            # None of the responses contained the reset => Assuming the bucket can be used again
+            self._refill(loop)
+        self._release_waiters(loop)
+
+    def update(self, headers) -> None:
+        """`openhivenpy.gateway.ratelimit.RateLimitBucket.update()`
+
+        Updates the bucket with the rate-limit headers of a response
+
+        :param headers: Headers of the received response
+        """
+        loop = asyncio.get_event_loop()
+        self._discovered = True
+
+        limit = _parse_float(headers.get('X-RateLimit-Limit'))
+        remaining = _parse_float(headers.get('X-RateLimit-Remaining'))
+        reset_after = _parse_float(headers.get('X-RateLimit-Reset-After'))
+        if reset_after is None:
+            reset = _parse_float(headers.get('X-RateLimit-Reset'))
+            if reset is not None:
+                # Either an epoch timestamp in seconds/milliseconds or the seconds until the reset
+                if reset > 1e12:
+                    reset /= 1000
+                reset_after = reset - time.time() if reset > 1e9 else reset
+
+        reset_at = None if reset_after is None else loop.time() + max(reset_after, 0.0)
+        # Responses of requests that were sent before the last reset can arrive later and contain
+        # the state of the previous window => Ignoring their remaining count
+        if reset_at is None or reset_at > self._last_reset:
+            if limit is not None:
+                self._limit = int(limit)
+            if remaining is not None:
+                # Responses can arrive in a different order => Never increasing the count inside a window
+                remaining = int(remaining)
+                self._remaining = remaining if self._remaining is None else min(self._remaining, remaining)
+            if reset_at is not None:
+                self._reset_at = reset_at if self._reset_at is None else max(self._reset_at, reset_at)
+
+        retry_after = _parse_retry_after(headers.get('Retry-After'))
+        if retry_after is not None:
+            self._block(loop, retry_after)
+
+        if self._remaining is not None and self._remaining <= 0:
+            self._schedule_reset(loop)
+        else:
+            self._release_waiters(loop)
+
+    def limited(self, headers) -> float:
+        """`openhivenpy.gateway.ratelimit.RateLimitBucket.limited()`
+
+        Marks the bucket as exhausted after the server rejected a request with 429
+
+        Returns the seconds until the bucket resets and the request can be sent again
+
+        :param headers: Headers of the received 429 response
+        """
+        loop = asyncio.get_event_loop()
+        self.update(headers)
+        if self._reset_at is None or self._reset_at <= loop.time():
+            # No information about the reset => Waiting a second before trying again
+            self._block(loop, 1.0)
+        else:
+            self._block(loop, 0.0)
+        return self.reset_after
+
+    def _block(self, loop: asyncio.AbstractEventLoop, seconds: float) -> None:
+        reset_at = loop.time() + max(seconds, 0.0)
+        self._remaining = 0
+        self._reset_at = reset_at if self._reset_at is None else max(self._reset_at, reset_at)
+        self._schedule_reset(loop)
+
+    def _refill(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._last_reset = loop.time() if self._reset_at is None else self._reset_at
+        self._remaining = self._limit
+        # The reset of the new window is only known after the next response
+        self._reset_at = None
+
+    def _try_take(self, loop: asyncio.AbstractEventLoop) -> bool:
+        if self._remaining is not None and self._remaining <= 0 \
+                and self._reset_at is not None and self._reset_at <= loop.time():
+            # Reset time passed => Bucket is full again
+            self._refill(loop)
+
+        if self._remaining is None:
+            # Only a single request until the first response was received
+            if not self._discovered and self._in_flight:
+                return False
+        elif self._remaining > 0:
+            self._remaining -= 1
+        else:
+            return False
+        self._in_flight += 1
+        return True
+
+    def _schedule_reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._reset_at is None or not self._waiters:
+            return
+        if self._reset_handle is not None:
+            if self._reset_handle.when() <= self._reset_at:
+                # Reschedules itself if the reset was moved
+                return
+            self._reset_handle.cancel()
+        self._reset_handle = loop.call_at(self._reset_at, self._reset, loop)
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._reset_handle = None
+        if self._reset_at is None:
+            # Already reset => Waiting for the next response or the release of a request
+            return
+        elif self._reset_at > loop.time():
+            # The reset was moved by a later response
+            self._schedule_reset(loop)
+            return
+        self._refill(loop)
+        self._release_waiters(loop)
+
+    def _release_waiters(self, loop: asyncio.AbstractEventLoop) -> None:
+        while self._waiters:
+            if self._waiters[0].done():
+                # Cancelled while waiting
+                self._waiters.popleft()
+                continue
+            if not self._try_take(loop):
+                self._schedule_reset(loop)
+                return
+            self._waiters.popleft().set_result(None)
+
+
+class RateLimiter:
+    """`openhivenpy.gateway.ratelimit.RateLimiter`
+
+    Stores the rate-limit buckets of the HTTP client keyed by the route template
+    of the requested endpoint like '/rooms/{id}/messages'
+    """
+    def __init__(self):
+        self._buckets = {}
+
+    def __repr__(self) -> str:
+        return '<RateLimiter buckets={}>'.format(len(self._buckets))
+
+    @property
+    def buckets(self) -> dict:
+        return dict(self._buckets)
+
+    def get_bucket(self, endpoint: str) -> RateLimitBucket:
+        """`openhivenpy.gateway.ratelimit.RateLimiter.get_bucket()`
+
+        Returns the bucket of the route the endpoint belongs to. Creates it if it does not exist yet
+
+        :param endpoint: Endpoint in url format '/../../..'
+        """
+        route = route_template(endpoint)
+        bucket = self._buckets.get(route)
+        if bucket is None:
+            bucket = self._buckets[route] = RateLimitBucket(route)
+        return bucket
@@ -0,0 +1,260 @@
+import asyncio
+import base64
+import gzip
+import logging
+import time
+from typing import Iterator, Optional, Union
+
+from aiohttp import WSMessage, WSMsgType
+
+from . import codec
+
+__all__ = ['FrameRecorder', 'FrameReplay', 'read_frames']
+
+logger = logging.getLogger(__name__)
+
+# Message that is returned by the replay after the last frame of a recorded connection
+_CLOSED_MESSAGE = WSMessage(WSMsgType.CLOSED, None, None)
+
+
+class FrameRecorder:
+    """`openhivenpy.gateway.recorder.FrameRecorder`
+
+    Writes the raw frames received from the Swarm to a gzip compressed JSONL file
+
+    Every line is one entry with the seconds since the start of the recording in 't' and its kind in 'k':
+
+    - 'open': A new connection was opened. Contains the compression of the connection in 'c'
+    - 'text': Text frame with the data in 'd'
+    - 'binary': Binary frame with the base64 encoded data in 'd'
+
+    The frames are recorded before they are inflated or decoded, so a recording of a zlib-stream
+    connection can only be replayed from the start of the connection.
+
+    Only the first `open()` overwrites an existing file. If the recorder is opened again after it was
+    closed, like after a restart of the connection, the frames are appended as new gzip member.
+    """
+    def __init__(self, path: str):
+        self._path = path
+        self._file = None
+        self._start = None
+        self._opened = False
+        self._frames = 0
+        self._bytes = 0
+
+    def __repr__(self) -> str:
+        info = [
+            ('path', self._path),
+            ('frames', self._frames),
+            ('closed', self.closed)
+        ]
+        return '<FrameRecorder {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def frames(self) -> int:
+        """ Amount of recorded frames """
+        return self._frames
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'frames': self._frames,
+            'bytes': self._bytes,
+            'duration': time.monotonic() - self._start if self._start is not None else 0.0
+        }
+
+    def open(self) -> None:
+        """`openhivenpy.gateway.recorder.FrameRecorder.open()`
+
+        Opens the file of the recording. An existing file is overwritten when the recorder is opened for the
+        first time, afterwards the frames are appended to keep the frames that were already recorded
+        """
+        if self._file is None:
+            self._file = gzip.open(self._path, 'at' if self._opened else 'wt', encoding='utf-8')
+            if self._start is None:
+                # The times of the appended frames continue the times of the recording
+                self._start = time.monotonic()
+            self._opened = True
+
+    def close(self) -> None:
+        """`openhivenpy.gateway.recorder.FrameRecorder.close()`
+
+        Flushes and closes the file of the recording
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, entry: dict) -> None:
+        if self._file is None:
+            self.open()
+        entry['t'] = round(time.monotonic() - self._start, 6)
+        self._file.write(codec.dumps(entry))
+        self._file.write('\n')
+
+    def record_open(self, compression: str) -> None:
+        """`openhivenpy.gateway.recorder.FrameRecorder.record_open()`
+
+        Records the start of a new connection
+
+        :param compression: Compression of the frames of the connection
+        """
+        self._write({'k': 'open', 'c': compression})
+
+    def record(self, data: Union[str, bytes]) -> None:
+        """`openhivenpy.gateway.recorder.FrameRecorder.record()`
+
+        Records a received frame with the current time
+
+        :param data: Data of the text or binary frame
+        """
+        if isinstance(data, str):
+            self._write({'k': 'text', 'd': data})
+        else:
+            self._write({'k': 'binary', 'd': base64.b64encode(data).decode('ascii')})
+        self._frames += 1
+        self._bytes += len(data)
+
+
+def read_frames(path: str) -> Iterator[dict]:
+    """`openhivenpy.gateway.recorder.read_frames()`
+
+    Reads the entries of a recording lazily. The data of binary frames is returned as bytes
+
+    :param path: Path to the recording of the FrameRecorder
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            entry = codec.loads(line)
+            if entry.get('k') == 'binary':
+                entry['d'] = base64.b64decode(entry['d'])
+            yield entry
+
+
+class FrameReplay:
+    """`openhivenpy.gateway.recorder.FrameReplay`
+
+    Replays a recording of the FrameRecorder as a websocket that can be read by the response handler
+
+    Every recorded connection is replayed on its own: `next_connection()` moves to the next one and
+    `receive()` returns its frames and afterwards a CLOSED message. Everything that is sent is discarded.
+
+    With a speed the frames are returned at the recorded pace (1.0) or faster or slower by the factor,
+    without they are returned as fast as they are read. The lag is the delay of a frame behind its
+    recorded time, which grows if the client can not keep up with the pace.
+    """
+    def __init__(self, path: str, *, speed: Optional[float] = None):
+        if speed is not None and speed <= 0:
+            raise ValueError("The speed of the replay has to be greater than 0")
+
+        self._path = path
+        self._speed = speed
+        self._entries = read_frames(path)
+        self._next = None
+        self._compression = None
+        self._origin = None
+        self._frames = 0
+        self._bytes = 0
+        self._connections = 0
+        self._lags = []
+
+    def __repr__(self) -> str:
+        info = [
+            ('path', self._path),
+            ('speed', self._speed),
+            ('frames', self._frames),
+            ('connections', self._connections)
+        ]
+        return '<FrameReplay {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def compression(self) -> Optional[str]:
+        """ Compression of the current connection """
+        return self._compression
+
+    @property
+    def closed(self) -> bool:
+        return False
+
+    @property
+    def stats(self) -> dict:
+        lags = sorted(self._lags)
+        return {
+            'frames': self._frames,
+            'bytes': self._bytes,
+            'connections': self._connections,
+            'lag_p50': lags[len(lags) // 2] if lags else None,
+            'lag_p99': lags[min(int(len(lags) * 0.99), len(lags) - 1)] if lags else None,
+            'lag_max': lags[-1] if lags else None
+        }
+
+    def _peek(self) -> Optional[dict]:
+        if self._next is None:
+            self._next = next(self._entries, None)
+        return self._next
+
+    def next_connection(self) -> bool:
+        """`openhivenpy.gateway.recorder.FrameReplay.next_connection()`
+
+        Moves to the next recorded connection. Returns False if the recording has no connections left
+        """
+        entry = self._peek()
+        # Frames of the current connection that were not read are skipped
+        while entry is not None and entry.get('k') != 'open':
+            self._next = None
+            entry = self._peek()
+
+        if entry is None:
+            return False
+
+        self._next = None
+        self._compression = entry.get('c', 'text_json')
+        self._connections += 1
+        if self._origin is None and self._speed is not None:
+            self._origin = time.perf_counter() - entry['t'] / self._speed
+        return True
+
+    async def receive(self) -> WSMessage:
+        entry = self._peek()
+        if entry is None or entry.get('k') == 'open':
+            return _CLOSED_MESSAGE
+        self._next = None
+
+        if self._speed is not None:
+            due = self._origin + entry['t'] / self._speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._lags.append(max(time.perf_counter() - due, 0.0))
+
+        data = entry['d']
+        self._frames += 1
+        self._bytes += len(data)
+        if entry['k'] == 'binary':
+            return WSMessage(WSMsgType.BINARY, data, None)
+        return WSMessage(WSMsgType.TEXT, data, None)
+
+    async def send_str(self, data: str) -> None:
+        return
+
+    async def ping(self, message: bytes = b'') -> None:
+        return
+
+    async def pong(self, message: bytes = b'') -> None:
+        return
+
+    async def close(self, **kwargs) -> bool:
+        return True
+
+    def exception(self) -> None:
+        return None
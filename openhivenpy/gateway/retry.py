@@ -0,0 +1,228 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+import aiohttp
+
+__all__ = ['RetryPolicy', 'CircuitBreaker']
+
+logger = logging.getLogger(__name__)
+
+# Methods that can be sent again without changing the result
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+
+# Status codes of temporary server errors
+RETRY_STATUSES = frozenset((500, 502, 503, 504))
+
+
+class RetryPolicy:
+    """`openhivenpy.gateway.retry.RetryPolicy`
+
+    Decides whether a failed request is sent again and how long to wait before
+
+    Idempotent requests are sent again after temporary server errors, timeouts and lost connections.
+    Every other request is only sent again if the connection could not be established, since then
+    the request never reached Hiven. The waiting time grows exponentially with full jitter, which
+    spreads the retries of many concurrent requests.
+
+    The retries are limited by a budget: within the last `budget_window` seconds at most `budget_min`
+    retries plus `budget_ratio` of the sent requests are allowed, so while most requests fail only a
+    fraction of them is sent again instead of multiplying the load on the API.
+
+    Parameter:
+    ----------
+
+    max_retries: `int` - Maximum amount of retries of a single request. Defaults to `3`
+
+    base_delay: `float` - Maximum waiting time in seconds before the first retry. Doubled for every
+                          following retry. Defaults to `0.5`
+
+    max_delay: `float` - Upper limit of the waiting time in seconds. Defaults to `10`
+
+    budget_ratio: `float` - Ratio of the sent requests that can be retried. Defaults to `0.2`
+
+    budget_min: `int` - Amount of retries that are always allowed within the window. Defaults to `10`
+
+    budget_window: `int` - Seconds of the window the budget is calculated for. Defaults to `10`
+
+    methods: `iterable` - Methods that are sent again after server errors and timeouts.
+                          Defaults to the idempotent methods GET, HEAD, OPTIONS, PUT and DELETE
+
+    """
+    def __init__(self,
+                 max_retries: int = 3,
+                 base_delay: float = 0.5,
+                 max_delay: float = 10.0,
+                 budget_ratio: float = 0.2,
+                 budget_min: int = 10,
+                 budget_window: int = 10,
+                 methods: Optional[Iterable[str]] = None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.budget_min = budget_min
+        self.budget_window = budget_window
+        self.methods = IDEMPOTENT_METHODS if methods is None else frozenset(m.upper() for m in methods)
+        # Sent requests and retries per second => [second, requests, retries]
+        self._slots = deque()
+
+    def __repr__(self) -> str:
+        info = [
+            ('max_retries', self.max_retries),
+            ('base_delay', self.base_delay),
+            ('max_delay', self.max_delay),
+            ('budget', self.budget)
+        ]
+        return '<RetryPolicy {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def budget(self) -> int:
+        """ Amount of retries that are currently allowed """
+        self._slot()
+        requests = sum(slot[1] for slot in self._slots)
+        retries = sum(slot[2] for slot in self._slots)
+        return max(int(self.budget_min + self.budget_ratio * requests) - retries, 0)
+
+    def _slot(self) -> list:
+        now = int(time.monotonic())
+        if not self._slots or self._slots[-1][0] != now:
+            self._slots.append([now, 0, 0])
+            while self._slots[0][0] <= now - self.budget_window:
+                self._slots.popleft()
+        return self._slots[-1]
+
+    def record_request(self) -> None:
+        """ Adds a new request to the retry budget """
+        self._slot()[1] += 1
+
+    def backoff(self, attempt: int) -> float:
+        """`openhivenpy.gateway.retry.RetryPolicy.backoff()`
+
+        Returns the seconds to wait before the retry after the passed amount of failed attempts
+
+        :param attempt: Amount of retries that were already made
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def retryable(self, method: str, *, status: Optional[int] = None, exception: Optional[Exception] = None) -> bool:
+        """`openhivenpy.gateway.retry.RetryPolicy.retryable()`
+
+        Returns True if a request that failed with the passed status or exception can be sent again
+
+        :param method: HTTP method of the request
+        :param status: Status code of the received response
+        :param exception: Exception that was raised while sending the request
+        """
+        if isinstance(exception, aiohttp.ClientConnectorError):
+            # The connection could not be established => Nothing was sent
+            return True
+        elif method.upper() not in self.methods:
+            return False
+        elif exception is not None:
+            return isinstance(exception, (asyncio.TimeoutError, aiohttp.ClientConnectionError,
+                                          aiohttp.ClientPayloadError))
+        return status in RETRY_STATUSES
+
+    def acquire_retry(self, attempt: int) -> bool:
+        """`openhivenpy.gateway.retry.RetryPolicy.acquire_retry()`
+
+        Returns True and adds the retry to the budget if another retry is allowed
+
+        :param attempt: Amount of retries that were already made
+        """
+        if attempt >= self.max_retries or self.budget < 1:
+            return False
+        self._slots[-1][2] += 1
+        return True
+
+
+class CircuitBreaker:
+    """`openhivenpy.gateway.retry.CircuitBreaker`
+
+    Stops sending requests while the Hiven API is down
+
+    After `threshold` failed requests in a row (server errors, timeouts and connection errors) the
+    breaker opens and all requests fail immediately instead of waiting for their timeout. After
+    `timeout` seconds a single request is let through to test the API: if it succeeds the breaker
+    closes again, else it stays open for another `timeout`.
+
+    Parameter:
+    ----------
+
+    threshold: `int` - Amount of failed requests in a row that open the breaker. Defaults to `5`
+
+    timeout: `float` - Seconds the breaker stays open before a test request is sent. Defaults to `30`
+
+    """
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+    HALF_OPEN = 'HALF_OPEN'
+
+    def __init__(self, threshold: int = 5, timeout: float = 30.0):
+        self.threshold = threshold
+        self.timeout = timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    def __repr__(self) -> str:
+        info = [
+            ('state', self.state),
+            ('failures', self._failures),
+            ('threshold', self.threshold),
+            ('timeout', self.timeout)
+        ]
+        return '<CircuitBreaker {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """ Seconds until the breaker lets the next test request through """
+        if self._state != self.OPEN:
+            return 0.0
+        return max(self._opened_at + self.timeout - time.monotonic(), 0.0)
+
+    def allow(self) -> bool:
+        """`openhivenpy.gateway.retry.CircuitBreaker.allow()`
+
+        Returns True if a request can be sent
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        elif state == self.HALF_OPEN and not self._probing:
+            # Only a single test request => The others still fail fast
+            self._probing = True
+            return True
+        return False
+
+    def release(self) -> None:
+        """ Lets the next request test the API if the test request ended without a result """
+        self._probing = False
+
+    def record_success(self) -> None:
+        if self._state != self.CLOSED:
+            logger.info("[HTTP] Circuit breaker closed! The Hiven API is reachable again")
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or (self._state == self.CLOSED and self._failures >= self.threshold):
+            if self._state == self.CLOSED:
+                logger.error(f"[HTTP] Circuit breaker opened after {self._failures} failed requests in a row! "
+                             f"Requests fail immediately for the next {self.timeout}s")
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probing = False
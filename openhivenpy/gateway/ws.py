@@ -1,15 +1,21 @@
 import asyncio
 import time
+import copy
 import sys
 import os
-import json
 import logging
-from typing import Optional
+import zlib
+from typing import Optional, Callable
 import aiohttp
 
 import openhivenpy.types as types
 import openhivenpy.exceptions as errs
 import openhivenpy.utils as utils
+from . import codec
+from .compression import COMPRESSIONS, ZlibStreamDecoder
+from .retry import RetryPolicy
+from .heartbeat import HeartbeatMonitor
+from .recorder import FrameRecorder, FrameReplay
 from openhivenpy.events import EventHandler
 from openhivenpy.types import Client
 from openhivenpy.settings import load_env
@@ -25,6 +31,35 @@ _default_host = os.getenv("HIVEN_HOST")
 _default_api_version = os.getenv("HIVEN_API_VERSION")
 _default_connection_heartbeat = int(os.getenv("CONNECTION_HEARTBEAT"))
 _default_close_timeout = int(os.getenv("CLOSE_TIMEOUT"))
+_default_event_queue_size = int(os.getenv("EVENT_QUEUE_SIZE", 1000))
+_default_event_workers = int(os.getenv("EVENT_WORKERS", 4))
+_default_compression = os.getenv("GATEWAY_COMPRESSION", "text_json")
+_default_reconnect_attempts = int(os.getenv("RECONNECT_ATTEMPTS", 10))
+_default_heartbeat_timeout = float(os.getenv("HEARTBEAT_TIMEOUT", 10))
+
+# Backoff of the reconnect attempts in seconds => The first attempt after a lost connection is sent immediately
+_RECONNECT_BASE_DELAY = 0.5
+_RECONNECT_MAX_DELAY = 30
+# Seconds a forced reconnect waits for the close frame of Hiven before the connection is dropped
+_FORCED_CLOSE_TIMEOUT = 0.25
+
+# Registry of the default Swarm event handlers => event name: (handler, requires_ready)
+# Filled once on import by the handlers of the Websocket class that are decorated with _swarm_event()
+_swarm_event_handlers = {}
+
+
+def _swarm_event(event: str, *, requires_ready: bool = False) -> Callable:
+    """
+    Decorator that registers the decorated coroutine as the default handler of the passed Swarm event
+
+    :param event: Name of the Swarm event
+    :param requires_ready: If set to True the event is only handled if the client is ready else it is
+                           handled as soon as the client is initialized
+    """
+    def decorator(func: Callable) -> Callable:
+        _swarm_event_handlers[event] = (func, requires_ready)
+        return func
+    return decorator
 
 
 class Websocket(Client):
@@ -46,7 +81,14 @@ class Websocket(Client):
             host: str = _default_host,
             api_version: str = _default_api_version,
             heartbeat: int = _default_connection_heartbeat,
+            heartbeat_timeout: float = _default_heartbeat_timeout,
             close_timeout: int = _default_close_timeout,
+            event_queue_size: int = _default_event_queue_size,
+            event_workers: int = _default_event_workers,
+            compression: str = _default_compression,
+            reconnect: bool = True,
+            reconnect_attempts: int = _default_reconnect_attempts,
+            record_frames: Optional[str] = None,
             event_handler: EventHandler,
             event_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_event_loop(),
             **kwargs):
@@ -66,9 +108,37 @@ class Websocket(Client):
         :param heartbeat: Intervals in which the bot will send life signals to the Websocket.
                           Defaults to the pre-set environment heartbeat (30000)
 
+        :param heartbeat_timeout: Seconds Hiven has to acknowledge a life signal. If it is not acknowledged the
+                                  connection is considered dead and reconnected.
+                                  Defaults to the pre-set environment heartbeat_timeout (10)
+
         :param close_timeout: Seconds after the websocket will timeout after the end handshake didn't complete
                               successfully. Defaults to the pre-set environment close_timeout (40)
 
+        :param event_queue_size: Maximum amount of received events that can wait for processing. If the queue
+                                 is full the websocket stops reading until events were processed.
+                                 Defaults to the pre-set environment event_queue_size (1000)
+
+        :param event_workers: Amount of workers that process the received events. Every worker has its own
+                              lane which processes the events of the same room or house in the order they were
+                              received. Events of different lanes are not ordered with each other, except that
+                              events of a room that is not cached yet wait in the lane of its house.
+                              Defaults to the pre-set environment event_workers (4)
+
+        :param compression: Compression of the Swarm frames. 'text_json' for uncompressed text frames or
+                            'zlib_stream' for binary frames that are compressed with one zlib stream for the
+                            whole connection. Defaults to the pre-set environment gateway_compression (text_json)
+
+        :param reconnect: If set to True the websocket reconnects over the same session if the connection was lost
+                          after the client was initialized. The cache is kept and only refreshed with the data of
+                          the new connection. Defaults to True
+
+        :param reconnect_attempts: Amount of failed reconnect attempts in a row after which the connection is
+                                   closed. Defaults to the pre-set environment reconnect_attempts (10)
+
+        :param record_frames: Path of a file the received frames are recorded to. The recording can be replayed
+                              with `replay()`. Defaults to None (not recording)
+
         :param event_loop: Event loop that will be used to execute all async functions. Fetching current event_loop
 
         :param event_handler: Handler for Websocket Events
@@ -78,8 +148,13 @@ class Websocket(Client):
         self._HOST = host
         self._API_VERSION = api_version
 
-        self._WEBSOCKET_URL = "wss://swarm-dev.hiven.io/socket?encoding=json&compression=text_json"
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown gateway compression '{compression}'! Expected one of {COMPRESSIONS}")
+        self._WEBSOCKET_URL = f"wss://swarm-dev.hiven.io/socket?encoding=json&compression={compression}"
         self._ENCODING = "json"
+        self._COMPRESSION = compression
+        # Inflater of the compressed frames => Created for every connection
+        self._zlib_decoder = None
 
         # In milliseconds
         self._HEARTBEAT = heartbeat
@@ -87,6 +162,10 @@ class Websocket(Client):
 
         self._close_timeout = close_timeout
 
+        # Life signals and the latency until they were acknowledged => Kept over reconnects
+        self._heartbeat_timeout = heartbeat_timeout
+        self._heartbeat_monitor = HeartbeatMonitor()
+
         self._event_handler = event_handler
         self._event_loop = event_loop
 
@@ -97,8 +176,25 @@ class Websocket(Client):
         self._ws_session = None
         self._ws = None
         self._connection = None
+        self._ws_task = None
         self._lifesignal = None
 
+        # Reconnecting => Exponential backoff with full jitter between the failed attempts
+        self._reconnect = reconnect
+        self._reconnect_policy = RetryPolicy(max_retries=max(int(reconnect_attempts), 0),
+                                             base_delay=_RECONNECT_BASE_DELAY,
+                                             max_delay=_RECONNECT_MAX_DELAY)
+        self._reconnect_attempt = 0
+        self._reconnect_requested = None
+        self._reconnects = 0
+        # Time the connection was lost => None if the websocket is not reconnecting
+        self._disconnected_at = None
+        # Cached houses that were not sent again since the reconnect
+        self._refreshing_houses = set()
+
+        # Recorder of the received frames => None if not recording
+        self._recorder = FrameRecorder(record_frames) if record_frames else None
+
         # Websocket and Connection Attribute
         self._open = False
 
@@ -110,6 +206,22 @@ class Websocket(Client):
 
         self._connection_status = "CLOSED"
 
+        # Copy of the default Swarm event handlers to allow changes for this instance
+        self._swarm_handlers = dict(_swarm_event_handlers)
+
+        # Bounded queues (lanes) between the response handler and the event workers
+        # => Created when the connection is started
+        self._event_queue_size = max(int(event_queue_size), 1)
+        self._event_workers_count = max(int(event_workers), 1)
+        self._event_queues = []
+        self._event_workers = []
+
+        # Metrics of the event queue
+        self._event_queue_peak = 0
+        self._event_queue_full = 0
+        self._events_processed = 0
+        self._events_dropped = 0
+
         # Initialising the parent class Client which handles the data
         super().__init__()
 
@@ -133,10 +245,41 @@ class Websocket(Client):
     def encoding(self) -> str:
         return getattr(self, '_ENCODING', None)
 
+    @property
+    def compression(self) -> str:
+        return getattr(self, '_COMPRESSION', None)
+
+    @property
+    def compression_stats(self) -> Optional[dict]:
+        """
+        Metrics of the zlib stream of the current connection. None if the frames are not compressed or
+        the websocket is not connected
+        """
+        decoder = getattr(self, '_zlib_decoder', None)
+        return decoder.stats if decoder is not None else None
+
     @property
     def heartbeat(self) -> int:
         return getattr(self, '_HEARTBEAT', None)
 
+    @property
+    def latency(self) -> Optional[float]:
+        """
+        Seconds until the last life signal was acknowledged by Hiven. None if no life signal was
+        acknowledged yet
+        """
+        monitor = getattr(self, '_heartbeat_monitor', None)
+        return monitor.latency if monitor is not None else None
+
+    @property
+    def latency_stats(self) -> dict:
+        """
+        Latency of the life signals in seconds. 'latency' is the last one and 'p50' and 'p99' the percentiles of
+        the last 100. 'missed' is the amount of life signals that were not acknowledged in time
+        """
+        monitor = getattr(self, '_heartbeat_monitor', None)
+        return monitor.stats if monitor is not None else {}
+
     @property
     def ws_session(self) -> aiohttp.ClientSession:
         return getattr(self, '_ws_session', None)
@@ -149,6 +292,93 @@ class Websocket(Client):
     def ws_connection(self) -> asyncio.Task:
         return getattr(self, '_connection', None)
 
+    @property
+    def reconnect(self) -> bool:
+        return getattr(self, '_reconnect', False)
+
+    @property
+    def reconnecting(self) -> bool:
+        return getattr(self, '_disconnected_at', None) is not None
+
+    @property
+    def reconnects(self) -> int:
+        """
+        Amount of times the websocket reconnected successfully since the client was started
+        """
+        return getattr(self, '_reconnects', 0)
+
+    @property
+    def recorder(self) -> Optional[FrameRecorder]:
+        return getattr(self, '_recorder', None)
+
+    @property
+    def event_queue_stats(self) -> dict:
+        """
+        Metrics of the event queue. 'size' is the current amount of events waiting for processing, 'lanes'
+        the amount per lane, 'peak' the highest amount in a lane since the start, 'full' how often the
+        websocket had to wait for a full lane and 'dropped' the amount of events that were received before
+        the client was ready to handle them
+        """
+        queues = getattr(self, '_event_queues', [])
+        return {
+            'size': sum(queue.qsize() for queue in queues),
+            'lanes': [queue.qsize() for queue in queues],
+            'max_size': getattr(self, '_event_queue_size', None),
+            'peak': getattr(self, '_event_queue_peak', 0),
+            'full': getattr(self, '_event_queue_full', 0),
+            'processed': getattr(self, '_events_processed', 0),
+            'dropped': getattr(self, '_events_dropped', 0),
+            'workers': len(getattr(self, '_event_workers', []))
+        }
+
+    @property
+    def swarm_handlers(self) -> dict:
+        return dict(getattr(self, '_swarm_handlers', {}))
+
+    def add_swarm_handler(self, event: str, handler: Callable, *, requires_ready: bool = True) -> None:
+        """`openhivenpy.gateway.Websocket.add_swarm_handler()`
+
+        Registers a handler for a Swarm event. Replaces the existing handler if the event already has one,
+        which means the default handlers of openhivenpy can be overridden as well.
+
+        The handler will be called with the client and the data of the event `handler(client, data)` and
+        needs to be a coroutine! It is awaited inline by the worker of the event's lane, in the order the
+        events of the lane were received. A slow handler therefore delays every following event in its lane
+        and, once the lane is full, the reading of the socket => Handlers must not block and should start
+        long-running work in their own task
+
+        :param event: Name of the Swarm event e.g. 'MESSAGE_CREATE'
+
+        :param handler: Coroutine function that should handle the event
+
+        :param requires_ready: If set to True the event will only be handled if the client is ready.
+                               Else the event gets handled as soon as the client is initialized
+        """
+        if not asyncio.iscoroutinefunction(handler):
+            raise TypeError(f"Expected a coroutine function as handler for the event '{event}'!")
+        self._swarm_handlers[event] = (handler, requires_ready)
+
+    def remove_swarm_handler(self, event: str) -> None:
+        """`openhivenpy.gateway.Websocket.remove_swarm_handler()`
+
+        Removes the handler of a Swarm event. Use `restore_swarm_handler()` to restore the default handler
+
+        :param event: Name of the Swarm event e.g. 'MESSAGE_CREATE'
+        """
+        self._swarm_handlers.pop(event, None)
+
+    def restore_swarm_handler(self, event: str) -> None:
+        """`openhivenpy.gateway.Websocket.restore_swarm_handler()`
+
+        Restores the default handler of openhivenpy for a Swarm event
+
+        :param event: Name of the Swarm event e.g. 'MESSAGE_CREATE'
+        """
+        if event in _swarm_event_handlers:
+            self._swarm_handlers[event] = _swarm_event_handlers[event]
+        else:
+            self._swarm_handlers.pop(event, None)
+
     # Starts the connection over a new websocket
     async def ws_connect(self, session: aiohttp.ClientSession, heartbeat: int = None) -> None:
         """`openhivenpy.gateway.Websocket.connect()`
@@ -170,42 +400,50 @@ class Websocket(Client):
             and react with pongs on pings. Will send lifesignals over the pre-set
             Heartbeat to ensure the connection stays alive and does not time-out.
 
+            If the connection is lost after the client was initialized a new websocket is
+            opened over the same session. The cache and the event workers are kept
+            => Only the handshake and the INIT_STATE are repeated
+
             """
+            reason = "Response Handler stopped!"
+            self._reconnect_attempt = 0
+            self._reconnect_requested = None
+            self._disconnected_at = None
+            self._refreshing_houses = set()
+            self._start_event_workers()
             try:
-                async with session.ws_connect(
-                        url=self._WEBSOCKET_URL,
-                        timeout=self._close_timeout,
-                        autoping=True,
-                        autoclose=True,
-                        heartbeat=self._HEARTBEAT,
-                        receive_timeout=None,
-                        max_msg_size=0) as ws:
-
-                    self._ws = ws
-                    self._connection_status = "OPEN"
-                    self._open = True
-
-                    await asyncio.gather(self._event_handler.ev_connection_start(),
-                                         self.lifesignal(ws),
-                                         self.response_handler(ws=ws))
+                while True:
+                    try:
+                        await self._run_ws(session)
+                    except (aiohttp.ClientError, asyncio.TimeoutError, errs.WSFailedToHandle) as e:
+                        logger.error(f"[WEBSOCKET] << The connection to Hiven failed or was lost! "
+                                     f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
+
+                    if not await self._wait_for_reconnect():
+                        break
 
             except KeyboardInterrupt:
-                pass
+                return
+
+            except asyncio.CancelledError:
+                raise
 
             except Exception as ws_e:
                 logger.critical(f"[WEBSOCKET] >> The connection to Hiven failed to be kept alive or started! "
                                 f"> {sys.exc_info()[1].__class__.__name__}, {str(ws_e)}")
-
-                # Closing
-                close = getattr(self, "close", None)
-                if callable(close):
-                    await close(exec_loop=not self._restart, reason="WS encountered an error!", restart=self._restart)
-
-                return
+                reason = "WS encountered an error!"
 
             finally:
                 self._open = False
-                return
+                self._disconnected_at = None
+                self._stop_event_workers()
+                if self._recorder is not None:
+                    self._recorder.close()
+
+            # Closing
+            close = getattr(self, "close", None)
+            if callable(close):
+                await close(exec_loop=not self._restart, reason=reason, restart=self._restart)
 
         # Creating a task that wraps the coroutine
         self._connection = asyncio.create_task(ws_connection())
@@ -228,6 +466,231 @@ class Websocket(Client):
         finally:
             return
 
+    async def _run_ws(self, session: aiohttp.ClientSession) -> None:
+        """
+        Runs a new websocket connection in its own task until it is closed. Raises the exception
+        that ended the connection. A forced reconnect cancels the task and returns normally
+        """
+        self._ws_task = asyncio.create_task(self._ws_connection(session))
+        try:
+            # Not awaiting the task directly => Its cancellation by force_reconnect() is not
+            # propagated to the main connection task
+            await asyncio.wait((self._ws_task,))
+        except asyncio.CancelledError:
+            self._ws_task.cancel()
+            raise
+
+        if self._ws_task.cancelled():
+            if self._reconnect_requested is None:
+                raise asyncio.CancelledError()
+            return
+        self._ws_task.result()
+
+    async def _ws_connection(self, session: aiohttp.ClientSession) -> None:
+        """
+        Opens a websocket to the Swarm and handles its responses until the connection is closed
+        """
+        ws = await session.ws_connect(
+            url=self._WEBSOCKET_URL,
+            timeout=self._close_timeout,
+            # Pings and pongs are handled by the response handler => The pongs acknowledge the life signals
+            autoping=False,
+            autoclose=True,
+            receive_timeout=None,
+            max_msg_size=0)
+
+        lifesignal = None
+        try:
+            self._ws = ws
+            if self._COMPRESSION == 'zlib_stream':
+                # The zlib stream starts with the connection => Never reusing the old inflater
+                self._zlib_decoder = ZlibStreamDecoder()
+            self._connection_status = "OPEN"
+            self._open = True
+            self._reconnect_requested = None
+            self._heartbeat_monitor.reset()
+            if self._recorder is not None:
+                self._recorder.record_open(self._COMPRESSION)
+
+            if self._disconnected_at is None:
+                # Only the first connection is part of the startup
+                self._mark_startup_phase('connect')
+                asyncio.create_task(self._event_handler.ev_connection_start())
+            else:
+                logger.info(f"[WEBSOCKET] >> Opened a new connection to Hiven (attempt {self._reconnect_attempt + 1})! "
+                            "Waiting for the INIT_STATE")
+
+            lifesignal = asyncio.ensure_future(self.lifesignal(ws))
+            await self.response_handler(ws=ws)
+
+        finally:
+            self._open = False
+            if lifesignal is not None:
+                lifesignal.cancel()
+
+            if not ws.closed:
+                # Hiven does not answer the close frame if the connection was forced to reconnect because
+                # it is not responding anymore => Dropping it after a short time
+                timeout = _FORCED_CLOSE_TIMEOUT if self._reconnect_requested is not None else None
+                try:
+                    await asyncio.wait_for(ws.close(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    logger.debug("[WEBSOCKET] << Hiven did not answer the close frame! Dropped the connection")
+
+            logger.info(f"[WEBSOCKET] << Connection to Remote ({self._WEBSOCKET_URL}) closed!")
+
+    async def _wait_for_reconnect(self) -> bool:
+        """
+        Decides whether a new connection should be opened after the last one was closed and waits for the
+        backoff of the attempt. Returns False if the websocket should be closed instead
+        """
+        if not self._reconnect or self._connection_status in ("CLOSING", "CLOSED"):
+            return False
+
+        if self._disconnected_at is None:
+            if not self._initialized:
+                # The first connection failed before the INIT_STATE => Likely a faulty token and not worth retrying
+                return False
+
+            self._disconnected_at = time.time()
+            self._reconnect_attempt = 0
+            self._connection_status = "RECONNECTING"
+            logger.warning(f"[WEBSOCKET] << Lost the connection to Hiven! "
+                           f"Reason: {self._reconnect_requested or 'Connection closed'} >> Reconnecting")
+            asyncio.create_task(self._event_handler.ev_disconnect())
+            # First attempt immediately => Most disconnects are short and the Swarm is reachable again
+            return True
+
+        # The last attempt failed before the INIT_STATE was received
+        self._reconnect_attempt += 1
+        if self._reconnect_attempt > self._reconnect_policy.max_retries:
+            logger.error(f"[WEBSOCKET] << Failed to reconnect to Hiven after {self._reconnect_attempt} attempts!")
+            return False
+
+        delay = self._reconnect_policy.backoff(self._reconnect_attempt - 1)
+        logger.info(f"[WEBSOCKET] >> Reconnect attempt {self._reconnect_attempt + 1} in {delay:.2f}s")
+        self._connection_status = "RECONNECTING"
+        await asyncio.sleep(delay)
+        return self._connection_status == "RECONNECTING"
+
+    async def force_reconnect(self, reason: str = "Forced reconnect") -> bool:
+        """`openhivenpy.gateway.Websocket.force_reconnect()`
+
+        Drops the current websocket connection and opens a new one over the same session while keeping
+        the cache. Used if the connection is still open but Hiven stopped responding
+
+        Returns False if the websocket is not connected or reconnecting is disabled
+
+        :param reason: Reason that will be logged
+        """
+        if not self._reconnect or not self._initialized:
+            return False
+        return self._drop_connection(reason)
+
+    def _drop_connection(self, reason: str) -> bool:
+        """
+        Cancels the task of the current websocket connection without waiting for Hiven. Afterwards it is
+        decided like for a lost connection whether a new one is opened
+        """
+        task = self._ws_task
+        if task is None or task.done():
+            return False
+
+        self._reconnect_requested = reason
+        task.cancel()
+        return True
+
+    def start_recording(self, path: str) -> FrameRecorder:
+        """`openhivenpy.gateway.Websocket.start_recording()`
+
+        Starts recording the received frames to the passed file. Stops the current recording if there is one.
+        If the frames are compressed the recording starts with the next connection, since the zlib stream
+        can only be inflated from its start
+
+        :param path: Path of the file the frames are recorded to. An existing file is overwritten
+        :return: The recorder of the frames
+        """
+        self.stop_recording()
+        recorder = FrameRecorder(path)
+        recorder.open()
+        if self._open and self._COMPRESSION == 'text_json':
+            recorder.record_open(self._COMPRESSION)
+        self._recorder = recorder
+        return recorder
+
+    def stop_recording(self) -> Optional[FrameRecorder]:
+        """`openhivenpy.gateway.Websocket.stop_recording()`
+
+        Stops recording the received frames and closes the file of the recording
+
+        :return: The recorder of the frames or None if the websocket was not recording
+        """
+        recorder, self._recorder = self._recorder, None
+        if recorder is not None:
+            recorder.close()
+        return recorder
+
+    async def replay(self, path: str, *, speed: Optional[float] = None) -> dict:
+        """`openhivenpy.gateway.Websocket.replay()`
+
+        Replays a recording of received frames without a connection to Hiven. The frames are decoded, added
+        to the cache and dispatched to the event handler by the same code as the frames of a live connection,
+        which allows reproducible throughput and latency benchmarks. Every recorded connection after the
+        first one is handled like a reconnect.
+
+        Can not be used while the websocket is connected!
+
+        :param path: Path to the recording of `record_frames` or `start_recording()`
+
+        :param speed: Factor of the recorded pace the frames are replayed at. If None the frames are replayed
+                      as fast as possible
+
+        :return: Metrics of the replay. 'elapsed' is the time until all events were processed and the lags
+                 are the delays of the frames behind the recorded pace
+        """
+        if self._open or self._connection_status != "CLOSED":
+            raise errs.GatewayException("Unable to replay frames while the websocket is connected!")
+
+        replay = FrameReplay(path, speed=speed)
+        # Not recording the replayed frames again
+        recorder, self._recorder = self._recorder, None
+        processed = self._events_processed
+
+        self._connection_start = time.time()
+        self._reset_readiness()
+        self._start_event_workers()
+        start = time.perf_counter()
+        try:
+            while replay.next_connection():
+                if self._initialized:
+                    # The cache is reconciled with the INIT_STATE of the next connection like after a reconnect
+                    self._disconnected_at = time.time()
+                self._zlib_decoder = ZlibStreamDecoder() if replay.compression == 'zlib_stream' else None
+                self._connection_status = "OPEN"
+                self._open = True
+                await self.response_handler(ws=replay)
+
+            # Waiting until the event workers processed all events of the recording
+            for queue in self._event_queues:
+                await queue.join()
+            elapsed = time.perf_counter() - start
+
+        finally:
+            self._stop_event_workers()
+            self._open = False
+            self._disconnected_at = None
+            self._connection_status = "CLOSED"
+            self._recorder = recorder
+            if self._slow_startup_handle is not None:
+                self._slow_startup_handle.cancel()
+                self._slow_startup_handle = None
+
+        stats = replay.stats
+        stats['events'] = self._events_processed - processed
+        stats['elapsed'] = elapsed
+        stats['frames_per_second'] = stats['frames'] / elapsed if elapsed else 0.0
+        return stats
+
     # Loop for receiving messages from Hiven
     async def response_handler(self, ws) -> None:
         """`openhivenpy.gateway.Websocket.ws_receive_response()`
@@ -240,33 +703,49 @@ class Websocket(Client):
         try:
             # Response Handler for the websocket that will on errors, responses, pings and pongs
             # react and trigger events over the event_resp_handler which will trigger events.
-            # The function will break if a close frame was received and then automatically
-            # close the connection. This is then only way the connection can normally close
-            # except user forced close or a raised exceptions while processing.
+            # The function will break if a close frame was received or the connection was lost.
+            # The connection is then closed and reopened if the websocket should reconnect.
+            # Else this is the only way the connection can normally close except user forced
+            # close or a raised exceptions while processing.
             while self.open:
                 msg = await ws.receive()
                 if msg is not None:
                     logger.debug(f"[WEBSOCKET] << Got Type {msg.type}")
-                    if msg.type == aiohttp.WSMsgType.TEXT:
+                    if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                        data = msg.data
+                        if self._recorder is not None:
+                            self._recorder.record(data)
+                        if msg.type == aiohttp.WSMsgType.BINARY and self._zlib_decoder is not None:
+                            try:
+                                data = self._zlib_decoder.feed(data)
+                            except zlib.error as e:
+                                # The stream is corrupted => All following frames can not be inflated either
+                                logger.critical(f"[WEBSOCKET] << Failed to inflate received frame! > {str(e)}")
+                                raise errs.WSFailedToHandle(str(e))
+                            if data is None:
+                                # The frame continues in the next message
+                                continue
+
                         try:
-                            resp = msg.json()
-                        except Exception:
-                            resp = None
+                            resp = codec.loads(data)
+                        except Exception as e:
+                            logger.error(f"[WEBSOCKET] << Failed to decode received frame! "
+                                         f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
+                            continue
 
                         if resp.get('op', 0) == 1:
                             # Authorizing with token
                             logger.info("[WEBSOCKET] >> Authorizing with token")
-                            json_auth = str(json.dumps({"op": 2, "d": {"token": str(self._TOKEN)}}))
+                            json_auth = codec.dumps({"op": 2, "d": {"token": str(self._TOKEN)}})
                             await ws.send_str(json_auth)
 
                             if self._CUSTOM_HEARTBEAT is False:
                                 self._HEARTBEAT = resp['d']['hbt_int']
-                                ws.heartbeat = self._HEARTBEAT
 
-                            logger.debug(f"[WEBSOCKET] >> Heartbeat set to {ws.heartbeat}")
+                            logger.debug(f"[WEBSOCKET] >> Heartbeat set to {self._HEARTBEAT}")
                             logger.info("[WEBSOCKET] << Connection to Hiven Swarm established")
                         else:
-                            if msg.data == 'close cmd':
+                            if data == 'close cmd':
                                 logger.debug("[WEBSOCKET] << Received close frame!")
                                 break
                             else:
@@ -353,13 +832,31 @@ class Websocket(Client):
                                       house_ids: string[]
                                     }
                                     """
-                                    await super().init_meta_data(resp.get('d'))
+                                    if self._disconnected_at is not None:
+                                        # Reconnected => The cache is reconciled with the new data and
+                                        # the cached houses with the HOUSE_JOIN events of the connection
+                                        await super().reconcile_meta_data(resp.get('d'))
+
+                                        downtime = time.time() - self._disconnected_at
+                                        self._disconnected_at = None
+                                        self._reconnect_attempt = 0
+                                        self._reconnects += 1
+                                        logger.info(f"[WEBSOCKET] << Reconnected to Hiven after {downtime:.3f}s")
+                                        asyncio.create_task(self._event_handler.ev_reconnect(time=downtime))
+                                    else:
+                                        await super().init_meta_data(resp.get('d'))
 
-                                    init_time = time.time() - self._connection_start
-                                    self._initialized = True
-                                    await self._event_handler.ev_init_state(time=init_time)
+                                        init_time = time.time() - self._connection_start
+                                        self._initialized = True
+                                        self._mark_startup_phase('init_state')
+                                        await self._event_handler.ev_init_state(time=init_time)
 
-                                await asyncio.create_task(self._event_resp_handler(resp))
+                                    # The client is ready immediately if it is not member of any house
+                                    self._check_ready()
+
+                                # Waits if the queue is full => The socket is not read until the
+                                # workers processed events
+                                await self._enqueue_event(resp)
 
                     elif msg.type == aiohttp.WSMsgType.CLOSE:
                         # Close Frame can be received because of these issues:
@@ -370,24 +867,28 @@ class Websocket(Client):
                         logger.debug(f"[WEBSOCKET] << Received close frame with msg='{msg.extra}'!")
                         break
 
+                    elif msg.type == aiohttp.WSMsgType.PING:
+                        await ws.pong(msg.data)
+
+                    elif msg.type == aiohttp.WSMsgType.PONG:
+                        # Acknowledgement of a life signal
+                        latency = self._heartbeat_monitor.ack(msg.data)
+                        if latency is not None:
+                            logger.debug(f"[WEBSOCKET] << Lifesignal acknowledged after {latency * 1000:.1f}ms")
+
+                    elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING):
+                        # The connection was lost or is closed by another task
+                        logger.debug("[WEBSOCKET] << The connection was closed!")
+                        break
+
                     elif msg.type == aiohttp.WSMsgType.ERROR:
                         logger.critical(f"[WEBSOCKET] Failed to handle response >> {ws.exception()} >>{msg}")
                         raise errs.WSFailedToHandle(msg.data)
 
         finally:
-            if not ws.closed:
-                await ws.close()
-
-            logger.info(f"[WEBSOCKET] << Connection to Remote ({self._WEBSOCKET_URL}) closed!")
+            # Closing the websocket and reconnecting is handled by the connection task
             self._open = False
 
-            # Closing
-            close = getattr(self, "close", None)
-            if callable(close):
-                await close(exec_loop=True, reason="Response Handler stopped!", restart=self._restart)
-
-            return
-
     async def lifesignal(self, ws) -> None:
         """`openhivenpy.gateway.Websocket.ws_lifesignal()`
 
@@ -402,11 +903,23 @@ class Websocket(Client):
             # Very unlikely to happen to due to prior force closing or self._open closing itself
             # which already stops the entire websocket task
             async def _lifesignal():
+                monitor = self._heartbeat_monitor
+                next_beat = time.monotonic() + self._HEARTBEAT / 1000
                 while self._open:
-                    await asyncio.sleep(self._HEARTBEAT / 1000)
+                    await asyncio.sleep(max(next_beat - time.monotonic(), 0))
+                    next_beat = time.monotonic() + self._HEARTBEAT / 1000
 
                     logger.debug(f"[WEBSOCKET] >> Lifesignal at {time.time()}")
-                    await ws.send_str(str(json.dumps({"op": 3})))
+                    await ws.send_str(codec.dumps({"op": 3}))
+                    # Hiven does not acknowledge the op-code => The pong of the ping acknowledges it
+                    await ws.ping(monitor.send())
+
+                    if not await monitor.wait_for_ack(self._heartbeat_timeout):
+                        # The connection is dead even though TCP did not notice it yet
+                        logger.warning(f"[WEBSOCKET] << Lifesignal was not acknowledged within "
+                                       f"{self._heartbeat_timeout}s! Dropping the connection")
+                        self._drop_connection("Lifesignal was not acknowledged")
+                        break
 
                     if self._connection_status in ["CLOSING", "CLOSED"]:
                         break
@@ -420,12 +933,146 @@ class Websocket(Client):
         except asyncio.CancelledError:
             return
 
+        except Exception as e:
+            # The connection was lost while sending => Noticed and handled by the response handler
+            logger.debug(f"[WEBSOCKET] >> Failed to send lifesignal! "
+                         f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
+
+    def _start_event_workers(self) -> None:
+        """
+        Creates the event lanes and starts one worker per lane that processes the received events
+
+        The maximum queue size is split between the lanes
+        """
+        self._stop_event_workers()
+        lane_size = -(-self._event_queue_size // self._event_workers_count)
+        self._event_queues = [asyncio.Queue(maxsize=lane_size) for _ in range(self._event_workers_count)]
+        self._event_workers = [asyncio.create_task(self._event_worker(queue)) for queue in self._event_queues]
+        logger.debug(f"[WEBSOCKET] Started {self._event_workers_count} event workers")
+
+    def _stop_event_workers(self) -> None:
+        """
+        Cancels the event workers. Events that are still in the queue are discarded!
+        """
+        for worker in self._event_workers:
+            if not worker.done():
+                worker.cancel()
+        self._event_workers = []
+
+    def _event_lane_key(self, resp: dict):
+        """
+        Returns the key that decides in which lane the event is processed. Events with the same key are
+        processed in the order they were received while different keys are processed in parallel
+
+        Events of a room that is not cached yet are processed in the lane of its house, behind the
+        HOUSE_JOIN or ROOM_CREATE that adds the room. The events of a room that were received before and
+        after it was cached can still overtake each other, since they are processed in different lanes
+        """
+        data = resp.get('d')
+        if isinstance(data, dict):
+            room_id = data.get('room_id')
+            house_id = data.get('house_id')
+            if room_id is not None and (house_id is None or self._room_cached(room_id)):
+                # Room first to process the events of different rooms in a house in parallel
+                return room_id
+            for field in ('house_id', 'id'):
+                key = data.get(field)
+                if key is not None:
+                    return key
+        return None
+
+    def _room_cached(self, room_id) -> bool:
+        try:
+            return self._rooms.get(int(room_id)) is not None
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _event_lane(key, lanes: int) -> int:
+        """
+        Returns the lane of the passed key. Stable across processes unlike the salted hash() of strings
+        => The same recording is always processed in the same lanes
+        """
+        if key is None:
+            return 0
+        try:
+            return int(key) % lanes
+        except (TypeError, ValueError):
+            return zlib.crc32(str(key).encode('utf-8')) % lanes
+
+    async def _enqueue_event(self, resp: dict) -> None:
+        """
+        Adds the received event to the lane of its room or house. Waits until the worker processed events
+        if the lane is full to stop reading from the socket instead of piling up tasks. The acknowledgements
+        of the life signals can not be read meanwhile => Their timeout is paused while waiting
+
+        Whether the client is ready to handle the event is decided here in the order the events were
+        received and not when a worker processes it => An event received after the last house of the
+        INIT_STATE is never dropped because the lane of the house was slower
+        """
+        swarm_event = resp.get('e', "")
+        handler = self._swarm_handlers.get(swarm_event)
+        if handler is None:
+            logger.error(f"[WEBSOCKET] << Unknown Event {swarm_event} without Handler!")
+            return
+
+        func, requires_ready = handler
+        if not (self._ready if requires_ready else self._initialized):
+            self._events_dropped += 1
+            logger.debug(f"[WEBSOCKET] << Dropped {swarm_event} that was received before the client was ready")
+            return
+
+        if swarm_event == "HOUSE_JOIN" and not self._ready:
+            # Houses of the startup are handled inline like the INIT_STATE => The readiness is set before
+            # the next event is read
+            await self._run_swarm_handler(swarm_event, func, resp.get('d', {}))
+            self._events_processed += 1
+            return
+
+        queues = self._event_queues
+        queue = queues[self._event_lane(self._event_lane_key(resp), len(queues))]
+        if queue.full():
+            self._event_queue_full += 1
+            logger.debug(f"[WEBSOCKET] Event lane is full ({queue.maxsize})! Waiting for the event worker")
+
+            monitor = self._heartbeat_monitor
+            monitor.pause()
+            try:
+                await queue.put(resp)
+            finally:
+                stalled = monitor.resume()
+            if stalled is not None and stalled > self._heartbeat_timeout:
+                logger.warning(f"[WEBSOCKET] Reading from the socket was stalled for {stalled:.1f}s by a full "
+                               f"event lane! Slow event handlers delay the lifesignal acknowledgements")
+        else:
+            await queue.put(resp)
+
+        size = queue.qsize()
+        if size > self._event_queue_peak:
+            self._event_queue_peak = size
+
+    async def _event_worker(self, queue: asyncio.Queue) -> None:
+        """
+        Worker that processes the events of its lane one after another until it gets cancelled
+        """
+        while True:
+            resp = await queue.get()
+            try:
+                await self._event_resp_handler(resp)
+            finally:
+                self._events_processed += 1
+                queue.task_done()
+
     # Event Triggers
     async def _event_resp_handler(self, resp_data):
         """`openhivenpy.gateway.Websocket.ws_on_response()`
 
         Handler for the Websocket events and the message data.
 
+        Looks up the handler of the received event in the registered Swarm event handlers
+        and runs it. Called by the event workers for every event in their lane. Whether the
+        client is ready for the event was already decided when it was added to the lane.
+
         Not supposed to be called by a user!
 
         """
@@ -435,1122 +1082,1069 @@ class Websocket(Client):
 
             logger.debug(f"Received Event {swarm_event}")
 
-            if swarm_event == "INIT_STATE":
-                logger.info("[WEBSOCKET] >> Initialization of Client was successful!")
-
-            elif swarm_event == "HOUSE_JOIN":
-                """
-                The Client joined a house
-                
-                Json-Data:
-                op: 0
-                d: {
-                  rooms: room[{
-                    type: int,
-                    recipients: null
-                    position: int,
-                    permission_overrides: bits,
-                    owner_id: string,
-                    name: string,
-                    last_message_id: string,
-                    id: string,
-                    house_id: string,
-                    emoji: object,
-                    description: string,
-                    default_permission_override: int
-                  }],
-                  roles: role[{
-                    position: int,
-                    name: string,
-                    level: int,
-                    id: string,
-                    deny: bits,
-                    color: string,
-                    allow: bits
-                  }],
-                  owner_id: string,
-                  name: string,
-                  members: [{
-                    user_id: string,
-                    user: {
-                      username: string,
-                      user_flags: string,
-                      name: string,
-                      id: string,
-                      icon: string,
-                      header: string,
-                      presence: string
-                    },
-                    roles: array,
-                    last_permission_update: string,
-                    joined_at: string,
-                    house_id: string
-                  }],
-                  id: string,
-                  icon: string,
-                  entities: [{
-                    type: int,
-                    resource_pointers: [{
-                      resource_type: string,
-                      resource_id: string
-                    }],
-                    position: int,
-                    name: string,
-                    id: string
-                  }],
-                  default_permissions: int,
-                  banner: string
-                }
-                """
-                if self._initialized:
-                    async def house_join_handler():
-                        """
-                        Handler for the house_join event of the connected client which will trigger
-                        the on_house_add event and return as parameter the house.
-                        """
-                        data = response_data
-
-                        # Creating a house object that will then be appended
-                        house = types.House(data, self.http, self.id)
-                        cached_house = utils.get(self._houses, id=int(data.get('id', 0)))
-                        # Removing a cached house if it exists
-                        if cached_house:
-                            self._houses.remove(cached_house)
-                            logger.warning("[HOUSE_LEAVE] Removed cached house with same id on_house_add. "
-                                           "Possibly old or faulty Client data!")
-
-                        if data.get('members') is None:
-                            logger.warning("[HOUSE_LEAVE] Got empty members list in on_house_add!")
-                        else:
-                            for usr in data['members']:
-                                if hasattr(usr, 'id'):
-                                    user_id = int(usr.get('id', 0))
-                                else:
-                                    user_id = int(usr['user'].get('id', 0))
-
-                                # Getting the user from the list if it exists
-                                user = utils.get(self._users, id=user_id)
-                                # If it doesn't exist it needs to be added to the list
-                                if user is None:
-                                    # Appending to the client users list
-                                    self._users.append(types.User(usr, self.http))
-
-                            for room in response_data['rooms']:
-                                self._rooms.append(types.Room(room, self.http, house))
-
-                        # Appending to the client houses list
-                        self._houses.append(house)
-
-                        # Creating a new task for handling the event
-                        # TODO! Needs error handling and name traceback and log!
-                        asyncio.create_task(self._event_handler.ev_house_join(house))
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(house_join_handler())
-
-            elif swarm_event == "HOUSE_LEAVE":
-                """
-                The client leaves a house
-                
-                Json-Data:
-                op: 0
-                d: {
-                  id: string,
-                  house_id: string
-                }
-                """
-                if self._initialized:
-                    async def house_leave_handler():
-                        """
-                        Handler for the house_join event of the connected client which will
-                        trigger on_house_remove and return as parameter the removed house.
-                        """
-                        house = utils.get(self._houses, id=int(response_data.get('house_id')))
-                        if house:
-                            # Removing the house
-                            self._houses.remove(house)
-                        else:
-                            logger.debug("[HOUSE_LEAVE] Unable to locate left house in house cache! "
-                                         "Possibly faulty Client data!")
-
-                        # Creating a new task for handling the event
-                        # TODO! Needs error handling and name traceback and log!
-                        asyncio.create_task(self._event_handler.ev_house_exit(house=house))
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(house_leave_handler())
-
-            elif swarm_event == "HOUSE_DOWN":
-                """
-                A house is unreachable
-                
-                Json-Data:
-                op: 0
-                d: {
-                  unavailable: boolean,
-                  house_id: string
-                }
-                """
-                if self._initialized:
-                    async def house_down_handler():
-                        """
-                        Handler for downtime of a house! Triggers on_house_down and
-                        returns as parameter the time of downtime and the house
-                        """
-                        data = response_data
-                        t = time.time()
-                        house = utils.get(self._houses, id=int(data.get('house_id', 0)))
-                        if data.get('unavailable'):
-                            logger.debug(f"[HOUSE_DOWN] << Downtime of '{house.name}' reported! "
-                                         "House was either deleted or is currently unavailable!")
-                        else:
-                            pass
-
-                        # Creating a new task for handling the event
-                        # TODO! Needs error handling and name traceback and log!
-                        asyncio.create_task(self._event_handler.ev_house_down(time=t, house=house))
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(house_down_handler())
-
-            elif swarm_event == "HOUSE_MEMBER_ENTER":
-                """
-                A user joined a house or went online?
-                
-                Json-Data:
-                op: 0
-                d: {
-                  user_id: string,
-                  user: {
-                      username: string,
-                      user_flags: string,
-                      name: string,
-                      id: string,
-                      icon: string,
-                      bot: bool,
-                  },
-                  roles: [],
-                  presence: string,
-                  last_permission_update: null,
-                  joined_at: string,
-                  id: string,
-                  house_id: string
-                }
-                """
-                if self._initialized:
-                    async def house_member_enter():
-                        """
-                        Handler for a member joining a mutual house. Trigger on_house_enter
-                        and returns as parameters the member obj and house obj.
-                        """
-                        try:
-                            # Removing the old user and appending the new data so it's up-to-date
-                            user_id = response_data.get('user_id')
-                            if user_id is None:
-                                # Backup is user id data
-                                user_id = response_data.get('user', {}).get('id', 0)
-
-                            # Getting the cached user
-                            cached_user = utils.get(self._users, id=int(user_id))
-                            if response_data.get('user') is not None:
-                                user = types.User(response_data['user'], self.http)
-
-                                if cached_user:
-                                    # Removing old data
-                                    self._users.remove(cached_user)
-
-                                # Everything is fine
-                                self._users.append(user)
-                            else:
-                                # If no user obj was sent the cached_user will server as the user
-                                # Which can only be possible if the data is faulty and the user
-                                # exists in another server
-                                logger.warning("[HOUSE_MEMBER_ENTER] Got faulty ws event data with no existing user "
-                                               "data!")
-                                user = None
-
-                            house_id = response_data.get('house_id')
-                            if house_id is None:
-                                house_id = response_data.get('house', {}).get('id', 0)
-                            house = utils.get(self._houses, id=int(house_id))
-
-                            # Checking if the house exits
-                            if house:
-                                cached_member = utils.get(house._members, user_id=int(response_data.get('user_id', 0)))
-                                if response_data.get('user') is not None:
-                                    member = types.Member(response_data['user'], house, self.http)
-
-                                    if cached_member:
-                                        # Removing old data
-                                        house._members.remove(cached_member)
-
-                                    # Everything is fine
-                                    house._members.append(member)
-                                else:
-                                    # Falling back to the cached_user!
-                                    if cached_member:
-                                        member = None
-                                        logger.warning("[HOUSE_MEMBER_ENTER] Got faulty ws event data with no "
-                                                       "existing member data!")
-                                    else:
-                                        member = None
-                                        logger.warning("[HOUSE_MEMBER_ENTER] Got faulty ws event data with no "
-                                                       "existing member data!")
+            handler = self._swarm_handlers.get(swarm_event)
+            if handler is not None:
+                func, _ = handler
+                await self._run_swarm_handler(swarm_event, func, response_data)
+            else:
+                logger.error(f"[WEBSOCKET] << Unknown Event {swarm_event} without Handler!")
 
-                            else:
-                                logger.warning("[HOUSE_MEMBER_ENTER] Failed to add new member to unknown house! "
-                                               "Possibly faulty client data!")
-                                house = None
-                                # Falling back to the user to provide some data
-                                member = user
-                                logger.warning("[HOUSE_MEMBER_ENTER] Event on_house_enter will have insufficient data! "
-                                               ">> House object will default to None and member will default to cached "
-                                               "user!")
-
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_house_member_enter(
-                                member=member,
-                                house=house
-                            ))
+        except Exception as e:
+            logger.debug(f"[WEBSOCKET] << Failed to handle Event in the websocket! "
+                         f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
 
-                        except Exception as e:
-                            logger.exception("[HOUSE_MEMBER_UPDATE] Failed to handle event and trigger "
-                                             f"'on_member_update'! Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(house_member_enter())
-
-            elif swarm_event == "HOUSE_MEMBER_UPDATE":
-                """
-                A member data was updated. (role update, permission update, nick etc.)
-                
-                Json-Data:
-                op: 0
-                d: {
-                  user_id: string,
-                  user: {
-                    website: string,
-                    username: string,
-                    user_flags: int,
-                    name: string,
-                    location: string,
-                    id: string,
-                    icon: string,
-                    header: string,
-                    email_verified: boolean,
-                    bot: boolean,
-                    bio: string
-                  },
-                  roles: object[],
-                  presence: string,
-                  last_permission_update: unknown,
-                  joined_at: string,
-                  id: string,
-                  house_id: string
-                }
-                """
-                if self._initialized:
-                    async def house_member_update_handler():
-                        """
-                        Handler for a house member update which will trigger on_member_update and return
-                        as parameter the old member obj, the new member obj and the house.
-                        """
-                        try:
-                            data = response_data
-                            house = utils.get(self._houses, id=int(data.get('house_id', 0)))
+    async def _run_swarm_handler(self, swarm_event: str, func: Callable, response_data: dict) -> None:
+        """
+        Runs the passed Swarm event handler and logs exceptions that were not handled by it
+        """
+        try:
+            await func(self, response_data)
+        except Exception as e:
+            logger.exception(f"[{swarm_event}] Failed to handle event! "
+                             f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
 
-                            # Removing the old user and appending the new data so it's up-to-date
-                            cached_user = utils.get(self._users, id=int(data.get('user_id', 0)))
-                            if data.get('user') is not None:
-                                user = types.User(data['user'], self.http)
+    # Swarm Event Handlers
+    # --------------------
+    @_swarm_event("INIT_STATE")
+    async def _init_state_handler(self, response_data: dict) -> None:
+        """
+        The client data was received and the client was initialized
+        """
+        logger.info("[WEBSOCKET] >> Initialization of Client was successful!")
 
-                                if cached_user:
-                                    self._users.remove(cached_user)
-                                self._users.append(user)
-                            else:
-                                user = None
-                                logger.warning("[HOUSE_MEMBER_UPDATE] Got faulty ws event data with no "
-                                               "existing member data!")
-                                if not cached_user:
-                                    logger.warning("[HOUSE_MEMBER_UPDATE] Unable to find user in the cache! "
-                                                   f"USER_ID={data.get('user_id')}")
-
-                            # Getting the cached member in the house if it exists
-                            cached_member = utils.get(house._members, user_id=int(data.get('user_id', 0)))
-                            if data.get('user') is not None:
-                                member = types.Member(data['user'], house, self.http)
-
-                                if cached_member:
-                                    # Removing the old data
-                                    house._members.remove(cached_member)
-                                house._members.append(member)
-                            else:
-                                logger.warning("[HOUSE_MEMBER_UPDATE] Got faulty ws event data with no "
-                                               "existing member data!")
-                                member = None
-                                if not cached_member:
-                                    logger.warning("[HOUSE_MEMBER_UPDATE] Unable to find member in the cache! "
-                                                   f"USER_ID={data.get('user_id')}")
-
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_house_member_update(
-                                old=cached_member,
-                                new=member,
-                                house=house
-                            ))
+    @_swarm_event("HOUSE_JOIN")
+    async def _house_join_handler(self, response_data: dict) -> None:
+        """
+        Handler for the house_join event of the connected client which will trigger
+        the on_house_add event and return as parameter the house.
+
+        The Client joined a house
+
+        Json-Data:
+        op: 0
+        d: {
+          rooms: room[{
+            type: int,
+            recipients: null
+            position: int,
+            permission_overrides: bits,
+            owner_id: string,
+            name: string,
+            last_message_id: string,
+            id: string,
+            house_id: string,
+            emoji: object,
+            description: string,
+            default_permission_override: int
+          }],
+          roles: role[{
+            position: int,
+            name: string,
+            level: int,
+            id: string,
+            deny: bits,
+            color: string,
+            allow: bits
+          }],
+          owner_id: string,
+          name: string,
+          members: [{
+            user_id: string,
+            user: {
+              username: string,
+              user_flags: string,
+              name: string,
+              id: string,
+              icon: string,
+              header: string,
+              presence: string
+            },
+            roles: array,
+            last_permission_update: string,
+            joined_at: string,
+            house_id: string
+          }],
+          id: string,
+          icon: string,
+          entities: [{
+            type: int,
+            resource_pointers: [{
+              resource_type: string,
+              resource_id: string
+            }],
+            position: int,
+            name: string,
+            id: string
+          }],
+          default_permissions: int,
+          banner: string
+        }
+        """
+        data = response_data
+
+        house_id = int(data.get('id', 0))
+        if house_id in self._refreshing_houses:
+            # Cached house that was sent again after a reconnect => Not a new house
+            self._refreshing_houses.discard(house_id)
+            cached_house = self._houses.get(house_id)
+            if cached_house is not None:
+                await self._reconcile_house(cached_house, data)
+                self._check_ready()
+                return
 
-                        except Exception as e:
-                            logger.exception("[HOUSE_MEMBER_UPDATE] Failed to handle event and trigger "
-                                             f"'on_member_update'! Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(house_member_update_handler())
-
-            elif swarm_event == "HOUSE_MEMBER_JOIN":
-                """
-                A user joined a house
-                
-                Json-Data:
-                house_id: string,
-                joined_at: timestamp,
-                roles: []
-                length: int
-                user: {
-                    id: string,
-                    name: string,
-                    user_flags: string,
-                    username: string,
-                }
-                """
-                # In work
-                if self._ready:
-                    async def house_join_handler():
-                        """
-
-                        """
-                        data = response_data
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(house_join_handler())
-
-            elif swarm_event == "ROOM_CREATE":
-                """
-                A room was created in a house
-                
-                Json-Data:
-                house_id: string,
-                id: string,
-                name: string,
-                position: int,
-                type: int
-                """
-                # In work
-                if self._ready:
-                    async def room_create_handler():
-                        pass
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(room_create_handler())
-
-            elif swarm_event == "HOUSE_MEMBER_EXIT":
-                """
-                A member left a house
-                
-                Json-Data:
-                op: 0
-                d: {
-                    id: string,
-                    house_id: string
-                }
-                """
-                if self._ready:
-                    async def house_member_exit_handler():
-                        """
-                        Handler for a house member exit event. Removes the member
-                        from the house members list and triggers on_house_exit and
-                        returns as parameter the user obj and house obj
-                        """
-                        try:
-                            data = response_data
-                            user = utils.get(self._users, id=int(data.get('id')))
-                            house = utils.get(self._houses, id=int(data.get('house_id')))
-                            if house:
-                                cached_mem = utils.get(house._members, user_id=int(data.get('id')))
-                                if cached_mem:
-                                    house._members.remove(cached_mem)
-                                else:
-                                    logger.warning("[HOUSE_MEMBER_EXIT] Failed to find member in the client cache! "
-                                                   "Possibly faulty client data!")
-                            else:
-                                logger.warning("[HOUSE_MEMBER_EXIT] Failed to find House in the client cache! "
-                                               "Possibly faulty client data!")
+        # Creating a house object that will then be added to the cache
+        house = types.House(data, self.http, self.id)
+        if self._houses.get(house.id) is not None:
+            logger.warning("[HOUSE_JOIN] Replaced cached house with same id on_house_add. "
+                           "Possibly old or faulty Client data!")
+
+        if data.get('members') is None:
+            logger.warning("[HOUSE_JOIN] Got empty members list in on_house_add!")
+        else:
+            for usr in data['members']:
+                if hasattr(usr, 'id'):
+                    user_id = int(usr.get('id', 0))
+                else:
+                    user_id = int(usr['user'].get('id', 0))
+
+                # If the user doesn't exist it needs to be added to the cache else the
+                # cached user gets patched with the new data
+                cached_user = self._users.get(user_id)
+                if cached_user is None:
+                    self._users.upsert(types.User(usr, self.http))
+                elif cached_user._update(usr):
+                    self._users.reindex(cached_user)
+
+            # Using the room objects of the house to avoid creating duplicates
+            for room in house.rooms:
+                self._rooms.upsert(room)
+
+        # Adding the house to the client cache and replacing old data if it exists
+        self._houses.upsert(house)
+
+        # Sets the client ready if this was the last missing house of the INIT_STATE
+        self._check_ready()
+
+        # Creating a new task for handling the event
+        # TODO! Needs error handling and name traceback and log!
+        asyncio.create_task(self._event_handler.ev_house_join(house))
+
+    async def _reconcile_house(self, house: types.House, data: dict) -> None:
+        """
+        Patches a cached house in-place with the data of its HOUSE_JOIN after a reconnect and triggers the
+        events for the changes that were missed while the client was disconnected
+        """
+        changes = house._reconcile(data)
+        if changes['house']:
+            # The indexed fields of the house like the name were patched in-place
+            self._houses.reindex(house)
+
+        for usr in data.get('members') or []:
+            cached_user = self._users.get(int(usr.get('user', usr).get('id', 0)))
+            if cached_user is None:
+                self._users.upsert(types.User(usr, self.http))
+            elif cached_user._update(usr):
+                self._users.reindex(cached_user)
+
+        added, changed, removed = changes['rooms']
+        for room in added + changed:
+            self._rooms.upsert(room)
+        for room in removed:
+            self._rooms.delete(room.id)
+
+        added, changed, removed = changes['members']
+        for member in added:
+            asyncio.create_task(self._event_handler.ev_house_member_enter(member=member, house=house))
+        for old, member in changed:
+            asyncio.create_task(self._event_handler.ev_house_member_update(old=old, new=member, house=house))
+        for member in removed:
+            asyncio.create_task(self._event_handler.ev_house_member_exit(
+                user=self._users.get(member.id), house=house))
+
+        logger.debug(f"[HOUSE_JOIN] Reconciled cached house {house.id} after reconnecting: "
+                     + ", ".join(f"{name} +{len(changes[name][0])} ~{len(changes[name][1])} "
+                                 f"-{len(changes[name][2])}" for name in ('members', 'rooms', 'categories')))
+
+    @_swarm_event("HOUSE_LEAVE")
+    async def _house_leave_handler(self, response_data: dict) -> None:
+        """
+        Handler for the house_join event of the connected client which will
+        trigger on_house_remove and return as parameter the removed house.
 
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_house_member_exit(
-                                user=user,
-                                house=house
-                            ))
+        The client leaves a house
 
-                        except Exception as e:
-                            logger.exception("[HOUSE_MEMBER_EXIT] Failed to handle event and trigger "
-                                             f"'on_house_exit'! Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(house_member_exit_handler())
-
-            elif swarm_event == "PRESENCE_UPDATE":
-                """
-                A user presence was updated
-                
-                Json-Data:
-                op: 0
-                d: {
-                  username: string,
-                  user_flags: string,
-                  name: string,
-                  id: string,
-                  icon: string,
-                  header: string,
-                  presence: string
-                }
-                """
-                if self._ready:
-                    async def presence_update_handler():
-                        """
-                        Handler for a User Presence update
-                        """
-                        try:
-                            user = types.User(response_data, self.http)
-                            presence = types.Presence(response_data, user, self.http)
+        Json-Data:
+        op: 0
+        d: {
+          id: string,
+          house_id: string
+        }
+        """
+        house = self._houses.delete(int(response_data.get('house_id')))
+        if house:
+            # Removing the rooms of the house from the client cache
+            for room in house.rooms:
+                self._rooms.delete(room.id)
+        else:
+            logger.debug("[HOUSE_LEAVE] Unable to locate left house in house cache! "
+                         "Possibly faulty Client data!")
+
+        # Creating a new task for handling the event
+        # TODO! Needs error handling and name traceback and log!
+        asyncio.create_task(self._event_handler.ev_house_exit(house=house))
+
+    @_swarm_event("HOUSE_DOWN")
+    async def _house_down_handler(self, response_data: dict) -> None:
+        """
+        Handler for downtime of a house! Triggers on_house_down and
+        returns as parameter the time of downtime and the house
 
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_presence_update(presence, user))
+        A house is unreachable
 
-                        except Exception as e:
-                            logger.exception("[PRESENCE_UPDATE] Failed to handle event and trigger "
-                                             f"'on_presence_update'! Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(presence_update_handler())
-
-            elif swarm_event == "MESSAGE_CREATE":
-                """
-                A user created a message
-                
-                Json-Data:
-                op: 0
-                d: {
-                  timestamp: int,
-                  room_id: string,
-                  mentions: [{
-                    username: string,
-                    user_flags: string,
-                    name: string,
-                    id: string,
-                    icon: string,
-                    header: string,
-                    presence: string,
-                    bot: boolean
-                  }],
-                  member: {
-                    user_id: string,
-                    user: {
-                      username: string,
-                      user_flags: string,
-                      name: string,
-                      id: string,
-                      icon: string,
-                      header: string,
-                      presence: string
-                    },
-                    roles: array,
-                    last_permission_update: string,
-                    joined_at: string,
-                    house_id: string
-                  },
-                  id: string,
-                  house_id: string,
-                  exploding_age: int,
-                  exploding: boolean,
-                  device_id: string,
-                  content: string,
-                  bucket: int,
-                  author_id: string,
-                  author: {
-                    username: string,
-                    user_flags: string,
-                    name: string,
-                    id: string,
-                    icon: string,
-                    header: string,
-                    presence: string
-                  }
-                  attachment: {
-                    media_url: string,
-                    filename: string,
-                    dimensions: {
-                      width: int,
-                      type: string,
-                      height: int
-                    }
-                  }
-                }
-                """
-                if self._ready:
-                    async def msg_create_handler():
-                        """
-                        Handler for created messages which will trigger the 'on_message_create' event
-                        and update cached data (room, author). Will return as parameter the created
-                        msg object.
-                        """
-                        try:
-                            data = response_data
-                            if data.get('house_id'):
-                                house = utils.get(self._houses, id=int(data.get('house_id', 0)))
-                            else:
-                                house = None
-
-                            if house:
-                                # Updating the last message id in the Room
-                                room = utils.get(self._rooms, id=int(data.get('room_id', 0)))
-                                if room in self._rooms:
-                                    self._rooms.remove(room)
-                                    room._last_message_id = data.get('id')
-                                    self._rooms.append(room)
-                                else:
-                                    room = None
-                                    logger.warning("[MESSAGE_CREATE] Unable to find private-room in the cache! "
-                                                   f"ROOM_ID={data.get('room_id')}")
+        Json-Data:
+        op: 0
+        d: {
+          unavailable: boolean,
+          house_id: string
+        }
+        """
+        data = response_data
+        t = time.time()
+        house = self._houses.get(int(data.get('house_id', 0)))
+        if data.get('unavailable'):
+            logger.debug(f"[HOUSE_DOWN] << Downtime of '{house.name}' reported! "
+                         "House was either deleted or is currently unavailable!")
+        else:
+            pass
 
-                            else:
-                                # Updating the last message id in the Private-Room
-                                private_room = utils.get(self._private_rooms, id=int(data.get('room_id', 0)))
-                                if private_room:
-                                    self._private_rooms.remove(private_room)
-                                    private_room._last_message_id = data.get('id')
-                                    self._private_rooms.append(private_room)
-
-                                    room = private_room
-                                else:
-                                    room = None
-                                    logger.warning("[MESSAGE_CREATE] Unable to find private-room in the cache! "
-                                                   f"ROOM_ID={data.get('room_id')}")
-
-                            # Removing the old user and appending the new data so it's up-to-date
-                            cached_author = utils.get(self._users, id=int(data.get('author_id', 0)))
-                            if data.get('author') is not None:
-                                author = types.User(data['author'], self.http)
-
-                                if cached_author:
-                                    # Removing the old data from the list
-                                    self._users.remove(cached_author)
-                                self._users.append(author)
-                            else:
-                                logger.warning("[MESSAGE_CREATE] Author from incoming ws event data not found "
-                                               "in cache! Possibly faulty client data!")
-                                author = None
-                                if not cached_author:
-                                    logger.warning("[MESSAGE_CREATE] Unable to find author in the cache! "
-                                                   f"USER_ID={data.get('author_id')}")
+        # Creating a new task for handling the event
+        # TODO! Needs error handling and name traceback and log!
+        asyncio.create_task(self._event_handler.ev_house_down(time=t, house=house))
 
-                            msg = types.Message(response_data, self.http, house, room, author)
+    @_swarm_event("HOUSE_MEMBER_ENTER")
+    async def _house_member_enter_handler(self, response_data: dict) -> None:
+        """
+        Handler for a member joining a mutual house. Trigger on_house_enter
+        and returns as parameters the member obj and house obj.
+
+        A user joined a house or went online?
+
+        Json-Data:
+        op: 0
+        d: {
+          user_id: string,
+          user: {
+              username: string,
+              user_flags: string,
+              name: string,
+              id: string,
+              icon: string,
+              bot: bool,
+          },
+          roles: [],
+          presence: string,
+          last_permission_update: null,
+          joined_at: string,
+          id: string,
+          house_id: string
+        }
+        """
+        try:
+            # Patching the cached user with the new data so it's up-to-date
+            user_id = response_data.get('user_id')
+            if user_id is None:
+                # Backup is user id data
+                user_id = response_data.get('user', {}).get('id', 0)
+
+            if response_data.get('user') is not None:
+                user = self._users.get(int(user_id))
+                if user is None:
+                    user = types.User(response_data['user'], self.http)
+                    self._users.upsert(user)
+                elif user._update(response_data['user']):
+                    self._users.reindex(user)
+            else:
+                # If no user obj was sent the cached_user will server as the user
+                # Which can only be possible if the data is faulty and the user
+                # exists in another server
+                logger.warning("[HOUSE_MEMBER_ENTER] Got faulty ws event data with no existing user "
+                               "data!")
+                user = None
+
+            house_id = response_data.get('house_id')
+            if house_id is None:
+                house_id = response_data.get('house', {}).get('id', 0)
+            house = self._houses.get(int(house_id))
+
+            # Checking if the house exits
+            if house:
+                cached_member = house._members.get(int(user_id))
+                if response_data.get('user') is not None:
+                    if cached_member is None:
+                        member = types.Member(response_data, house, self.http)
+                        house._members.upsert(member)
+                    else:
+                        # Patching the existing member to keep the object identity
+                        member = cached_member
+                        if member._update(response_data):
+                            house._members.reindex(member)
+                else:
+                    # Falling back to the cached_user!
+                    if cached_member:
+                        member = None
+                        logger.warning("[HOUSE_MEMBER_ENTER] Got faulty ws event data with no "
+                                       "existing member data!")
+                    else:
+                        member = None
+                        logger.warning("[HOUSE_MEMBER_ENTER] Got faulty ws event data with no "
+                                       "existing member data!")
 
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_message_create(msg))
+            else:
+                logger.warning("[HOUSE_MEMBER_ENTER] Failed to add new member to unknown house! "
+                               "Possibly faulty client data!")
+                house = None
+                # Falling back to the user to provide some data
+                member = user
+                logger.warning("[HOUSE_MEMBER_ENTER] Event on_house_enter will have insufficient data! "
+                               ">> House object will default to None and member will default to cached "
+                               "user!")
+
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_house_member_enter(
+                member=member,
+                house=house
+            ))
 
-                        except Exception as e:
-                            logger.exception("[MESSAGE_CREATE] Failed to handle event and trigger 'on_message_create'! "
-                                             f"Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(msg_create_handler())
-
-            elif swarm_event == "MESSAGE_DELETE":
-                """
-                A user deleted a message
-                
-                Json-Data:
-                op: 0
-                d: {
-                  room_id: string,
-                  message_id: string,
-                  house_id: string
-                }
-                """
-                if self._ready:
-                    async def msg_delete_handler():
-                        """
-                        Handler for a deleted message which will trigger the on_message_delete event
-                        and return as parameter a DeletedMessage object.
-                        """
-                        try:
-                            msg = types.DeletedMessage(response_data)
+        except Exception as e:
+            logger.exception("[HOUSE_MEMBER_UPDATE] Failed to handle event and trigger "
+                             f"'on_member_update'! Exception: {e}")
 
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_message_delete(msg))
+    @_swarm_event("HOUSE_MEMBER_UPDATE")
+    async def _house_member_update_handler(self, response_data: dict) -> None:
+        """
+        Handler for a house member update which will trigger on_member_update and return
+        as parameter the old member obj, the new member obj and the house.
+
+        A member data was updated. (role update, permission update, nick etc.)
+
+        Json-Data:
+        op: 0
+        d: {
+          user_id: string,
+          user: {
+            website: string,
+            username: string,
+            user_flags: int,
+            name: string,
+            location: string,
+            id: string,
+            icon: string,
+            header: string,
+            email_verified: boolean,
+            bot: boolean,
+            bio: string
+          },
+          roles: object[],
+          presence: string,
+          last_permission_update: unknown,
+          joined_at: string,
+          id: string,
+          house_id: string
+        }
+        """
+        try:
+            data = response_data
+            house = self._houses.get(int(data.get('house_id', 0)))
+
+            # Patching the cached user with the new data so it's up-to-date
+            cached_user = self._users.get(int(data.get('user_id', 0)))
+            if data.get('user') is not None:
+                if cached_user is None:
+                    user = types.User(data['user'], self.http)
+                    self._users.upsert(user)
+                elif cached_user._update(data['user']):
+                    self._users.reindex(cached_user)
+            else:
+                user = None
+                logger.warning("[HOUSE_MEMBER_UPDATE] Got faulty ws event data with no "
+                               "existing member data!")
+                if not cached_user:
+                    logger.warning("[HOUSE_MEMBER_UPDATE] Unable to find user in the cache! "
+                                   f"USER_ID={data.get('user_id')}")
+
+            # Getting the cached member in the house if it exists
+            cached_member = house._members.get(int(data.get('user_id', 0)))
+            if data.get('user') is not None:
+                if cached_member is None:
+                    member = types.Member(data, house, self.http)
+                    house._members.upsert(member)
+                else:
+                    # Patching the existing member in-place and passing a snapshot
+                    # of the previous state as old member
+                    member = cached_member
+                    cached_member = copy.copy(member)
+                    if member._update(data):
+                        house._members.reindex(member)
+            else:
+                logger.warning("[HOUSE_MEMBER_UPDATE] Got faulty ws event data with no "
+                               "existing member data!")
+                member = None
+                if not cached_member:
+                    logger.warning("[HOUSE_MEMBER_UPDATE] Unable to find member in the cache! "
+                                   f"USER_ID={data.get('user_id')}")
+
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_house_member_update(
+                old=cached_member,
+                new=member,
+                house=house
+            ))
 
-                        except Exception as e:
-                            logger.exception("[MESSAGE_DELETE] Failed to handle event and trigger 'on_message_delete'! "
-                                             f"Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(msg_delete_handler())
-
-            elif swarm_event == "MESSAGE_UPDATE":
-                """
-                User edited message update
-                
-                Json-Data:
-                op: 0
-                d: {
-                  type: int,
-                  timestamp: string,
-                  room_id: string,
-                  metadata: unknown,
-                  mentions: [{
-                    username: string,
-                    user_flags: string,
-                    name: string,
-                    id: string,
-                    icon: string,
-                    header: string,
-                    presence: string
-                  }],
-                  id: string,
-                  house_id: string,
-                  exploding_age: int,
-                  exploding: boolean,
-                  embed: object,
-                  edited_at: string,
-                  device_id: string,
-                  content: string,
-                  bucket: int,
-                  author_id: string,
-                  attachment: {
-                    media_url: string,
-                    filename: string,
-                    dimensions: {
-                      width: int,
-                      type: string,
-                      height: int
-                    }
-                  }
-                }
-                """
-                if self._ready:
-                    async def msg_update_handler():
-                        """
-                        Handler for a deleted message which will create a new msg object
-                        and return as parameter the object.
-                        """
-                        try:
-                            # Removes old data in the client cache if possible and reuses older data since
-                            # no new data is getting sent with the event.
+        except Exception as e:
+            logger.exception("[HOUSE_MEMBER_UPDATE] Failed to handle event and trigger "
+                             f"'on_member_update'! Exception: {e}")
 
-                            data = response_data
-                            if data.get('house_id') is not None:
-                                house = utils.get(self._houses, id=int(data.get('house_id', 0)))
-                            else:
-                                house = None
-
-                            if house:
-                                # Updating the last message id in the Room
-                                room = utils.get(self._rooms, id=int(data.get('room_id', 0)))
-                                if room in self._rooms:
-                                    self._rooms.remove(room)
-                                    room._last_message_id = data.get('id')
-                                    self._rooms.append(room)
-                                else:
-                                    room = None
-                                    logger.warning("[MESSAGE_UPDATE] Unable to find private-room in the cache! "
-                                                   f"ROOM_ID={data.get('room_id')}")
+    # In work
+    @_swarm_event("HOUSE_MEMBER_JOIN", requires_ready=True)
+    async def _house_member_join_handler(self, response_data: dict) -> None:
+        """
+        A user joined a house
+
+        Json-Data:
+        house_id: string,
+        joined_at: timestamp,
+        roles: []
+        length: int
+        user: {
+            id: string,
+            name: string,
+            user_flags: string,
+            username: string,
+        }
+        """
+        pass
 
-                            else:
-                                # Updating the last message id in the Private-Room
-                                private_room = utils.get(self._private_rooms, id=int(data.get('room_id', 0)))
-                                if private_room:
-                                    self._private_rooms.remove(private_room)
-                                    private_room._last_message_id = data.get('id')
-                                    self._private_rooms.append(private_room)
-
-                                    room = private_room
-                                else:
-                                    logger.warning("[MESSAGE_UPDATE] Unable to find private-room in the cache! "
-                                                   f"ROOM_ID={data.get('room_id')}")
-                                    room = None
-
-                            # Getting the author from the cache if it exists
-                            cached_author = utils.get(self._users, id=int(data.get('author_id', 0)))
-                            if not cached_author:
-                                logger.warning("[MESSAGE_UPDATE] Author from incoming ws event data not found "
-                                               "in cache! Possibly faulty client data!")
-                                author = None
-                            else:
-                                # Using the cached author since no data is received
-                                author = cached_author
+    # In work
+    @_swarm_event("ROOM_CREATE", requires_ready=True)
+    async def _room_create_handler(self, response_data: dict) -> None:
+        """
+        A room was created in a house
+
+        Json-Data:
+        house_id: string,
+        id: string,
+        name: string,
+        position: int,
+        type: int
+        """
+        pass
 
-                            message = types.Message(data, self.http, house=house, room=room, author=author)
+    @_swarm_event("HOUSE_MEMBER_EXIT", requires_ready=True)
+    async def _house_member_exit_handler(self, response_data: dict) -> None:
+        """
+        Handler for a house member exit event. Removes the member
+        from the house members list and triggers on_house_exit and
+        returns as parameter the user obj and house obj
+
+        A member left a house
+
+        Json-Data:
+        op: 0
+        d: {
+            id: string,
+            house_id: string
+        }
+        """
+        try:
+            data = response_data
+            user = self._users.get(int(data.get('id')))
+            house = self._houses.get(int(data.get('house_id')))
+            if house:
+                cached_mem = house._members.delete(int(data.get('id')))
+                if cached_mem is None:
+                    logger.warning("[HOUSE_MEMBER_EXIT] Failed to find member in the client cache! "
+                                   "Possibly faulty client data!")
+            else:
+                logger.warning("[HOUSE_MEMBER_EXIT] Failed to find House in the client cache! "
+                               "Possibly faulty client data!")
 
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_message_update(message))
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_house_member_exit(
+                user=user,
+                house=house
+            ))
 
-                        except Exception as e:
-                            logger.exception("[MESSAGE_UPDATE] Failed to handle event and trigger 'on_message_update'! "
-                                             f"Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(msg_update_handler())
-
-            elif swarm_event == "TYPING_START":
-                """
-                User started typing
-                
-                Json-Data:
-                op: 0
-                d: {
-                  timestamp: int,
-                  room_id: string,
-                  house_id: string,
-                  author_id: string
-                }
-                """
-                if self._ready:
-                    async def typing_start_handler():
-                        """
-                        Handler for the typing_start event that will trigger the event
-                        on_typing_start and return as parameter the typing object with
-                        the room, house and member as attributes.
-                        """
-                        try:
-                            data = response_data
-                            if data.get('recipient_ids') is None:
-                                room = utils.get(self._rooms, id=int(response_data.get('room_id', 0)))
-                                house = utils.get(self._houses, id=int(response_data.get('house_id', 0)))
-                                author = utils.get(house.members, id=int(response_data.get('author_id', 0)))
-                            else:
-                                room = utils.get(self._private_rooms, id=int(response_data.get('room_id', 0)))
-                                house = None
-                                author = utils.get(self._users, id=int(response_data.get('author_id', 0)))
+        except Exception as e:
+            logger.exception("[HOUSE_MEMBER_EXIT] Failed to handle event and trigger "
+                             f"'on_house_exit'! Exception: {e}")
 
-                            typing = types.Typing(response_data, author, room, house, self.http)
+    @_swarm_event("PRESENCE_UPDATE", requires_ready=True)
+    async def _presence_update_handler(self, response_data: dict) -> None:
+        """
+        Handler for a User Presence update
+
+        A user presence was updated
+
+        Json-Data:
+        op: 0
+        d: {
+          username: string,
+          user_flags: string,
+          name: string,
+          id: string,
+          icon: string,
+          header: string,
+          presence: string
+        }
+        """
+        try:
+            user = self._users.get(int(response_data.get('id', 0)))
+            if user is None:
+                user = types.User(response_data, self.http)
+            elif user._update(response_data):
+                self._users.reindex(user)
+            presence = types.Presence(response_data, user, self.http)
 
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_typing_start(typing))
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_presence_update(presence, user))
 
-                        except Exception as e:
-                            logger.exception("[TYPING_START] Failed to handle event and trigger 'on_typing_start'! "
-                                             f"Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(typing_start_handler())
-
-            elif swarm_event == "TYPING_END":
-                """
-                Typing of a user ended
-                
-                Currently not existing!
-                
-                Json-Data:
-                """
-                if self._ready:
-                    async def typing_end_handler():
-                        """
-                        Handler for the typing_end event which will trigger the typing_end
-                        event and return as parameter the Typing object with the room,
-                        house and member as parameter.
-
-                        Currently non-existed and only serves as placeholder in case
-                        it is added in the future
-                        """
-                        try:
-                            room = utils.get(self._rooms, id=int(response_data.get('room_id', 0)))
-                            house = utils.get(self._houses, id=int(response_data.get('room_id', 0)))
-                            member = utils.get(house.members, id=int(response_data.get('room_id', 0)))
-                            typing = types.Typing(response_data, member, room, house, self.http)
+        except Exception as e:
+            logger.exception("[PRESENCE_UPDATE] Failed to handle event and trigger "
+                             f"'on_presence_update'! Exception: {e}")
 
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_typing_end(typing))
+    @_swarm_event("MESSAGE_CREATE", requires_ready=True)
+    async def _message_create_handler(self, response_data: dict) -> None:
+        """
+        Handler for created messages which will trigger the 'on_message_create' event
+        and update cached data (room, author). Will return as parameter the created
+        msg object.
+
+        A user created a message
+
+        Json-Data:
+        op: 0
+        d: {
+          timestamp: int,
+          room_id: string,
+          mentions: [{
+            username: string,
+            user_flags: string,
+            name: string,
+            id: string,
+            icon: string,
+            header: string,
+            presence: string,
+            bot: boolean
+          }],
+          member: {
+            user_id: string,
+            user: {
+              username: string,
+              user_flags: string,
+              name: string,
+              id: string,
+              icon: string,
+              header: string,
+              presence: string
+            },
+            roles: array,
+            last_permission_update: string,
+            joined_at: string,
+            house_id: string
+          },
+          id: string,
+          house_id: string,
+          exploding_age: int,
+          exploding: boolean,
+          device_id: string,
+          content: string,
+          bucket: int,
+          author_id: string,
+          author: {
+            username: string,
+            user_flags: string,
+            name: string,
+            id: string,
+            icon: string,
+            header: string,
+            presence: string
+          }
+          attachment: {
+            media_url: string,
+            filename: string,
+            dimensions: {
+              width: int,
+              type: string,
+              height: int
+            }
+          }
+        }
+        """
+        try:
+            data = response_data
+            if data.get('house_id'):
+                house = self._houses.get(int(data.get('house_id', 0)))
+            else:
+                house = None
 
-                        except Exception as e:
-                            logger.exception("[TYPING_END] Failed to handle event and trigger "
-                                             f"'on_typing_end'! Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(typing_end_handler())
-
-            elif swarm_event == "HOUSE_MEMBERS_CHUNK":
-                """
-                For requesting house member states
-                
-                Json-Data:
-                op: 0
-                d: {
-                  members: {
-                    id: {
-                      user_id: string,
-                      user: {
-                        username: string,
-                        user_flags: string,
-                        name: string,
-                        id: string,
-                        icon: string,
-                        header: string,
-                        presence: string
-                      },
-                      roles: array,
-                      last_permission_update: string,
-                      joined_at: string,
-                      house_id: string
-                    }
-                  },
-                  house_id: string
-                }
-                """
-                if self._ready:
-                    async def member_chunk_handler():
-                        """
-                        In Work!
-
-                        Handler for a house member chunk update which updates for every
-                        sent member object the object in the house list. Triggers
-                        on_house_member_chunk and returns as parameter the changed
-                        members, the raw data and the house object.
-                        """
-                        try:
-                            data = response_data
-                            house = utils.get(self._houses, id=int(data.get('house_id')))
-
-                            mem_dict = data.get('members')
-                            members = []
-                            for mem_id in mem_dict.keys():
-                                cached_mem = utils.get(house.members, id=int(mem_id))
-                                if cached_mem is not None:
-                                    house._members.remove(cached_mem)
-                                    mem = types.Member(mem_dict.get(mem_id), self.http, house)
-                                    house._members.append(mem)
-                                    members.append(mem)
-                                else:
-                                    name = mem_dict.get(mem_id).get('name')
-                                    logger.warning(f"[HOUSE_MEMBERS_CHUNK] Failed to update member data of "
-                                                   f"{name} in house {house.name}")
-
-                                cached_user = utils.get(self._users, id=int(mem_id))
-                                if cached_user is not None:
-                                    self._users.remove(cached_user)
-                                    user = types.User(mem_dict.get(mem_id), self.http)
-                                    self._users.append(user)
-                                else:
-                                    name = mem_dict.get(mem_id).get('name')
-                                    logger.warning(f"[HOUSE_MEMBERS_CHUNK] Failed to update user data of "
-                                                   f"{name} in client cache!")
-
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_house_member_chunk(
-                                members=members,
-                                data=data,
-                                house=house))
+            if house:
+                # Updating the last message id in the Room
+                room = self._rooms.get(int(data.get('room_id', 0)))
+                if room:
+                    room._last_message_id = data.get('id')
+                else:
+                    logger.warning("[MESSAGE_CREATE] Unable to find room in the cache! "
+                                   f"ROOM_ID={data.get('room_id')}")
 
-                        except Exception as e:
-                            logger.exception("[HOUSE_MEMBERS_CHUNK] Failed to handle event and trigger "
-                                             f"'on_house_member_chunk'! Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(member_chunk_handler())
-
-            elif swarm_event == "BATCH_HOUSE_MEMBER_UPDATE":
-                """
-                Multiple updates of members that are stacked
-                
-                Json-Data:
-                {
-                  house_id: string;
-                  batch_type: list;
-                  batch_size: int;
-                  data: {
-                    [resource_id: string]: HouseMember
-                  }
-                }
-                """
-                if self._ready:
-                    async def batch_house_member_handler():
-                        """
-                        In Work!
-
-                        Handler for a batch house member update that includes a list of
-                        members that were updated. Triggers on_batch_house_member_update
-                        and returns as parameters the members list, the raw data and the house obj
-
-                        """
-                        try:
-                            data = response_data
-                            house = utils.get(self._houses, id=int(data.get('house_id')))
-                            members = list([types.Member(data, house, self.http) for data in data.get('data', [])])
-
-                            for mem in members:
-                                mem_id = getattr(mem, "id")
-                                # Checking whether the id exists and the object was created correctly
-                                if mem_id:
-                                    cached_mem = utils.get(house.members, id=int(mem_id))
-                                    if cached_mem is not None:
-                                        # Replaying the members data
-                                        house._members.remove(cached_mem)
-                                        house._members.append(mem)
-                                    else:
-                                        logger.warning(f"[BATCH_HOUSE_MEMBER_UPDATE] Failed to update member data "
-                                                       f"of {mem.name} in house {house.name}")
-                                else:
-                                    logger.warning(f"[BATCH_HOUSE_MEMBER_UPDATE] Failed to update member data of "
-                                                   f"unknown member in house {house.name} because of faulty user data! "
-                                                   "Possibly faulty client data!")
-
-                            users = list([types.User(data, self.http) for data in data.get('data', [])])
-
-                            for user in users:
-                                usr_id = getattr(user, "id")
-                                # Checking whether the id exists and the object was created correctly
-                                if usr_id:
-                                    cached_user = utils.get(self._users, id=int(usr_id))
-                                    if cached_user is not None:
-                                        # Replaying the users data
-                                        self._users.remove(cached_user)
-                                        self._users.append(user)
-                                    else:
-                                        logger.warning(f"[BATCH_HOUSE_MEMBER_UPDATE] Failed to update user data "
-                                                       "of {user.name} in house {house.name}! Possibly faulty client data!")
-                                else:
-                                    logger.warning(f"[BATCH_HOUSE_MEMBER_UPDATE] Failed to update user data "
-                                                   f"of unknown user in house {house.name} because of faulty user data!"
-                                                   " Possibly faulty client data!")
-
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_batch_house_member_update(
-                                members=members,
-                                data=data,
-                                house=house))
+            else:
+                # Updating the last message id in the Private-Room
+                room = self._private_rooms.get(int(data.get('room_id', 0)))
+                if room:
+                    room._last_message_id = data.get('id')
+                else:
+                    logger.warning("[MESSAGE_CREATE] Unable to find private-room in the cache! "
+                                   f"ROOM_ID={data.get('room_id')}")
+
+            # Patching the cached user with the new data so it's up-to-date
+            cached_author = self._users.get(int(data.get('author_id', 0)))
+            if data.get('author') is not None:
+                if cached_author is None:
+                    author = types.User(data['author'], self.http)
+                    self._users.upsert(author)
+                else:
+                    author = cached_author
+                    if author._update(data['author']):
+                        self._users.reindex(author)
+            else:
+                logger.warning("[MESSAGE_CREATE] Author from incoming ws event data not found "
+                               "in cache! Possibly faulty client data!")
+                author = None
+                if not cached_author:
+                    logger.warning("[MESSAGE_CREATE] Unable to find author in the cache! "
+                                   f"USER_ID={data.get('author_id')}")
 
-                        except Exception as e:
-                            logger.exception("[BATCH_HOUSE_MEMBER_UPDATE] Failed to handle event and trigger "
-                                             f"'on_batch_house_member_update'! Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(batch_house_member_handler())
-
-            elif swarm_event == "HOUSE_ENTITIES_UPDATE":
-                """
-                House entities was updated
-                
-                Json-Data:
-                op: 0
-                d: {
-                  house_id: string,
-                  entities: [{
-                    type: int,
-                    resource_pointers: [{
-                      resource_type: string,
-                      resource_id: string
-                    }],
-                    position: int,
-                    name: string,
-                    id: string
-                  }]
-                }
-                """
-                if self._ready:
-                    async def house_entity_update_handler():
-                        """
-                        In Work!
-
-                        Handler for a house entity update. Triggers on_house_entity_update and
-                        returns as parameter the house obj, the entity obj and the raw data
-                        """
-                        try:
-                            data = response_data
-                            house = utils.get(self._houses, id=int(data.get('house_id')))
-                            entity = None  # TODO! Insert entity
-
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_house_entity_update(
-                                house=house,
-                                entity=entity,
-                                data=data
-                            ))
+            msg = types.Message(response_data, self.http, house, room, author)
 
-                        except Exception as e:
-                            logger.exception("[HOUSE_ENTITIES_UPDATE] Failed to handle event and trigger "
-                                             f"'on_house_entity_update'! Exception: {e}")
-
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(house_entity_update_handler())
-
-            elif swarm_event == "RELATIONSHIP_UPDATE":
-                """
-                Relationship between two users was updated
-                
-                Json-Data:
-                op: 0
-                d: {
-                  user: {
-                    website: string,
-                    username: string,
-                    user_flags: int,
-                    name: string,
-                    location: string,
-                    id: string,
-                    icon: string,
-                    bio: string
-                  },
-                  type: int,
-                  recipient_id: string,
-                  id: string
-                }
-                """
-                if self._ready:
-                    async def relationship_update_handler():
-                        """
-                        Handler for a relationship update. Triggers on_relationship_update
-                        and returns as parameter the relationship obj.
-                        """
-                        try:
-                            data = response_data
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_message_create(msg))
 
-                            cache_relationship = utils.get(self._relationships, id=int(data.get('id')))
-                            relationship = types.Relationship(data, self.http)
-                            if cache_relationship:
-                                # Removing the old data
-                                self._relationships.remove(cache_relationship)
+        except Exception as e:
+            logger.exception("[MESSAGE_CREATE] Failed to handle event and trigger 'on_message_create'! "
+                             f"Exception: {e}")
 
-                            # Adding the new data
-                            self._relationships.append(relationship)
+    @_swarm_event("MESSAGE_DELETE", requires_ready=True)
+    async def _message_delete_handler(self, response_data: dict) -> None:
+        """
+        Handler for a deleted message which will trigger the on_message_delete event
+        and return as parameter a DeletedMessage object.
+
+        A user deleted a message
+
+        Json-Data:
+        op: 0
+        d: {
+          room_id: string,
+          message_id: string,
+          house_id: string
+        }
+        """
+        try:
+            msg = types.DeletedMessage(response_data)
 
-                            # Creating a new task for handling the event
-                            # TODO! Needs error handling and name traceback and log!
-                            asyncio.create_task(self._event_handler.ev_relationship_update(
-                                relationship=relationship
-                            ))
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_message_delete(msg))
 
-                        except Exception as e:
-                            logger.exception("[RELATIONSHIP_UPDATE] Failed to handle event and trigger "
-                                             f"'on_relationship_update'! Exception: {e}")
+        except Exception as e:
+            logger.exception("[MESSAGE_DELETE] Failed to handle event and trigger 'on_message_delete'! "
+                             f"Exception: {e}")
 
-                    # => Creating a parallel task to not slow down event handler
-                    asyncio.create_task(relationship_update_handler())
+    @_swarm_event("MESSAGE_UPDATE", requires_ready=True)
+    async def _message_update_handler(self, response_data: dict) -> None:
+        """
+        Handler for a deleted message which will create a new msg object
+        and return as parameter the object.
+
+        User edited message update
+
+        Json-Data:
+        op: 0
+        d: {
+          type: int,
+          timestamp: string,
+          room_id: string,
+          metadata: unknown,
+          mentions: [{
+            username: string,
+            user_flags: string,
+            name: string,
+            id: string,
+            icon: string,
+            header: string,
+            presence: string
+          }],
+          id: string,
+          house_id: string,
+          exploding_age: int,
+          exploding: boolean,
+          embed: object,
+          edited_at: string,
+          device_id: string,
+          content: string,
+          bucket: int,
+          author_id: string,
+          attachment: {
+            media_url: string,
+            filename: string,
+            dimensions: {
+              width: int,
+              type: string,
+              height: int
+            }
+          }
+        }
+        """
+        try:
+            # Removes old data in the client cache if possible and reuses older data since
+            # no new data is getting sent with the event.
+
+            data = response_data
+            if data.get('house_id') is not None:
+                house = self._houses.get(int(data.get('house_id', 0)))
             else:
-                logger.error(f"[WEBSOCKET] << Unknown Event {swarm_event} without Handler!")
+                house = None
+
+            if house:
+                # Updating the last message id in the Room
+                room = self._rooms.get(int(data.get('room_id', 0)))
+                if room:
+                    room._last_message_id = data.get('id')
+                else:
+                    logger.warning("[MESSAGE_UPDATE] Unable to find room in the cache! "
+                                   f"ROOM_ID={data.get('room_id')}")
+
+            else:
+                # Updating the last message id in the Private-Room
+                room = self._private_rooms.get(int(data.get('room_id', 0)))
+                if room:
+                    room._last_message_id = data.get('id')
+                else:
+                    logger.warning("[MESSAGE_UPDATE] Unable to find private-room in the cache! "
+                                   f"ROOM_ID={data.get('room_id')}")
+
+            # Getting the author from the cache if it exists
+            cached_author = self._users.get(int(data.get('author_id', 0)))
+            if not cached_author:
+                logger.warning("[MESSAGE_UPDATE] Author from incoming ws event data not found "
+                               "in cache! Possibly faulty client data!")
+                author = None
+            else:
+                # Using the cached author since no data is received
+                author = cached_author
+
+            message = types.Message(data, self.http, house=house, room=room, author=author)
+
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_message_update(message))
 
         except Exception as e:
-            logger.debug(f"[WEBSOCKET] << Failed to handle Event in the websocket! "
-                         f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
-        finally:
-            return
+            logger.exception("[MESSAGE_UPDATE] Failed to handle event and trigger 'on_message_update'! "
+                             f"Exception: {e}")
+
+    @_swarm_event("TYPING_START", requires_ready=True)
+    async def _typing_start_handler(self, response_data: dict) -> None:
+        """
+        Handler for the typing_start event that will trigger the event
+        on_typing_start and return as parameter the typing object with
+        the room, house and member as attributes.
+
+        User started typing
+
+        Json-Data:
+        op: 0
+        d: {
+          timestamp: int,
+          room_id: string,
+          house_id: string,
+          author_id: string
+        }
+        """
+        try:
+            data = response_data
+            if data.get('recipient_ids') is None:
+                room = self._rooms.get(int(response_data.get('room_id', 0)))
+                house = self._houses.get(int(response_data.get('house_id', 0)))
+                author = utils.get(house.members, id=int(response_data.get('author_id', 0)))
+            else:
+                room = self._private_rooms.get(int(response_data.get('room_id', 0)))
+                house = None
+                author = self._users.get(int(response_data.get('author_id', 0)))
+
+            typing = types.Typing(response_data, author, room, house, self.http)
+
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_typing_start(typing))
+
+        except Exception as e:
+            logger.exception("[TYPING_START] Failed to handle event and trigger 'on_typing_start'! "
+                             f"Exception: {e}")
+
+    @_swarm_event("TYPING_END", requires_ready=True)
+    async def _typing_end_handler(self, response_data: dict) -> None:
+        """
+        Handler for the typing_end event which will trigger the typing_end
+        event and return as parameter the Typing object with the room,
+        house and member as parameter.
+        Currently non-existed and only serves as placeholder in case
+        it is added in the future
+
+        Typing of a user ended
+
+        Currently not existing!
+
+        Json-Data:
+        """
+        try:
+            room = self._rooms.get(int(response_data.get('room_id', 0)))
+            house = self._houses.get(int(response_data.get('house_id', 0)))
+            member = utils.get(house.members, id=int(response_data.get('room_id', 0)))
+            typing = types.Typing(response_data, member, room, house, self.http)
+
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_typing_end(typing))
+
+        except Exception as e:
+            logger.exception("[TYPING_END] Failed to handle event and trigger "
+                             f"'on_typing_end'! Exception: {e}")
+
+    @_swarm_event("HOUSE_MEMBERS_CHUNK", requires_ready=True)
+    async def _house_members_chunk_handler(self, response_data: dict) -> None:
+        """
+        In Work!
+        Handler for a house member chunk update which updates for every
+        sent member object the object in the house list. Triggers
+        on_house_member_chunk and returns as parameter the changed
+        members, the raw data and the house object.
+
+        For requesting house member states
+
+        Json-Data:
+        op: 0
+        d: {
+          members: {
+            id: {
+              user_id: string,
+              user: {
+                username: string,
+                user_flags: string,
+                name: string,
+                id: string,
+                icon: string,
+                header: string,
+                presence: string
+              },
+              roles: array,
+              last_permission_update: string,
+              joined_at: string,
+              house_id: string
+            }
+          },
+          house_id: string
+        }
+        """
+        try:
+            data = response_data
+            house = self._houses.get(int(data.get('house_id')))
+
+            if house is None:
+                logger.warning("[HOUSE_MEMBERS_CHUNK] Failed to find House in the client cache! "
+                               f"HOUSE_ID={data.get('house_id')}")
+                return
+
+            mem_data = list(data.get('members', {}).values())
+
+            # Patching the cached members and users in-place and adding the missing ones => O(k) for a chunk of k
+            members = self._patch_members(house, mem_data)
+
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_house_member_chunk(
+                members=members,
+                data=data,
+                house=house))
+
+        except Exception as e:
+            logger.exception("[HOUSE_MEMBERS_CHUNK] Failed to handle event and trigger "
+                             f"'on_house_member_chunk'! Exception: {e}")
+
+    def _patch_members(self, house: types.House, mem_data: list) -> list:
+        """
+        Patches the cached members of the house and their users in-place with the passed member data. Only
+        members and users that are not cached yet are created, so references to the cached objects stay valid
+
+        :return: The members of the passed data
+        """
+        members = []
+        for mem in mem_data:
+            user_id = int(mem.get('user', mem).get('id', 0))
+
+            cached_user = self._users.get(user_id)
+            if cached_user is None:
+                self._users.upsert(types.User(mem, self.http))
+            elif cached_user._update(mem):
+                self._users.reindex(cached_user)
+
+            member = house._members.get(user_id)
+            if member is None:
+                member = types.Member(mem, house, self.http)
+                house._members.upsert(member)
+            elif member._update(mem):
+                house._members.reindex(member)
+            members.append(member)
+        return members
+
+    @_swarm_event("BATCH_HOUSE_MEMBER_UPDATE", requires_ready=True)
+    async def _batch_house_member_update_handler(self, response_data: dict) -> None:
+        """
+        In Work!
+        Handler for a batch house member update that includes a list of
+        members that were updated. Triggers on_batch_house_member_update
+        and returns as parameters the members list, the raw data and the house obj
+
+        Multiple updates of members that are stacked
+
+        Json-Data:
+        {
+          house_id: string;
+          batch_type: list;
+          batch_size: int;
+          data: {
+            [resource_id: string]: HouseMember
+          }
+        }
+        """
+        try:
+            data = response_data
+            house = self._houses.get(int(data.get('house_id')))
+
+            if house is None:
+                logger.warning("[BATCH_HOUSE_MEMBER_UPDATE] Failed to find House in the client cache! "
+                               f"HOUSE_ID={data.get('house_id')}")
+                return
+
+            mem_data = data.get('data', [])
+            # The batch data is sent as dict with the resource ids as keys
+            if isinstance(mem_data, dict):
+                mem_data = list(mem_data.values())
+
+            # Patching the cached members and users in-place and adding the missing ones => O(k) for a batch of k
+            members = self._patch_members(house, mem_data)
+
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_batch_house_member_update(
+                members=members,
+                data=data,
+                house=house))
+
+        except Exception as e:
+            logger.exception("[BATCH_HOUSE_MEMBER_UPDATE] Failed to handle event and trigger "
+                             f"'on_batch_house_member_update'! Exception: {e}")
+
+    @_swarm_event("HOUSE_ENTITIES_UPDATE", requires_ready=True)
+    async def _house_entities_update_handler(self, response_data: dict) -> None:
+        """
+        In Work!
+        Handler for a house entity update. Triggers on_house_entity_update and
+        returns as parameter the house obj, the entity obj and the raw data
+
+        House entities was updated
+
+        Json-Data:
+        op: 0
+        d: {
+          house_id: string,
+          entities: [{
+            type: int,
+            resource_pointers: [{
+              resource_type: string,
+              resource_id: string
+            }],
+            position: int,
+            name: string,
+            id: string
+          }]
+        }
+        """
+        try:
+            data = response_data
+            house = self._houses.get(int(data.get('house_id')))
+            entity = None  # TODO! Insert entity
+
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_house_entity_update(
+                house=house,
+                entity=entity,
+                data=data
+            ))
+
+        except Exception as e:
+            logger.exception("[HOUSE_ENTITIES_UPDATE] Failed to handle event and trigger "
+                             f"'on_house_entity_update'! Exception: {e}")
+
+    @_swarm_event("RELATIONSHIP_UPDATE", requires_ready=True)
+    async def _relationship_update_handler(self, response_data: dict) -> None:
+        """
+        Handler for a relationship update. Triggers on_relationship_update
+        and returns as parameter the relationship obj.
+
+        Relationship between two users was updated
+
+        Json-Data:
+        op: 0
+        d: {
+          user: {
+            website: string,
+            username: string,
+            user_flags: int,
+            name: string,
+            location: string,
+            id: string,
+            icon: string,
+            bio: string
+          },
+          type: int,
+          recipient_id: string,
+          id: string
+        }
+        """
+        try:
+            data = response_data
+
+            user_id = data.get('user_id') or data.get('user', {}).get('id', 0)
+            relationship = self._relationships.get(int(user_id))
+            if relationship is None:
+                relationship = types.Relationship(data, self.http)
+                self._relationships.upsert(relationship)
+            elif relationship._update(data):
+                # Patching the cached relationship and updating the indexes
+                self._relationships.reindex(relationship)
+
+            # Creating a new task for handling the event
+            # TODO! Needs error handling and name traceback and log!
+            asyncio.create_task(self._event_handler.ev_relationship_update(
+                relationship=relationship
+            ))
+
+        except Exception as e:
+            logger.exception("[RELATIONSHIP_UPDATE] Failed to handle event and trigger "
+                             f"'on_relationship_update'! Exception: {e}")
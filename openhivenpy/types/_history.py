@@ -0,0 +1,142 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+
+from ._get_type import getType
+import openhivenpy.exceptions as errs
+
+logger = logging.getLogger(__name__)
+
+# Maximum amount of concurrent requests for authors that are not cached
+_AUTHOR_REQUEST_LIMIT = 25
+
+
+async def resolve_authors(http, messages: list) -> dict:
+    """`openhivenpy.types._history.resolve_authors()`
+
+    Returns the authors of the passed message data mapped by their author_id
+
+    Authors are taken from the client cache or the data of the message. The remaining ids
+    are requested once each and concurrently with at most `_AUTHOR_REQUEST_LIMIT` requests
+    at the same time.
+    """
+    client_user = http.client_user
+    users = getattr(http.client, '_users', None)
+
+    authors = {}
+    missing = []
+    for message in messages:
+        author_id = message.get('author_id')
+        if author_id is None or author_id in authors or author_id in missing:
+            continue
+
+        author = None
+        if client_user is not None and str(client_user.id) == str(author_id):
+            author = client_user
+        elif users is not None:
+            author = users.get(int(author_id))
+
+        if author is None and message.get('author') is not None:
+            author = await getType.a_user(message.get('author'), http)
+
+        if author is not None:
+            authors[author_id] = author
+        else:
+            missing.append(author_id)
+
+    if missing:
+        semaphore = asyncio.Semaphore(_AUTHOR_REQUEST_LIMIT)
+
+        async def _request_author(_author_id):
+            async with semaphore:
+                _raw_data = await http.request(f"/users/{_author_id}")
+            _author_data = _raw_data.get('data') if _raw_data else None
+            if _author_data:
+                authors[_author_id] = await getType.a_user(_author_data, http)
+
+        await asyncio.gather(*(_request_author(_id) for _id in missing))
+
+    return authors
+
+
+async def _fetch_page(http, room_id: int, cursor: Optional[int], forward: bool) -> list:
+    endpoint = f"/rooms/{room_id}/messages"
+    if cursor is not None:
+        endpoint += f"?{'after' if forward else 'before'}={cursor}"
+
+    raw_data = await http.request(endpoint)
+    if raw_data is None:
+        raise errs.HTTPReceivedNoData()
+    return raw_data.get('data') or []
+
+
+async def iter_history(room,
+                       house,
+                       *,
+                       before: Optional[int] = None,
+                       after: Optional[int] = None,
+                       limit: Optional[int] = None) -> AsyncIterator:
+    """`openhivenpy.types._history.iter_history()`
+
+    Async generator that walks the message history of the passed room page by page
+
+    Without `after` the messages are yielded from the newest to the oldest, starting before `before`
+    if passed. With only `after` the messages are yielded from the oldest to the newest. While the
+    messages of a page are yielded the next page is already requested, but never more than that one
+    page, so the memory usage stays constant for any amount of messages.
+    """
+    http = room._http
+    forward = after is not None and before is None
+    if forward:
+        cursor = int(after)
+        stop_at = None
+    else:
+        cursor = int(before) if before is not None else None
+        stop_at = int(after) if after is not None else None
+
+    yielded = 0
+    prefetch = asyncio.ensure_future(_fetch_page(http, room.id, cursor, forward))
+    try:
+        while prefetch is not None:
+            page = await prefetch
+            prefetch = None
+
+            # The order of the messages in the page is not guaranteed => Sorting them in the walking direction.
+            # Not in-place since the response data can be shared with other callers
+            page = sorted(page, key=lambda m: int(m.get('id')), reverse=not forward)
+            last_page = False
+            if stop_at is not None:
+                size = len(page)
+                page = [m for m in page if int(m.get('id')) > stop_at]
+                # Reached the message passed as after => No older messages needed
+                last_page = len(page) < size
+            if not page:
+                return
+
+            next_cursor = int(page[-1].get('id'))
+            remaining = None if limit is None else limit - yielded
+            # Requesting the next page while the current one is processed. Not needed if the page is the last
+            # one that is needed or if the server ignored the cursor and sent the same page again
+            if not last_page and (remaining is None or remaining > len(page)) and next_cursor != cursor:
+                prefetch = asyncio.ensure_future(_fetch_page(http, room.id, next_cursor, forward))
+            cursor = next_cursor
+
+            authors = await resolve_authors(http, page)
+            for message in page:
+                if limit is not None and yielded >= limit:
+                    return
+
+                yield await getType.a_message(
+                    data=message,
+                    http=http,
+                    house=house,
+                    room=room,
+                    author=authors.get(message.get('author_id')))
+                yielded += 1
+    finally:
+        if prefetch is not None:
+            if not prefetch.done():
+                prefetch.cancel()
+            elif not prefetch.cancelled():
+                # Marking a possible exception as retrieved
+                prefetch.exception()
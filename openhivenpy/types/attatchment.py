@@ -16,6 +16,8 @@ class Attachment:
     Represents a Hiven Attachment
     
     """
+    __slots__ = ('_filename', '_media_url', '_raw', '_http')
+
     def __init__(self, data: dict, http: HTTP):
         self._filename = data["filename"]
         self._media_url = data["media_url"]
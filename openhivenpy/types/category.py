@@ -3,6 +3,7 @@ import sys
 
 import openhivenpy.exceptions as errs
 from openhivenpy.gateway.http import HTTP
+from openhivenpy.utils.utils import patch_attrs
 from ._get_type import getType
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,7 @@ class Category:
     Represents a Hiven Entity
 
     """
+    __slots__ = ('_type', '_position', '_resources', '_name', '_id', '_house_id', '_http')
 
     def __init__(self, data: dict, http: HTTP):
         try:
@@ -59,6 +61,21 @@ class Category:
         ]
         return '<Category {}>'.format(' '.join('%s=%s' % t for t in info))
 
+    def _update(self, data: dict) -> bool:
+        """`openhivenpy.types.Category._update()`
+
+        Patches the object in-place with the passed data. Only the fields that are sent are updated.
+
+        :return: True if data of the category was changed
+        """
+        changed = patch_attrs(self, data, ('type', 'position', 'name', 'house_id'))
+        if data.get('resource_pointers') is not None:
+            resources = list(data.get('resource_pointers'))
+            if resources != self._resources:
+                self._resources = resources
+                changed = True
+        return changed
+
     @property
     def type(self) -> int:
         return self._type
@@ -18,6 +18,8 @@ class Context:
     Represents a Command Context for a triggered command in the CommandListener
 
     """
+    __slots__ = ('_http', '_room', '_author', '_house', '_created_at')
+
     def __init__(self, data: dict, http: HTTP):
         self._http = http
         self._room = None
@@ -32,6 +32,8 @@ class Embed:
     description: `str` - Description of the embed object
     
     """
+    __slots__ = ('_url', '_type', '_title', '_image', '_description')
+
     def __init__(self, data: dict):
         self._url = data.get('url')
         self._type = data.get('type')
@@ -20,6 +20,8 @@ class Feed:
     ~~~~~~~~~~
     
     """
+    __slots__ = ('_http',)
+
     def __init__(self, data: dict, http: HTTP):
         self._http = http
 
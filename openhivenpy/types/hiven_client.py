@@ -6,6 +6,7 @@ import time
 from typing import Union
 
 from ._get_type import getType
+from openhivenpy.utils.store import EntityStore
 import openhivenpy.exceptions as errs
 
 logger = logging.getLogger(__name__)
@@ -26,11 +27,14 @@ class Client:
         self._http = http if http is not None else self._http
 
         self._amount_houses = 0
-        self._houses = []
-        self._users = []
-        self._rooms = []
-        self._private_rooms = []
-        self._relationships = []
+        # Id-keyed stores for the cached data => O(1) lookups, upserts and deletions
+        # Queries with utils.get() on the indexed attributes are O(1) as well
+        self._houses = EntityStore(indexes=('name',))
+        self._users = EntityStore(indexes=('name',))
+        self._rooms = EntityStore(indexes=('name', 'house_id'))
+        self._private_rooms = EntityStore()
+        # Relationships sent in INIT_STATE do not contain an id => Using the id of the user
+        self._relationships = EntityStore(key='user__id', indexes=('id', 'user_id'))
         self._USER = None
 
         # Init Data that will be overwritten by the connection and websocket
@@ -39,12 +43,17 @@ class Client:
         self._startup_time = None
         self._ready = False
 
+        # Readiness => Set as soon as the last house of the INIT_STATE was received
+        # The event is created on first use to bind it to the running event loop
+        self._ready_event = None
+        self._slow_startup_handle = None
+        # Durations of the startup phases in seconds
+        self._startup_timings = {}
+        self._startup_phase_mark = None
+
         self._event_handler = getattr(self, '_event_handler')
         self._execution_loop = getattr(self, '_execution_loop')
 
-        # Appends the ready check function to the execution_loop
-        self._execution_loop.add_to_startup(self.__check_meta_data)
-
     def __str__(self) -> str:
         return str(repr(self))
 
@@ -53,7 +62,97 @@ class Client:
 
     @property
     def connection_start(self) -> float:
-        return getattr(self, "connection_start")
+        return getattr(self, "_connection_start", None)
+
+    @property
+    def startup_timings(self) -> dict:
+        """
+        Durations of the startup phases in seconds:
+
+        'connect' - Creating the HTTP session and opening the websocket
+
+        'init_state' - Authorizing and receiving and processing the INIT_STATE
+
+        'house_ingest' - Receiving and processing the houses of the client after the INIT_STATE
+
+        'total' - Complete startup until the client was ready
+        """
+        return dict(getattr(self, '_startup_timings', {}))
+
+    def _get_ready_event(self) -> asyncio.Event:
+        if self._ready_event is None:
+            self._ready_event = asyncio.Event()
+            if self._ready:
+                self._ready_event.set()
+        return self._ready_event
+
+    async def wait_until_ready(self, timeout: float = None) -> bool:
+        """`openhivenpy.types.Client.wait_until_ready()`
+
+        Waits until the client received all data and is ready for usage. Returns immediately if the
+        client is already ready
+
+        :param timeout: Seconds after the waiting should be stopped. If None it waits without limit
+        :return: True if the client is ready and False if the timeout was reached
+        """
+        if self._ready:
+            return True
+        try:
+            await asyncio.wait_for(self._get_ready_event().wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _reset_readiness(self) -> None:
+        """
+        Resets the readiness and the startup timings for a new connection start
+        """
+        self._ready = False
+        self._startup_time = None
+        self._startup_timings = {}
+        self._startup_phase_mark = None
+        if self._ready_event is not None:
+            self._ready_event.clear()
+
+        if self._slow_startup_handle is not None:
+            self._slow_startup_handle.cancel()
+        self._slow_startup_handle = asyncio.get_event_loop().call_later(30, self.__warn_slow_startup)
+
+    def _mark_startup_phase(self, phase: str) -> None:
+        """
+        Stores the duration of the passed startup phase that ended now
+        """
+        now = time.time()
+        last = self._startup_phase_mark or self._connection_start or now
+        self._startup_timings[phase] = now - last
+        self._startup_phase_mark = now
+
+    def _check_ready(self) -> None:
+        """
+        Sets the client ready and triggers on_ready if all houses of the INIT_STATE were received.
+        Called after the INIT_STATE and every HOUSE_JOIN
+        """
+        if self._ready or not self._initialized or len(self._houses) < self._amount_houses:
+            return
+
+        self._mark_startup_phase('house_ingest')
+        self._startup_time = time.time() - self._connection_start if self._connection_start else None
+        self._startup_timings['total'] = self._startup_time
+        self._ready = True
+        self._get_ready_event().set()
+
+        if self._slow_startup_handle is not None:
+            self._slow_startup_handle.cancel()
+            self._slow_startup_handle = None
+
+        logger.info("[CLIENT] Client loaded all data and is ready for usage! ")
+        logger.debug(f"[CLIENT] Startup timings: {self._startup_timings}")
+        asyncio.create_task(self._event_handler.ev_ready_state())
+
+    def __warn_slow_startup(self) -> None:
+        self._slow_startup_handle = None
+        if not self._ready:
+            logger.warning("[CLIENT] Initialization takes unusually long! Possible connection or data issues!")
 
     async def init_meta_data(self, data: dict = None) -> None:
         """`openhivenpy.types.client.update_client_user_data()`
@@ -61,6 +160,7 @@ class Client:
         """
         try:
             # Using a USER object to actually store all user data
+            # => INIT_STATE contains the client user so no additional request is needed
             self._USER = await getType.a_user(data, self.http)
 
             _relationships = data.get('relationships')
@@ -71,7 +171,7 @@ class Client:
                         data=_rel_data,
                         http=self.http)
 
-                    self._relationships.append(_rel)
+                    self._relationships.upsert(_rel)
             else:
                 raise errs.WSFailedToHandle("Missing 'relationships' in 'INIT_STATE' event message!")
 
@@ -85,7 +185,7 @@ class Client:
                         room = await getType.a_private_group_room(private_room, self.http)
                     else:
                         room = await getType.a_private_room(private_room, self.http)
-                    self._private_rooms.append(room)
+                    self._private_rooms.upsert(room)
             else:
                 raise errs.WSFailedToHandle("Missing 'private_rooms' in 'INIT_STATE' event message!")
 
@@ -95,39 +195,86 @@ class Client:
             else:
                 raise errs.WSFailedToHandle("Missing 'house_memberships' in 'INIT_STATE' event message!")
 
-            # Requesting user data of the client itself
-            _raw_data = await self.http.request("/users/@me", timeout=15)
-            if _raw_data:
-                _data = _raw_data.get('data')
-                if _data:
-                    self._USER = getType.user(data=data, http=self.http)
-                else:
-                    raise errs.HTTPReceivedNoData()
-            else:
-                raise errs.HTTPReceivedNoData()
-
         except Exception as e:
             logger.error(f"[CLIENT] FAILED to update client data! "
                          f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
             raise errs.FaultyInitialization(f"FAILED to update client data! Possibly faulty data! "
                                             f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
 
-    async def __check_meta_data(self):
-        """
-        Checks whether the meta data is complete and triggers on_ready
+    async def reconcile_meta_data(self, data: dict) -> None:
+        """`openhivenpy.types.Client.reconcile_meta_data()`
+
+        Synchronises the cached client data with the INIT_STATE of a new connection after a reconnect.
+        Instead of recreating the cache the data is compared by id with the cached objects: Changed ones
+        are patched in-place, new ones are added and vanished ones are removed. Triggers
+        on_relationship_update for added, changed or removed relationships (type 0 => no relationship),
+        on_private_room_add/update/remove for the private rooms and on_house_exit for houses the client
+        is no longer a member of. The cached houses that still exist are marked for the refresh with their
+        HOUSE_JOIN events
         """
-        check = True
-        while True:
-            if self._amount_houses == len(self._houses) and self._initialized:
-                self._startup_time = time.time() - self.connection_start
-                self._ready = True
-                logger.info("[CLIENT] Client loaded all data and is ready for usage! ")
-                asyncio.create_task(self._event_handler.ev_ready_state())
-                break
-            if (time.time() - self.connection_start) > 30 and check:
-                logger.warning("[CLIENT] Initialization takes unusually long! Possible connection or data issues!")
-                check = False
-            await asyncio.sleep(0.05)
+        try:
+            if self._USER is None:
+                self._USER = await getType.a_user(data, self.http)
+            else:
+                self._USER._update(data)
+
+            _relationships = data.get('relationships')
+            if _relationships is None:
+                raise errs.WSFailedToHandle("Missing 'relationships' in 'INIT_STATE' event message!")
+
+            added, changed, removed = self._relationships.reconcile(
+                _relationships.values(),
+                key=lambda d: int(d['user']['id'] if d.get('user') else d['user_id']),
+                create=lambda d: getType.relationship(d, self.http),
+                update=lambda relationship, d: relationship._update(d))
+            for relationship in removed:
+                # Removed while the client was disconnected => Same as an update to 'No Relationship'
+                relationship._type = 0
+            for relationship in added + changed + removed:
+                asyncio.create_task(self._event_handler.ev_relationship_update(relationship))
+
+            _private_rooms = data.get('private_rooms')
+            if _private_rooms is None:
+                raise errs.WSFailedToHandle("Missing 'private_rooms' in 'INIT_STATE' event message!")
+
+            def create_private_room(room_data: dict):
+                if int(room_data.get('type', 0)) == 2:
+                    return getType.private_group_room(room_data, self.http)
+                return getType.private_room(room_data, self.http)
+
+            added, changed, removed = self._private_rooms.reconcile(
+                _private_rooms,
+                key=lambda d: int(d['id']),
+                create=create_private_room,
+                update=lambda room, d: room._update(d))
+            for room in added:
+                asyncio.create_task(self._event_handler.ev_private_room_add(room))
+            for room in changed:
+                asyncio.create_task(self._event_handler.ev_private_room_update(room))
+            for room in removed:
+                asyncio.create_task(self._event_handler.ev_private_room_remove(room))
+
+            _house_ids = data.get('house_memberships')
+            if _house_ids is None:
+                raise errs.WSFailedToHandle("Missing 'house_memberships' in 'INIT_STATE' event message!")
+
+            house_ids = set(int(house_id) for house_id in _house_ids)
+            for house_id in [house_id for house_id in self._houses.keys() if house_id not in house_ids]:
+                # The client left the house or it was deleted while the client was disconnected
+                house = self._houses.delete(house_id)
+                for room in house.rooms:
+                    self._rooms.delete(room.id)
+                asyncio.create_task(self._event_handler.ev_house_exit(house=house))
+
+            # The remaining houses are patched with the HOUSE_JOIN events of the new connection
+            self._refreshing_houses = set(self._houses.keys())
+            self._amount_houses = len(house_ids)
+
+        except Exception as e:
+            logger.error(f"[CLIENT] FAILED to reconcile client data! "
+                         f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
+            raise errs.FaultyInitialization(f"FAILED to reconcile client data! Possibly faulty data! "
+                                            f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
 
     async def edit(self, **kwargs) -> bool:
         """`openhivenpy.types.Client.edit()`
@@ -206,28 +353,28 @@ class Client:
             return None
 
     @property
-    def houses(self):
-        return getattr(self.user, '_houses', [])
+    def houses(self) -> EntityStore:
+        return getattr(self, '_houses', None)
 
     @property
-    def private_rooms(self):
-        return getattr(self.user, '_private_rooms', [])
+    def private_rooms(self) -> EntityStore:
+        return getattr(self, '_private_rooms', None)
 
     @property
-    def users(self):
-        return getattr(self.user, '_users', [])
+    def users(self) -> EntityStore:
+        return getattr(self, '_users', None)
 
     @property
-    def rooms(self):
-        return getattr(self.user, '_rooms', [])
+    def rooms(self) -> EntityStore:
+        return getattr(self, '_rooms', None)
 
     @property
     def amount_houses(self) -> int:
-        return getattr(self.user, '_amount_houses', [])
+        return getattr(self, '_amount_houses', 0)
 
     @property
-    def relationships(self) -> list:
-        return getattr(self.user, '_relationships', [])
+    def relationships(self) -> EntityStore:
+        return getattr(self, '_relationships', None)
 
     @property
     def http(self):
@@ -1,11 +1,14 @@
 import asyncio
+import copy
 import logging
 import sys
 from typing import Optional, Union
 
 from ._get_type import getType
 from openhivenpy.gateway.http import HTTP
+from openhivenpy.utils.store import EntityStore
 import openhivenpy.utils.utils as utils
+from openhivenpy.utils.utils import patch_attrs
 import openhivenpy.exceptions as errs
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,7 @@ class LazyHouse:
     Consider fetching for more data the regular house object with utils.get()
 
     """
+    __slots__ = ('_id', '_name', '_icon', '_owner_id', '_type', '_rooms')
 
     def __init__(self, data: dict, http):
         self._id = int(data['id']) if data.get('id') is not None else None
@@ -73,6 +77,8 @@ class House:
     Returned with the getHouse() and get_house()
     
     """
+    __slots__ = ('_id', '_name', '_banner', '_icon', '_owner_id', '_roles', '_categories', '_default_permissions',
+                 '_members', '_rooms', '_client_member', '_http')
 
     def __init__(
             self,
@@ -154,17 +160,23 @@ class House:
 
             self._roles = list(data.get('roles'))
 
-            self._categories = []
-            for category in data.get('entities'):
-                category = getType.category(category, http)
-                self._categories.append(category)
+            self._categories = EntityStore(
+                (getType.category(category, http) for category in data.get('entities')),
+                indexes=('name',))
 
             self._default_permissions = data.get('default_permissions')
 
             _members = data.get("members")
-            self._members = list(getType.member(mem_data, self, http) for mem_data in _members)
-
-            self._rooms = list(getType.room(room_data, http, self) for room_data in data.get("rooms"))
+            # Members are keyed by their user id => id and user_id are always the same for a member
+            self._members = EntityStore(
+                (getType.member(mem_data, self, http) for mem_data in _members),
+                key='user_id',
+                aliases=('id',),
+                indexes=('name',))
+
+            self._rooms = EntityStore(
+                (getType.room(room_data, http, self) for room_data in data.get("rooms")),
+                indexes=('name',))
             self._client_member = utils.get(self._members, user_id=client_id)
 
             # TODO! See if possible request is reasonable
@@ -206,6 +218,66 @@ class House:
         ]
         return '<House {}>'.format(' '.join('%s=%s' % t for t in info))
 
+    def _update(self, data: dict) -> bool:
+        """`openhivenpy.types.House._update()`
+
+        Patches the house data in-place with the passed data. Only the fields that are sent are
+        updated, the cached members, rooms and categories are not touched.
+
+        :return: True if data of the house was changed
+        """
+        changed = patch_attrs(self, data, ('name', 'banner', 'icon', 'owner_id', 'default_permissions'))
+        if data.get('roles') is not None:
+            roles = list(data.get('roles'))
+            if roles != self._roles:
+                self._roles = roles
+                changed = True
+        return changed
+
+    def _reconcile(self, data: dict) -> dict:
+        """`openhivenpy.types.House._reconcile()`
+
+        Synchronises the house with the complete data of a new HOUSE_JOIN, like after a reconnect. The
+        house, its members, rooms and categories are patched in-place, new ones are created and the ones
+        missing in the data are removed. The cached objects keep their identity.
+
+        :return: Dictionary with the tuples (added, changed, removed) of 'members', 'rooms' and 'categories'.
+                 The changed members are tuples of a snapshot of the previous state and the member.
+                 'house' is True if the data of the house itself was changed
+        """
+        house_changed = self._update(data)
+
+        def update_member(member, member_data: dict) -> bool:
+            old = copy.copy(member)
+            if member._update(member_data):
+                changed_members.append((old, member))
+                return True
+            return False
+
+        changed_members = []
+        added, _, removed = self._members.reconcile(
+            data.get('members') or [],
+            key=lambda d: int(d.get('user', d)['id']),
+            create=lambda d: getType.member(d, self, self._http),
+            update=update_member)
+        members = (added, changed_members, removed)
+
+        rooms = self._rooms.reconcile(
+            data.get('rooms') or [],
+            key=lambda d: int(d['id']),
+            create=lambda d: getType.room(d, self._http, self),
+            update=lambda room, d: room._update(d))
+
+        categories = self._categories.reconcile(
+            data.get('entities') or [],
+            key=lambda d: d.get('id'),
+            create=lambda d: getType.category(d, self._http),
+            update=lambda category, d: category._update(d))
+
+        if self._client_member is not None:
+            self._client_member = self._members.get(self._client_member.id)
+        return {'house': house_changed, 'members': members, 'rooms': rooms, 'categories': categories}
+
     @property
     def client_member(self) -> getType.member:
         return self._client_member
@@ -235,19 +307,19 @@ class House:
         return self._roles
 
     @property
-    def categories(self) -> list:
+    def categories(self) -> EntityStore:
         return self._categories
 
     @property
-    def users(self) -> list:
+    def users(self) -> EntityStore:
         return self._members
 
     @property
-    def members(self) -> list:
+    def members(self) -> EntityStore:
         return self._members
 
     @property
-    def rooms(self) -> list:
+    def rooms(self) -> EntityStore:
         return self._rooms
 
     async def get_member(self, member_id: int):
@@ -265,10 +337,10 @@ class House:
                 if _raw_data:
                     _data = _raw_data.get('data')
                     if _data:
-                        return await getType.a_room(
+                        return await getType.a_member(
                             data=_data,
-                            http=self._http,
-                            house=self)
+                            house=self,
+                            http=self._http)
                     else:
                         raise errs.HTTPReceivedNoData()
                 else:
@@ -333,7 +405,7 @@ class House:
                 data = (await resp.json()).get('data')
                 if data:
                     room = await getType.a_room(data, self._http, self)
-                    self._rooms.append(room)
+                    self._rooms.upsert(room)
                     return room
                 else:
                     raise errs.HTTPReceivedNoData()
@@ -366,7 +438,7 @@ class House:
                 data = raw_data.get('data')
                 if data:
                     category = getType.category(data, self._http)
-                    self._categories.append(category)
+                    self._categories.upsert(category)
                     return category
                 else:
                     raise errs.HTTPReceivedNoData()
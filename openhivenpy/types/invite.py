@@ -1,10 +1,8 @@
-import asyncio
 import logging
 
 from ._get_type import getType
 from openhivenpy.gateway.http import HTTP
 import openhivenpy.types as types
-import openhivenpy.exceptions as errs
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +29,9 @@ class Invite:
     created_at: `str` - String with the creation date
     
     """
+    __slots__ = ('_http', '_code', '_url', '_created_at', '_house_id', '_max_age', '_max_uses', '_type', '_house',
+                 '_house_members')
+
     def __init__(self, data: dict, http: HTTP):
         self._http = http
         
@@ -47,18 +48,11 @@ class Invite:
         self._max_uses = invite.get('max_uses')
         self._type = invite.get('type')
         
-        house_data = data.get('house')
-        _raw_data = asyncio.run(self._http.request(endpoint=f"/users/{house_data.get('owner_id')}"))
-        if _raw_data:
-            _data = _raw_data.get('data')
-            if _data:
-                self._house = types.LazyHouse(
-                    data=house_data,
-                    http=self._http)
-            else:
-                raise errs.HTTPReceivedNoData()
-        else:
-            raise errs.HTTPReceivedNoData()
+        # The house data of the invite is complete => No need to request the owner, which would
+        # also require running the event loop inside the constructor
+        self._house = types.LazyHouse(
+            data=data.get('house'),
+            http=self._http)
 
         self._house_members = data.get('counts', {}).get('house_members')
 
@@ -4,7 +4,7 @@ import sys
 from .user import User
 from openhivenpy.types._get_type import getType
 from openhivenpy.gateway.http import HTTP
-from openhivenpy.utils import raise_value_to_type
+from openhivenpy.utils import raise_value_to_type, patch_attrs
 import openhivenpy.exceptions as errs
 
 logger = logging.getLogger(__name__)
@@ -23,10 +23,11 @@ class Member(User):
     Returned with house house member list and House.get_member()
     
     """
+    __slots__ = ('_house_id', '_roles', '_house')
+
     def __init__(self, data: dict, house, http: HTTP):
         try:
             super().__init__(data.get('user', data), http)
-            self._user_id = self._id
             self._house_id = data.get('house_id')
             self._joined_at = data.get('joined_at')
             self._roles = raise_value_to_type(data.get('roles', []), list)
@@ -62,9 +63,31 @@ class Member(User):
         ]
         return '<Member {}>'.format(' '.join('%s=%s' % t for t in info))
 
+    def _update(self, data: dict) -> bool:
+        """`openhivenpy.types.Member._update()`
+
+        Patches the object in-place with the passed member or user data. Only the fields that
+        are sent are updated.
+
+        :return: True if data of the member was changed
+        """
+        user_data = data.get('user')
+        if user_data is None:
+            # Only user data was passed
+            return super()._update(data)
+
+        changed = super()._update(user_data)
+        if data.get('roles') is not None:
+            roles = raise_value_to_type(data.get('roles'), list)
+            if roles != self._roles:
+                self._roles = roles
+                changed = True
+        return patch_attrs(self, data, ('house_id', 'joined_at')) or changed
+
     @property
     def user_id(self) -> int:
-        return self._user_id
+        # The id of a member is always the id of the user
+        return self._id
 
     @property
     def joined_house_at(self) -> str:
@@ -88,7 +111,7 @@ class Member(User):
         Returns `True` if successful.
         
         """
-        resp = await self._http.delete(f"/{self._house_id}/members/{self._user_id}")
+        resp = await self._http.delete(f"/{self._house_id}/members/{self.user_id}")
         if not resp.status < 300:
             raise errs.Forbidden()
         else:
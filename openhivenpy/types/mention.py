@@ -28,6 +28,8 @@ class Mention:
     author: `openhivenpy.types.User` - Author that created the mention
     
     """
+    __slots__ = ('_timestamp', '_user', '_author', '_http')
+
     def __init__(self, data: dict, timestamp: Union[datetime, str], author, http: HTTP):
         # Converting to seconds because it's in milliseconds
         if data.get('timestamp') is not None:
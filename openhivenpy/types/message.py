@@ -30,6 +30,8 @@ class DeletedMessage:
     room_id: `int` - ID of the Room where the message was deleted
     
     """
+    __slots__ = ('_message_id', '_house_id', '_room_id')
+
     def __init__(self, data: dict):
         self._message_id = int(data.get('message_id'))
         self._house_id = int(data.get('house_id'))
@@ -90,6 +92,9 @@ class Message:
     exploding: `None` - In work
     
     """
+    __slots__ = ('_id', '_author', '_attachment', '_content', '_timestamp', '_edited_at', '_mentions', '_type',
+                 '_exploding', '_house_id', '_house', '_room_id', '_room', '_embed', '_http')
+
     def __init__(self, data: dict, http: HTTP, house, room, author):
         try:
             self._id = int(data.get('id'))
@@ -18,6 +18,8 @@ class Presence:
     Represents a User Presence
     
     """
+    __slots__ = ('_http', '_user', '_presence')
+
     def __init__(self, data: dict, user, http: HTTP):
         self._http = http
         self._user = user
@@ -1,12 +1,14 @@
 import logging
 import sys
 import asyncio
-from typing import Union
+from typing import AsyncIterator, Union
 
 from ._get_type import getType
+from ._history import iter_history
 from .user import User
 import openhivenpy.exceptions as errs
 from openhivenpy.gateway.http import HTTP
+from openhivenpy.utils.utils import patch_attrs
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,8 @@ class PrivateGroupRoom:
     Represents a private group chat room with multiple person
     
     """
+    __slots__ = ('_id', '_last_message_id', '_recipients', '_name', '_type', '_http')
+
     def __init__(self, data: dict, http: HTTP):
         try:
             self._id = int(data.get('id'))
@@ -61,6 +65,39 @@ class PrivateGroupRoom:
         ]
         return '<PrivateGroupRoom {}>'.format(' '.join('%s=%s' % t for t in info))
 
+    def _update(self, data: dict) -> bool:
+        """`openhivenpy.types.PrivateGroupRoom._update()`
+
+        Patches the object in-place with the passed data. Only the fields that are sent are updated.
+
+        :return: True if data of the room was changed
+        """
+        changed = patch_attrs(self, data, ('last_message_id', 'type'))
+
+        recipients_data = data.get('recipients')
+        if recipients_data is not None:
+            # Patching the cached recipients in-place and only creating the new ones
+            cached = {recipient.id: recipient for recipient in self._recipients}
+            recipients = []
+            for recipient_data in recipients_data:
+                recipient = cached.get(int(recipient_data.get('id', 0)))
+                if recipient is None:
+                    recipient = getType.user(recipient_data, self._http)
+                    changed = True
+                elif recipient._update(recipient_data):
+                    changed = True
+                recipients.append(recipient)
+
+            if [r.id for r in recipients] != [r.id for r in self._recipients]:
+                changed = True
+            self._recipients = recipients
+
+        name = f"Private Group chat with {(''.join(r.name+', ' for r in self._recipients))[:-2]}"
+        if name != self._name:
+            self._name = name
+            changed = True
+        return changed
+
     @property
     def recipients(self) -> Union[User, list]:
         return self._recipients
@@ -109,20 +146,23 @@ class PrivateGroupRoom:
                 # Raw_data not in correct format => needs to access data field
                 data = raw_data.get('data')
                 if data:
-                    # Getting the author / self
-                    raw_data = await self._http.request(f"/users/@me")
-                    author_data = raw_data.get('data')
-                    if author_data:
-                        author = getType.user(author_data, self._http)
-                        msg = await getType.a_message(
-                            data=data,
-                            http=self._http,
-                            house=None,
-                            room=self,
-                            author=author)
-                        return msg
-                    else:
-                        raise errs.HTTPReceivedNoData()
+                    # The client user is the author and already known since INIT_STATE
+                    author = self._http.client_user
+                    if author is None:
+                        raw_data = await self._http.request(f"/users/@me")
+                        author_data = raw_data.get('data') if raw_data else None
+                        if author_data:
+                            author = getType.user(author_data, self._http)
+                        else:
+                            raise errs.HTTPReceivedNoData()
+
+                    msg = await getType.a_message(
+                        data=data,
+                        http=self._http,
+                        house=None,
+                        room=self,
+                        author=author)
+                    return msg
                 else:
                     raise errs.HTTPFaultyResponse()
             else:
@@ -133,6 +173,33 @@ class PrivateGroupRoom:
                          f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
             return None
 
+    def history(self,
+                *,
+                before: int = None,
+                after: int = None,
+                limit: int = None) -> AsyncIterator:
+        """`openhivenpy.types.PrivateGroupRoom.history()`
+
+        Returns an async iterator over the messages of the room. The pages of the history are requested
+        lazily and the next page is already requested while the current one is processed.
+
+        Example:
+            async for message in room.history(limit=500):
+                ...
+
+        Parameter:
+        ----------
+
+        before: `int` - Only messages older than the message with this id. Defaults to the newest message
+
+        after: `int` - Only messages newer than the message with this id. If passed without before the messages
+                       are returned from the oldest to the newest
+
+        limit: `int` - Maximum amount of returned messages. Defaults to None which means all
+
+        """
+        return iter_history(self, None, before=before, after=after, limit=limit)
+
     async def start_call(self, delay: float = None) -> bool:
         """openhivenpy.types.PrivateGroupRoom.start_call()
 
@@ -171,6 +238,8 @@ class PrivateRoom:
     Represents a private chat room with a person
     
     """
+    __slots__ = ('_id', '_last_message_id', '_recipient', '_name', '_type', '_http')
+
     def __init__(self, data: dict, http: HTTP):
         try:
             self._id = int(data.get('id'))
@@ -206,6 +275,29 @@ class PrivateRoom:
         ]
         return '<PrivateGroupRoom {}>'.format(' '.join('%s=%s' % t for t in info))
 
+    def _update(self, data: dict) -> bool:
+        """`openhivenpy.types.PrivateRoom._update()`
+
+        Patches the object in-place with the passed data. Only the fields that are sent are updated.
+
+        :return: True if data of the room was changed
+        """
+        changed = patch_attrs(self, data, ('last_message_id', 'type'))
+
+        recipients = data.get('recipients')
+        if recipients:
+            if int(recipients[0].get('id', 0)) == self._recipient.id:
+                changed = self._recipient._update(recipients[0]) or changed
+            else:
+                self._recipient = getType.user(recipients[0], self._http)
+                changed = True
+
+        name = f"Private chat with {self._recipient.name}"
+        if name != self._name:
+            self._name = name
+            changed = True
+        return changed
+
     @property
     def user(self) -> User:
         return self._recipient
@@ -287,20 +379,23 @@ class PrivateRoom:
                 # Raw_data not in correct format => needs to access data field
                 data = raw_data.get('data')
                 if data:
-                    # Getting the author / self
-                    raw_data = await self._http.request(f"/users/@me")
-                    author_data = raw_data.get('data')
-                    if author_data:
-                        author = getType.user(author_data, self._http)
-                        msg = await getType.a_message(
-                            data=data,
-                            http=self._http,
-                            house=None,
-                            room=self,
-                            author=author)
-                        return msg
-                    else:
-                        raise errs.HTTPReceivedNoData()
+                    # The client user is the author and already known since INIT_STATE
+                    author = self._http.client_user
+                    if author is None:
+                        raw_data = await self._http.request(f"/users/@me")
+                        author_data = raw_data.get('data') if raw_data else None
+                        if author_data:
+                            author = getType.user(author_data, self._http)
+                        else:
+                            raise errs.HTTPReceivedNoData()
+
+                    msg = await getType.a_message(
+                        data=data,
+                        http=self._http,
+                        house=None,
+                        room=self,
+                        author=author)
+                    return msg
                 else:
                     raise errs.HTTPFaultyResponse()
             else:
@@ -310,3 +405,30 @@ class PrivateRoom:
             logger.error(f"[PRIVATE_ROOM] Failed to send message in room {repr(self)}! " 
                          f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
             return None
+
+    def history(self,
+                *,
+                before: int = None,
+                after: int = None,
+                limit: int = None) -> AsyncIterator:
+        """`openhivenpy.types.PrivateRoom.history()`
+
+        Returns an async iterator over the messages of the room. The pages of the history are requested
+        lazily and the next page is already requested while the current one is processed.
+
+        Example:
+            async for message in room.history(limit=500):
+                ...
+
+        Parameter:
+        ----------
+
+        before: `int` - Only messages older than the message with this id. Defaults to the newest message
+
+        after: `int` - Only messages newer than the message with this id. If passed without before the messages
+                       are returned from the oldest to the newest
+
+        limit: `int` - Maximum amount of returned messages. Defaults to None which means all
+
+        """
+        return iter_history(self, None, before=before, after=after, limit=limit)
@@ -5,7 +5,7 @@ import asyncio
 from ._get_type import getType
 from .user import User
 from openhivenpy.gateway.http import HTTP
-from openhivenpy.utils.utils import get
+from openhivenpy.utils.utils import get, patch_attrs
 import openhivenpy.exceptions as errs
 
 logger = logging.getLogger(__name__)
@@ -55,6 +55,8 @@ class Relationship:
     # TODO! Needs other types added here!
 
     """
+    __slots__ = ('_user_id', '_user', '_type', '_id', '_recipient_id', '_http')
+
     def __init__(self, data: dict, http: HTTP):
         try:
             user_data = data.get('user')
@@ -99,6 +101,25 @@ class Relationship:
         ]
         return '<Relationship {}>'.format(' '.join('%s=%s' % t for t in info))
 
+    def _update(self, data: dict) -> bool:
+        """`openhivenpy.types.Relationship._update()`
+
+        Patches the object and its user in-place with the passed data. Only the fields that are
+        sent are updated.
+
+        :return: True if data of the relationship was changed
+        """
+        changed = False
+        if data.get('user') is not None:
+            changed = self._user._update(data.get('user'))
+
+        for field in ('user_id', 'id', 'recipient_id'):
+            value = data.get(field)
+            if value and int(value) != getattr(self, '_' + field):
+                setattr(self, '_' + field, int(value))
+                changed = True
+        return patch_attrs(self, data, ('type',)) or changed
+
     @property
     def user(self) -> User:
         return self._user
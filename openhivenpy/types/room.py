@@ -1,10 +1,11 @@
 import logging
 import sys
 import asyncio
-from typing import Union
+from typing import AsyncIterator, Union
 
 from ._get_type import getType
-from openhivenpy.utils import get
+from ._history import iter_history, resolve_authors
+from openhivenpy.utils import get, patch_attrs
 import openhivenpy.exceptions as errs
 from openhivenpy.gateway.http import HTTP
 
@@ -23,6 +24,9 @@ class Room:
     Returned with house room lists and House.get_room()
     
     """
+    __slots__ = ('_id', '_name', '_house_id', '_position', '_type', '_emoji', '_description', '_last_message_id',
+                 '_house', '_http')
+
     def __init__(self, data: dict, http: HTTP, house):
         # These are all the attribs rooms have for now.
         # Will add more when Phin says they've been updated. Theres no functions. Yet.
@@ -66,6 +70,16 @@ class Room:
         ]
         return str('<Room {}>'.format(' '.join('%s=%s' % t for t in info)))
 
+    def _update(self, data: dict) -> bool:
+        """`openhivenpy.types.Room._update()`
+
+        Patches the object in-place with the passed data. Only the fields that are sent are updated.
+
+        :return: True if data of the room was changed
+        """
+        return patch_attrs(self, data, ('name', 'house_id', 'position', 'type', 'emoji', 'description',
+                                        'last_message_id'))
+
     @property
     def id(self):
         return self._id
@@ -124,20 +138,23 @@ class Room:
                 # Raw_data not in correct format => needs to access data field
                 data = raw_data.get('data')
                 if data:
-                    # Getting the author / self
-                    raw_data = await self._http.request(f"/users/@me")
-                    author_data = raw_data.get('data')
-                    if author_data:
-                        author = getType.user(author_data, self._http)
-                        msg = await getType.a_message(
-                            data=data,
-                            http=self._http,
-                            house=None,
-                            room=self,
-                            author=author)
-                        return msg
-                    else:
-                        raise errs.HTTPReceivedNoData()
+                    # The client user is the author and already known since INIT_STATE
+                    author = self._http.client_user
+                    if author is None:
+                        raw_data = await self._http.request(f"/users/@me")
+                        author_data = raw_data.get('data') if raw_data else None
+                        if author_data:
+                            author = getType.user(author_data, self._http)
+                        else:
+                            raise errs.HTTPReceivedNoData()
+
+                    msg = await getType.a_message(
+                        data=data,
+                        http=self._http,
+                        house=None,
+                        room=self,
+                        author=author)
+                    return msg
                 else:
                     raise errs.HTTPFaultyResponse()
             else:
@@ -211,30 +228,53 @@ class Room:
             data = raw_data.get('data')
 
             if data:
+                authors = await resolve_authors(self._http, data)
                 messages = []
                 for message in data:
-                    _raw_data = await self._http.request(f"/users/{message.get('author_id')}")
-                    if _raw_data:
-                        _author_data = _raw_data.get('data')
-                        if _author_data:
-                            author = await getType.a_user(_author_data, self._http)
-                            msg = await getType.a_message(
-                                data=message,
-                                http=self._http,
-                                house=self.house,
-                                room=self,
-                                author=author)
-                            messages.append(msg)
-                        else:
-                            raise errs.HTTPReceivedNoData()
-                    else:
+                    author = authors.get(message.get('author_id'))
+                    if author is None:
                         raise errs.HTTPReceivedNoData()
 
+                    msg = await getType.a_message(
+                        data=message,
+                        http=self._http,
+                        house=self.house,
+                        room=self,
+                        author=author)
+                    messages.append(msg)
+
                 return messages
             else:
                 raise errs.HTTPReceivedNoData()
     
         except Exception as e:
-            logger.error(f"[ROOM] Failed to create invite for house {self.name} with id {self.id}!" 
+            logger.error(f"[ROOM] Failed to get the recent messages of the room {self.name} with id {self.id}!" 
                          f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
             return None
+
+    def history(self,
+                *,
+                before: int = None,
+                after: int = None,
+                limit: int = None) -> AsyncIterator:
+        """`openhivenpy.types.Room.history()`
+
+        Returns an async iterator over the messages of the room. The pages of the history are requested
+        lazily and the next page is already requested while the current one is processed.
+
+        Example:
+            async for message in room.history(limit=500):
+                ...
+
+        Parameter:
+        ----------
+
+        before: `int` - Only messages older than the message with this id. Defaults to the newest message
+
+        after: `int` - Only messages newer than the message with this id. If passed without before the messages
+                       are returned from the oldest to the newest
+
+        limit: `int` - Maximum amount of returned messages. Defaults to None which means all
+
+        """
+        return iter_history(self, self.house, before=before, after=after, limit=limit)
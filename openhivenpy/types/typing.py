@@ -19,6 +19,8 @@ class Typing:
     Returned with HivenClient.on_typing_start() and HivenClient.on_typing_end()
     
     """
+    __slots__ = ('_author', '_room', '_house', '_author_id', '_house_id', '_room_id', '_timestamp', '_http')
+
     def __init__(self, data: dict, member, room, house, http: HTTP):
         try:
             self._author = member
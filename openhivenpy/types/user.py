@@ -5,6 +5,7 @@ from typing import Union
 
 import openhivenpy.exceptions as errs
 from openhivenpy.gateway.http import HTTP
+from openhivenpy.utils.utils import patch_attrs
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,8 @@ class LazyUser:
     Represents the standard Hiven User
     
     """
+    __slots__ = ('_username', '_name', '_id', '_user_flags', '_icon', '_header', '_bot')
+
     def __init__(self, data: dict):
         try:
             if data.get('user') is not None:
@@ -59,6 +62,17 @@ class LazyUser:
         ]
         return '<User {}>'.format(' '.join('%s=%s' % t for t in info))
 
+    def _update(self, data: dict) -> bool:
+        """`openhivenpy.types.LazyUser._update()`
+
+        Patches the object in-place with the passed data. Only the fields that are sent are updated.
+
+        :return: True if data of the object was changed
+        """
+        if data.get('user') is not None:
+            data = data.get('user')
+        return patch_attrs(self, data, ('username', 'name', 'user_flags', 'icon', 'header', 'bot'))
+
     @property
     def username(self) -> str:
         return self._username
@@ -98,6 +112,8 @@ class User(LazyUser):
     ~~~~~~~~~~
     
     """
+    __slots__ = ('_location', '_website', '_presence', '_joined_at', '_http')
+
     def __init__(self, data: dict, http: HTTP):
         try:
             super().__init__(data) 
@@ -120,6 +136,18 @@ class User(LazyUser):
             raise errs.FaultyInitialization(f"Failed to initialize User object! Possibly faulty data! "
                                             f"> {sys.exc_info()[1].__class__.__name__}, {str(e)}")
 
+    def _update(self, data: dict) -> bool:
+        """`openhivenpy.types.User._update()`
+
+        Patches the object in-place with the passed data. Only the fields that are sent are updated.
+
+        :return: True if data of the object was changed
+        """
+        changed = super()._update(data)
+        if data.get('user') is not None:
+            data = data.get('user')
+        return patch_attrs(self, data, ('location', 'website', 'presence', 'joined_at')) or changed
+
     @property
     def location(self) -> str:
         return self._location
@@ -30,4 +30,5 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from .utils import *
\ No newline at end of file
+from .utils import *
+from .store import *
\ No newline at end of file
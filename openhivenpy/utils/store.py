@@ -0,0 +1,371 @@
+import logging
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['EntityStore']
+
+
+class EntityStore:
+    r"""`openhivenpy.utils.EntityStore`
+
+    Id-Indexed Entity Store
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    Cache container that stores Hiven objects keyed by their id.
+
+    Lookups, upserts and deletions are O(1) while iteration, `len()`, `in` and indexing
+    still behave like the list that was previously used as cache, so the store can directly be
+    returned as read view by `HivenClient.houses`, `HivenClient.users` etc.
+
+    Iterating over the store iterates over a snapshot of the stored objects, which means the
+    store can safely be modified while iterating over it!
+
+    Indexing by position (`store[i]`) is not O(1) like a lookup by key: It uses the same snapshot, which
+    is cached until the store is modified. Accessing positions in a loop is therefore fast while the store
+    is unchanged, but every modification makes the next positional access O(n) again. Use `get()` for
+    the access by key!
+
+    Queries
+    ~~~~~~~
+
+    The store additionally keeps hash indexes on the registered attributes. `utils.get()`
+    recognises the store and passes the query to `find()`, which will use the key or an index if
+    one matches the query and will only fall back to scanning all objects for unindexed attributes.
+
+    If an object gets modified in-place `reindex()` needs to be called to update the indexes!
+
+    """
+    def __init__(self,
+                 entities: Optional[Iterable] = None,
+                 *,
+                 key: str = 'id',
+                 aliases: Optional[Iterable[str]] = None,
+                 indexes: Optional[Iterable[str]] = None):
+        """`openhivenpy.utils.EntityStore.__init__()`
+
+        Object Instance Construction
+
+        :param entities: Objects that should be added to the store on creation
+
+        :param key: Attribute of the objects that is used as key. Nested attributes can be passed with
+                    '__' like in `utils.get()`. Defaults to 'id'
+
+        :param aliases: Attributes that always have the same value as the key and can therefore be
+                        queried like the key. For example 'id' of a Member that is keyed by 'user_id'
+
+        :param indexes: Attributes that should be indexed for queries with `find()` and `utils.get()`
+        """
+        self._key = key
+        self._key_getter = attrgetter(key.replace('__', '.'))
+        self._key_attrs = (key,) + (tuple(aliases) if aliases is not None else ())
+        self._entities = {}
+        # Tuple of the stored objects for iteration and positional access => None if outdated
+        self._snapshot = None
+
+        # Secondary indexes => attribute: {value: {key: None}}
+        # Dicts are used as ordered sets so the insertion order of the store is kept
+        self._index_attrs = tuple(indexes) if indexes is not None else ()
+        self._index_getters = tuple(attrgetter(attr.replace('__', '.')) for attr in self._index_attrs)
+        self._indexes = {attr: {} for attr in self._index_attrs}
+        # Indexed values of every object to be able to remove them after an in-place update
+        self._indexed_values = {}
+        # Cached attrgetters for the attributes used in queries
+        self._getters = {}
+
+        if entities is not None:
+            for entity in entities:
+                self.upsert(entity)
+
+    def __str__(self) -> str:
+        return str(repr(self))
+
+    def __repr__(self) -> str:
+        info = [
+            ('key', self._key),
+            ('indexes', self._index_attrs),
+            ('size', len(self))
+        ]
+        return '<EntityStore {}>'.format(' '.join('%s=%s' % t for t in info))
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __iter__(self) -> Iterator:
+        # Iterating over a snapshot to avoid errors if the store gets modified while iterating
+        return iter(self._values())
+
+    def __contains__(self, entity: Any) -> bool:
+        try:
+            return self._entities.get(self._key_getter(entity)) is entity
+        except AttributeError:
+            return False
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        # List-like access by position => Use get() for the access by key!
+        return self._values()[index]
+
+    def _values(self) -> tuple:
+        """
+        Returns the cached snapshot of the stored objects and creates it if the store was modified
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self._entities.values())
+        return self._snapshot
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def indexes(self) -> tuple:
+        return self._index_attrs
+
+    def key_of(self, entity: Any) -> Any:
+        """`openhivenpy.utils.EntityStore.key_of()`
+
+        Returns the key of the passed object
+        """
+        return self._key_getter(entity)
+
+    def keys(self):
+        """`openhivenpy.utils.EntityStore.keys()`
+
+        Returns a view of all keys that are stored
+        """
+        return self._entities.keys()
+
+    def values(self):
+        """`openhivenpy.utils.EntityStore.values()`
+
+        Returns a view of all objects that are stored
+        """
+        return self._entities.values()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """`openhivenpy.utils.EntityStore.get()`
+
+        Returns the object stored with the passed key or the passed default if it does not exist
+        """
+        return self._entities.get(key, default)
+
+    def upsert(self, entity: Any) -> Any:
+        """`openhivenpy.utils.EntityStore.upsert()`
+
+        Adds the object to the store or replaces the object that is stored with the same key
+
+        :return: The object that was replaced or None if no object was stored with the same key
+        """
+        key = self._key_getter(entity)
+        old = self._entities.get(key)
+        self._entities[key] = entity
+        if old is not entity:
+            self._snapshot = None
+        if self._index_attrs:
+            self._index(key, entity)
+        return old
+
+    def upsert_many(self, entities: Iterable) -> list:
+        """`openhivenpy.utils.EntityStore.upsert_many()`
+
+        Adds or replaces all passed objects. Costs O(k) for k passed objects
+
+        :return: A list of the objects that were replaced
+        """
+        _entities = self._entities
+        _key_getter = self._key_getter
+        _indexed = bool(self._index_attrs)
+
+        replaced = []
+        for entity in entities:
+            key = _key_getter(entity)
+            old = _entities.get(key)
+            _entities[key] = entity
+            if old is not entity:
+                self._snapshot = None
+            if _indexed:
+                self._index(key, entity)
+            if old is not None:
+                replaced.append(old)
+        return replaced
+
+    def reconcile(self,
+                  items: Iterable,
+                  key: Callable[[Any], Any],
+                  create: Callable[[Any], Any],
+                  update: Callable[[Any, Any], bool]) -> Tuple[list, list, list]:
+        """`openhivenpy.utils.EntityStore.reconcile()`
+
+        Synchronises the store with a complete snapshot of the data like a new INIT_STATE. Stored objects
+        are patched in-place so their identity stays the same, objects for new keys are created and objects
+        whose key is missing in the snapshot are removed. Costs O(n + m) for n passed items and m stored
+        objects
+
+        :param items: Data of all objects that should be stored afterwards
+
+        :param key: Returns the key of the passed data
+
+        :param create: Creates the object for the passed data
+
+        :param update: Patches the passed object with the passed data and returns True if it was changed
+
+        :return: Tuple of the added, the changed and the removed objects
+        """
+        _entities = self._entities
+        _indexed = bool(self._index_attrs)
+
+        added, changed = [], []
+        seen = set()
+        for data in items:
+            _key = key(data)
+            seen.add(_key)
+            entity = _entities.get(_key)
+            if entity is None:
+                entity = create(data)
+                self.upsert(entity)
+                added.append(entity)
+            elif update(entity, data):
+                if _indexed:
+                    self._index(_key, entity)
+                changed.append(entity)
+
+        removed = [self.delete(_key) for _key in [_key for _key in _entities if _key not in seen]]
+        return added, changed, removed
+
+    def delete(self, key: Any) -> Any:
+        """`openhivenpy.utils.EntityStore.delete()`
+
+        Removes the object stored with the passed key
+
+        :return: The removed object or None if no object was stored with the key
+        """
+        entity = self._entities.pop(key, None)
+        if entity is not None:
+            self._snapshot = None
+            if self._index_attrs:
+                self._unindex(key)
+        return entity
+
+    def reindex(self, entity: Any) -> None:
+        """`openhivenpy.utils.EntityStore.reindex()`
+
+        Updates the indexes of an object that was modified in-place
+        """
+        key = self._key_getter(entity)
+        if self._index_attrs and self._entities.get(key) is entity:
+            self._index(key, entity)
+
+    def clear(self) -> None:
+        """`openhivenpy.utils.EntityStore.clear()`
+
+        Removes all objects from the store
+        """
+        self._entities.clear()
+        self._snapshot = None
+        self._indexed_values.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    def find(self, **attrs) -> Any:
+        """`openhivenpy.utils.EntityStore.find()`
+
+        Returns the first object where all passed attributes align. Uses the key or an index if one
+        matches the query and only scans all objects if none of the attributes is indexed.
+
+        :param attrs: Kwargs parameter that should align with the object. Nested attributes can be passed
+                      with '__' like in `utils.get()`
+
+        :return: The object if it's found else None
+        """
+        if not attrs:
+            return next(iter(self._entities.values()), None)
+
+        try:
+            key_attr = next((attr for attr in attrs if attr in self._key_attrs), None)
+            if key_attr is not None:
+                entity = self._entities.get(attrs[key_attr])
+                candidates = (entity,) if entity is not None else ()
+            else:
+                attr = next((attr for attr in attrs if attr in self._indexes), None)
+                if attr is not None:
+                    keys = self._indexes[attr].get(attrs[attr], ())
+                    candidates = tuple(self._entities[key] for key in keys)
+                else:
+                    candidates = None
+        except TypeError:
+            # Unhashable value => Needs to be compared by scanning
+            candidates = None
+
+        if candidates is None:
+            candidates = self._entities.values()
+
+        converted = [(self._getter(attr), value) for attr, value in attrs.items()]
+        for entity in candidates:
+            if all(pred(entity) == value for pred, value in converted):
+                return entity
+        return None
+
+    def _getter(self, attr: str) -> attrgetter:
+        """
+        Returns the cached attrgetter for the passed attribute
+        """
+        getter = self._getters.get(attr)
+        if getter is None:
+            getter = self._getters[attr] = attrgetter(attr.replace('__', '.'))
+        return getter
+
+    def _index(self, key: Any, entity: Any) -> None:
+        """
+        Adds the current values of the object to the indexes and removes the previously indexed ones
+        """
+        if key in self._indexed_values:
+            self._unindex(key)
+
+        values = []
+        for attr, getter in zip(self._index_attrs, self._index_getters):
+            try:
+                value = getter(entity)
+                if value is not None:
+                    self._indexes[attr].setdefault(value, {})[key] = None
+            except (AttributeError, TypeError):
+                # Attribute does not exist or the value is not hashable
+                value = None
+            values.append(value)
+        self._indexed_values[key] = tuple(values)
+
+    def _unindex(self, key: Any) -> None:
+        """
+        Removes the indexed values of the object with the passed key from the indexes
+        """
+        values = self._indexed_values.pop(key, None)
+        if values is None:
+            return
+
+        for attr, value in zip(self._index_attrs, values):
+            if value is None:
+                continue
+            index = self._indexes[attr]
+            keys = index.get(value)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del index[value]
+
+    # List compatibility
+    # ------------------
+    def append(self, entity: Any) -> None:
+        """`openhivenpy.utils.EntityStore.append()`
+
+        Alias for upsert() to stay compatible with code that used the previous list caches
+        """
+        self.upsert(entity)
+
+    def remove(self, entity: Any) -> None:
+        """`openhivenpy.utils.EntityStore.remove()`
+
+        Removes the passed object. Raises `ValueError` if the object is not in the store like list.remove()
+        """
+        if entity not in self:
+            raise ValueError(f"{repr(entity)} is not in the store!")
+        self.delete(self._key_getter(entity))
@@ -2,7 +2,9 @@ import logging
 from operator import attrgetter
 from functools import lru_cache
 import inspect
-from typing import Optional, Union, Any
+from typing import Optional, Union, Any, Iterable
+
+from .store import EntityStore
 
 # This is a surprise tool that will help us later
 
@@ -66,17 +68,50 @@ def raise_value_to_type(val: Any, data_type: type) -> Any:
         return val
 
 
+def patch_attrs(obj: object, data: dict, fields: Iterable[str]) -> bool:
+    r"""`openhivenpy.utils.patch_attrs()`
+
+    Patches the private attributes of an object in-place with the passed data. Only fields that
+    exist in the data and differ from the current value are set, so the object identity stays the
+    same and unchanged fields are not touched.
+
+    :param obj: Object that should be patched
+
+    :param data: Received data of the object
+
+    :param fields: Names of the fields in the data. The value will be set as '_<field>' on the object
+
+    :return: True if at least one attribute was changed else False
+
+    """
+    changed = False
+    for field in fields:
+        if field in data:
+            value = data[field]
+            attr = '_' + field
+            if getattr(obj, attr, None) != value:
+                setattr(obj, attr, value)
+                changed = True
+    return changed
+
+
 def get(iterable, **attrs) -> Any:
     r"""
 
     Fetches an object in the passed iterable if the passed attribute align!
 
+    If the iterable is an `EntityStore` the query will use its key and indexes if they match the
+    passed attributes and will only scan the objects for unindexed attributes
+
     :param iterable: Object that should be used to search for the attrs
 
     :param attrs: Kwargs parameter that should align with the object
 
     :return: The object if it's found else None
     """
+    if isinstance(iterable, EntityStore):
+        return iterable.find(**attrs)
+
     _all = all
 
     # There is only one element in the dict attrs